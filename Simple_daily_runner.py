@@ -5,10 +5,12 @@
 # Or schedule with cron/Task Scheduler
 
 
-from advanced_trading_bot import run_momentum_bot
-
 # Run once daily at 10 AM ET
 if __name__ == "__main__":
+    # Imported here so loading this module stays cheap; the bot pulls in numpy,
+    # numba and the Alpaca client
+    from advanced_trading_bot import run_momentum_bot
+    
     print("Daily momentum trading run...")
     run_momentum_bot()
 
@@ -6,13 +6,17 @@ Advanced trading bot with multiple strategies and risk management
 from alpaca_trading_client import *
 from alpaca_config import get_client
 from equity_tracker import load_today_start_equity, save_today_start_equity
+from indicator_state import load_indicator_state, save_indicator_state
+from bar_cache import is_completed_bar, load_cached_bars, store_bars
 from trading_strategies_config import *
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
 import json
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 
 # Centralized logging setup via TradingLoggers
@@ -21,6 +25,210 @@ from logging_config import trading_loggers
 # Use the centralized 'trading_bot' logger (writes to logs/trading_bot.log)
 logger = trading_loggers.get_logger('trading_bot')
 
+# Optional JIT compilation for numeric kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Simple moving average periods maintained incrementally per symbol
+SMA_PERIODS = (5, 10, 20, 50)
+
+# Upper bound on concurrent symbol evaluations (each is an HTTP bars fetch)
+MAX_SCAN_WORKERS = 8
+
+# Daily bars used for indicators, and the calendar-day lookback that covers them
+BARS_LIMIT = 50
+BARS_LOOKBACK_DAYS = 90
+
+# Storage dtype for the stacked watchlist bars; daily OHLCV needs ~6 significant
+# digits, and single precision halves the batch kernel's working set
+BATCH_DTYPE = np.float32
+
+# How long account and market-clock snapshots are reused (seconds)
+ACCOUNT_CACHE_TTL = 30
+MARKET_OPEN_CACHE_TTL = 60
+
+
+# Momentum score lookup tables. Price and volume components score values
+# strictly above each threshold; RSI bands are closed on the left, and the
+# 50-70 band also includes 70, hence the nextafter upper edge.
+_CHANGE_1D_THR = np.array([0.0, 2.0])
+_CHANGE_1D_VAL = np.array([0, 10, 20])
+_CHANGE_5D_THR = np.array([0.0, 5.0])
+_CHANGE_5D_VAL = np.array([0, 10, 20])
+_VOLUME_THR = np.array([1.0, 1.5, 2.0])
+_VOLUME_VAL = np.array([0, 10, 20, 30])
+_RSI_THR = np.array([30.0, 40.0, 50.0, np.nextafter(70.0, np.inf)])
+_RSI_VAL = np.array([0, 10, 20, 30, 0])
+
+
+def _momentum_scores(change_1d, change_5d, volume_ratio, rsi):
+    """Momentum score (0-100) via threshold table lookups
+    
+    Price momentum is worth up to 40, volume confirmation 30 and RSI 30.
+    Accepts scalars or equal-length arrays so a whole watchlist can be
+    scored in one call.
+    """
+    return (_CHANGE_1D_VAL[np.searchsorted(_CHANGE_1D_THR, change_1d, side='left')]
+            + _CHANGE_5D_VAL[np.searchsorted(_CHANGE_5D_THR, change_5d, side='left')]
+            + _VOLUME_VAL[np.searchsorted(_VOLUME_THR, volume_ratio, side='left')]
+            + _RSI_VAL[np.searchsorted(_RSI_THR, rsi, side='right')])
+
+
+def _batch_indicators(close: np.ndarray, volume: np.ndarray,
+                      high: np.ndarray, low: np.ndarray) -> Dict[str, np.ndarray]:
+    """Vectorized indicators for N symbols sharing the same bar count
+    
+    Each input has shape (N, n). Every output is a length-N array and matches
+    what get_enhanced_market_data computes for a single symbol (SMAs excepted,
+    which come from the per-symbol rolling state).
+    """
+    n = close.shape[1]
+    current = close[:, -1]
+    
+    # RSI (14)
+    if n >= 15:
+        deltas = np.diff(close[:, -15:], axis=1)
+        avg_gain = np.maximum(deltas, 0.0).mean(axis=1)
+        avg_loss = -np.minimum(deltas, 0.0).mean(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    else:
+        rsi = np.full(close.shape[0], 50.0)
+    
+    # Bollinger Bands (20, 2)
+    if n >= 20:
+        window = close[:, -20:]
+        bb_middle = window.mean(axis=1)
+        band = 2.0 * window.std(axis=1)
+        bb_upper, bb_lower = bb_middle + band, bb_middle - band
+    else:
+        bb_upper = bb_middle = bb_lower = current
+    
+    # Price changes
+    zeros = np.zeros(close.shape[0])
+    change_1d = (current - close[:, -2]) / close[:, -2] * 100 if n >= 2 else zeros
+    change_5d = (current - close[:, -6]) / close[:, -6] * 100 if n >= 6 else zeros
+    change_20d = (current - close[:, -21]) / close[:, -21] * 100 if n >= 21 else zeros
+    
+    # Volume analysis
+    avg_volume_20 = volume[:, -20:].mean(axis=1) if n >= 20 else volume[:, -1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        volume_ratio = np.where(avg_volume_20 > 0, volume[:, -1] / avg_volume_20, 1.0)
+    
+    # Volatility (root-mean-square of the last 19 daily returns)
+    if n >= 20:
+        window = close[:, -20:]
+        returns = np.diff(window, axis=1) / window[:, :-1]
+        volatility = np.sqrt(np.mean(returns ** 2, axis=1)) * 100
+    else:
+        volatility = zeros
+    
+    # Support/resistance and position in range
+    recent_high = high[:, -20:].max(axis=1) if n >= 20 else current
+    recent_low = low[:, -20:].min(axis=1) if n >= 20 else current
+    price_range = recent_high - recent_low
+    with np.errstate(divide='ignore', invalid='ignore'):
+        position_in_range = np.where(price_range > 0, (current - recent_low) / price_range, 0.5)
+    
+    # Trend strength (linear regression slope normalized by range per bar)
+    if n >= 10:
+        # The regression sums cancel heavily, so they are accumulated in double precision
+        x = np.arange(n, dtype=np.float64)
+        sum_x, sum_x2 = x.sum(), (x * x).sum()
+        close64 = close.astype(np.float64)
+        slope = (n * (close64 @ x) - sum_x * close64.sum(axis=1)) / (n * sum_x2 - sum_x ** 2)
+        max_price_change = (close.max(axis=1) - close.min(axis=1)) / n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized = np.clip((slope / max_price_change + 1.0) / 2.0, 0.0, 1.0)
+        trend_strength = np.where(max_price_change == 0, 0.5, normalized)
+    else:
+        trend_strength = np.full(close.shape[0], 0.5)
+    
+    return {
+        'current_price': current,
+        'volume_ratio': volume_ratio,
+        'rsi': rsi,
+        'bb_upper': bb_upper,
+        'bb_middle': bb_middle,
+        'bb_lower': bb_lower,
+        'price_change_1d': change_1d,
+        'price_change_5d': change_5d,
+        'price_change_20d': change_20d,
+        'volatility': volatility,
+        'recent_high': recent_high,
+        'recent_low': recent_low,
+        'position_in_range': position_in_range,
+        'trend_strength': trend_strength,
+        'momentum_score': _momentum_scores(change_1d, change_5d, volume_ratio, rsi),
+    }
+
+
+@njit(cache=True, fastmath=True)
+def _trend_strength_kernel(prices: np.ndarray) -> float:
+    """Single-pass linear regression trend strength (0-1 scale)"""
+    n = prices.shape[0]
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_xy = 0.0
+    sum_x2 = 0.0
+    p_max = prices[0]
+    p_min = prices[0]
+    for i in range(n):
+        p = prices[i]
+        sum_x += i
+        sum_y += p
+        sum_xy += i * p
+        sum_x2 += i * i
+        if p > p_max:
+            p_max = p
+        if p < p_min:
+            p_min = p
+    
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+    
+    max_price_change = (p_max - p_min) / n
+    if max_price_change == 0:
+        return 0.5
+    
+    normalized_slope = slope / max_price_change
+    return max(0.0, min(1.0, (normalized_slope + 1.0) / 2.0))
+
+
+def _trend_strength_array(prices: np.ndarray) -> float:
+    """Array-math trend strength (0-1 scale), used when numba is not installed"""
+    n = prices.shape[0]
+    x = np.arange(n, dtype=np.float64)
+    sum_x = float(x.sum())
+    sum_x2 = float(np.dot(x, x))
+    slope = (n * float(np.dot(x, prices)) - sum_x * float(prices.sum())) / (n * sum_x2 - sum_x * sum_x)
+    
+    max_price_change = float(prices.max() - prices.min()) / n
+    if max_price_change == 0:
+        return 0.5
+    
+    normalized_slope = slope / max_price_change
+    return max(0.0, min(1.0, (normalized_slope + 1.0) / 2.0))
+
+
+# Prefer the ahead-of-time compiled kernel (see build_kernels.py) so no JIT
+# compile runs at startup. Without numba the kernel's loop would run as plain
+# Python, so fall back to array math.
+try:
+    from tradebot_kernels import trend_strength as _trend_strength
+    KERNELS_PRECOMPILED = True
+except ImportError:
+    KERNELS_PRECOMPILED = False
+    _trend_strength = _trend_strength_kernel if NUMBA_AVAILABLE else _trend_strength_array
+
 class AdvancedTradingBot:
     """
     Advanced trading bot with multiple strategies and comprehensive risk management
@@ -28,9 +236,11 @@ class AdvancedTradingBot:
     
     def __init__(self, mode: TradingMode = TradingMode.PAPER, 
                  strategy: TradingStrategy = TradingStrategy.MOMENTUM,
-                 risk_level: str = "moderate"):
+                 risk_level: str = "moderate",
+                 client: Optional[AlpacaTradingClient] = None):
         
-        self.client = get_client(mode)
+        # Bots run side by side (e.g. by the scheduler) can share one client
+        self.client = client if client is not None else get_client(mode)
         self.mode = mode
         self.strategy = strategy
         self.risk_level = risk_level
@@ -48,95 +258,199 @@ class AdvancedTradingBot:
         self.start_of_day_equity: Optional[float] = None
         self.positions_tracking = {}
         
+        # Short-lived (timestamp, value) snapshots of slow-changing REST state
+        self._account_cache: Optional[Tuple[float, Dict]] = None
+        self._market_open_cache: Optional[Tuple[float, bool]] = None
+        
+        # Rolling SMA windows: symbol -> {"t": last bar time, "windows": {period: [deque, sum]}}
+        self._sma_state: Dict[str, Dict] = self._load_sma_state()
+        
+        # Compile JIT kernels up front so the first scan doesn't pay for it
+        if NUMBA_AVAILABLE and not KERNELS_PRECOMPILED:
+            _trend_strength_kernel(np.arange(10, dtype=np.float64))
+        
         logger.info(f"Initialized AdvancedTradingBot:")
         logger.info(f"  Mode: {mode.value}")
         logger.info(f"  Strategy: {strategy.value}")
         logger.info(f"  Risk Level: {risk_level}")
         logger.info(f"  Watchlist: {len(self.watchlist)} symbols")
     
-    def calculate_rsi(self, prices: List[float], period: int = 14) -> float:
-        """Calculate RSI (Relative Strength Index)"""
+    def get_account_cached(self, ttl: float = ACCOUNT_CACHE_TTL) -> Dict:
+        """Return the account snapshot, refetching only when older than ttl seconds"""
+        now = time.time()
+        if self._account_cache is not None and now - self._account_cache[0] < ttl:
+            return self._account_cache[1]
+        account = self.client.get_account()
+        self._account_cache = (now, account)
+        return account
+    
+    def is_market_open_cached(self, ttl: float = MARKET_OPEN_CACHE_TTL) -> bool:
+        """Return market open status, refetching only when older than ttl seconds"""
+        now = time.time()
+        if self._market_open_cache is not None and now - self._market_open_cache[0] < ttl:
+            return self._market_open_cache[1]
+        is_open = self.client.is_market_open()
+        self._market_open_cache = (now, is_open)
+        return is_open
+    
+    def calculate_rsi(self, prices, period: int = 14) -> float:
+        """Calculate RSI (Relative Strength Index)
+
+        Accepts either a list of prices or a NumPy array.
+        """
         if len(prices) < period + 1:
             return 50  # Neutral RSI if insufficient data
         
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [delta if delta > 0 else 0 for delta in deltas]
-        losses = [-delta if delta < 0 else 0 for delta in deltas]
-        
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
+        deltas = np.diff(np.asarray(prices, dtype=np.float64))[-period:]
+        avg_gain = np.maximum(deltas, 0.0).mean()
+        avg_loss = -np.minimum(deltas, 0.0).mean()
         
         if avg_loss == 0:
             return 100
         
         rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        rsi = 100.0 - 100.0 / (1.0 + rs)
+        return float(rsi)
     
-    def calculate_bollinger_bands(self, prices: List[float], period: int = 20, std: float = 2.0) -> Tuple[float, float, float]:
-        """Calculate Bollinger Bands (upper, middle, lower)"""
+    def calculate_bollinger_bands(self, prices, period: int = 20, std: float = 2.0) -> Tuple[float, float, float]:
+        """Calculate Bollinger Bands (upper, middle, lower)
+
+        Accepts either a list of prices or a NumPy array.
+        """
         if len(prices) < period:
-            current_price = prices[-1]
+            current_price = float(prices[-1])
             return current_price, current_price, current_price
         
-        recent_prices = prices[-period:]
-        middle = sum(recent_prices) / len(recent_prices)  # SMA
-        
-        variance = sum((p - middle) ** 2 for p in recent_prices) / len(recent_prices)
-        std_dev = variance ** 0.5
+        window = np.asarray(prices, dtype=np.float64)[-period:]
+        middle = float(window.mean())  # SMA
+        std_dev = float(window.std())  # Population std (ddof=0)
         
         upper = middle + (std * std_dev)
         lower = middle - (std * std_dev)
         
         return upper, middle, lower
     
-    def get_enhanced_market_data(self, symbol: str) -> Dict:
-        """Get comprehensive market data and technical indicators"""
+    def _load_sma_state(self) -> Dict[str, Dict]:
+        """Rebuild rolling SMA deques and running sums from persisted state"""
+        state = {}
+        for symbol, entry in load_indicator_state().items():
+            try:
+                windows = {}
+                for period, values in entry['windows'].items():
+                    dq = deque((float(v) for v in values), maxlen=int(period))
+                    windows[int(period)] = [dq, sum(dq)]
+                state[symbol] = {'t': entry['t'], 'windows': windows}
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+        return state
+    
+    def _save_sma_state(self) -> None:
+        """Persist rolling SMA windows for the next run"""
+        save_indicator_state({
+            symbol: {
+                't': entry['t'],
+                'windows': {str(period): list(dq) for period, (dq, _) in entry['windows'].items()}
+            }
+            for symbol, entry in self._sma_state.items()
+        })
+    
+    def _rolling_smas(self, symbol: str, close: np.ndarray, bar_times: List) -> Dict[int, float]:
+        """Return SMAs for SMA_PERIODS, updating running sums in O(1) when possible
+        
+        Re-scans of the same bar replace its close; on the next consecutive bar
+        the previous bar's close is first settled to its final value (it was
+        stored mid-session) and the new bar is added while the oldest drops
+        out. Anything else rebuilds from ``close``.
+        """
+        current_price = float(close[-1])
+        last_time = bar_times[-1] if bar_times else None
+        prev_time = bar_times[-2] if len(bar_times) >= 2 else None
+        state = self._sma_state.get(symbol)
+        
+        if state and last_time is not None and state['t'] == last_time:
+            for window in state['windows'].values():
+                dq = window[0]
+                window[1] += current_price - dq[-1]
+                dq[-1] = current_price
+        elif state and prev_time is not None and state['t'] == prev_time:
+            prev_close = float(close[-2])
+            for window in state['windows'].values():
+                dq = window[0]
+                window[1] += prev_close - dq[-1]
+                dq[-1] = prev_close
+                if len(dq) == dq.maxlen:
+                    window[1] -= dq[0]
+                dq.append(current_price)
+                window[1] += current_price
+            state['t'] = last_time
+        else:
+            windows = {}
+            for period in SMA_PERIODS:
+                dq = deque(close[-period:].tolist(), maxlen=period)
+                windows[period] = [dq, float(close[-period:].sum())]
+            state = {'t': last_time, 'windows': windows}
+            if last_time is not None:
+                self._sma_state[symbol] = state
+        
+        return {
+            period: (total / period if len(dq) == period else current_price)
+            for period, (dq, total) in state['windows'].items()
+        }
+    
+    def get_enhanced_market_data(self, symbol: str, bars_data: Optional[List[Dict]] = None) -> Dict:
+        """Get comprehensive market data and technical indicators
+        
+        Args:
+            symbol: Stock symbol
+            bars_data: Pre-fetched daily bars for the symbol; fetched when None
+        """
         try:
             # Get historical data
-            bars = self.client.get_bars(symbol, timeframe="1Day", limit=50)
+            if bars_data is None:
+                bars = self.client.get_bars(symbol, timeframe="1Day", limit=BARS_LIMIT)
+                bars_data = bars['bars'][symbol]
             
-            if not bars['bars'][symbol]:
+            if not bars_data:
                 return {"error": f"No data available for {symbol}"}
             
-            # Extract price and volume data
-            bars_data = bars['bars'][symbol]
-            prices = [float(bar['c']) for bar in bars_data]
-            volumes = [int(bar['v']) for bar in bars_data]
-            highs = [float(bar['h']) for bar in bars_data]
-            lows = [float(bar['l']) for bar in bars_data]
+            # Extract close/volume/high/low into a single (n, 4) array
+            ohlv = np.array(
+                [[bar['c'], bar['v'], bar['h'], bar['l']] for bar in bars_data],
+                dtype=np.float64
+            )
+            close, volume, high, low = ohlv[:, 0], ohlv[:, 1], ohlv[:, 2], ohlv[:, 3]
+            n = len(close)
             
-            current_price = prices[-1]
+            current_price = float(close[-1])
             
             # Technical indicators
-            rsi = self.calculate_rsi(prices)
-            bb_upper, bb_middle, bb_lower = self.calculate_bollinger_bands(prices)
+            rsi = self.calculate_rsi(close)
+            bb_upper, bb_middle, bb_lower = self.calculate_bollinger_bands(close)
             
-            # Moving averages
-            sma_5 = sum(prices[-5:]) / 5 if len(prices) >= 5 else current_price
-            sma_10 = sum(prices[-10:]) / 10 if len(prices) >= 10 else current_price
-            sma_20 = sum(prices[-20:]) / 20 if len(prices) >= 20 else current_price
-            sma_50 = sum(prices[-50:]) / 50 if len(prices) >= 50 else current_price
+            # Moving averages (incremental per-symbol running sums)
+            smas = self._rolling_smas(symbol, close, [bar.get('t') for bar in bars_data[-2:]])
+            sma_5, sma_10, sma_20, sma_50 = (smas[period] for period in SMA_PERIODS)
             
             # Price changes
-            price_change_1d = ((prices[-1] - prices[-2]) / prices[-2]) * 100 if len(prices) >= 2 else 0
-            price_change_5d = ((prices[-1] - prices[-6]) / prices[-6]) * 100 if len(prices) >= 6 else 0
-            price_change_20d = ((prices[-1] - prices[-21]) / prices[-21]) * 100 if len(prices) >= 21 else 0
+            price_change_1d = float((close[-1] - close[-2]) / close[-2] * 100) if n >= 2 else 0
+            price_change_5d = float((close[-1] - close[-6]) / close[-6] * 100) if n >= 6 else 0
+            price_change_20d = float((close[-1] - close[-21]) / close[-21] * 100) if n >= 21 else 0
             
             # Volume analysis
-            avg_volume_20 = sum(volumes[-20:]) / 20 if len(volumes) >= 20 else volumes[-1]
-            volume_ratio = volumes[-1] / avg_volume_20 if avg_volume_20 > 0 else 1
+            avg_volume_20 = float(volume[-20:].mean()) if n >= 20 else float(volume[-1])
+            volume_ratio = float(volume[-1]) / avg_volume_20 if avg_volume_20 > 0 else 1
             
-            # Volatility (standard deviation of recent returns)
-            if len(prices) >= 20:
-                returns = [(prices[i] - prices[i-1]) / prices[i-1] for i in range(-19, 0)]
-                volatility = (sum(r**2 for r in returns) / len(returns)) ** 0.5 * 100
+            # Volatility (root-mean-square of the last 19 daily returns)
+            if n >= 20:
+                window = close[-20:]
+                returns = np.diff(window) / window[:-1]
+                volatility = float(np.sqrt(np.mean(returns ** 2)) * 100)
             else:
                 volatility = 0
             
             # Support and resistance
-            recent_high = max(highs[-20:]) if len(highs) >= 20 else current_price
-            recent_low = min(lows[-20:]) if len(lows) >= 20 else current_price
+            recent_high = float(high[-20:].max()) if n >= 20 else current_price
+            recent_low = float(low[-20:].min()) if n >= 20 else current_price
             
             # Price position in range
             price_range = recent_high - recent_low
@@ -161,7 +475,7 @@ class AdvancedTradingBot:
                 'recent_high': recent_high,
                 'recent_low': recent_low,
                 'position_in_range': position_in_range,
-                'trend_strength': self._calculate_trend_strength(prices),
+                'trend_strength': self._calculate_trend_strength(close),
                 'momentum_score': self._calculate_momentum_score(price_change_1d, price_change_5d, volume_ratio, rsi)
             }
             
@@ -169,67 +483,68 @@ class AdvancedTradingBot:
             logger.error(f"Error getting market data for {symbol}: {e}")
             return {"error": str(e)}
     
-    def _calculate_trend_strength(self, prices: List[float]) -> float:
-        """Calculate trend strength (0-1 scale)"""
-        if len(prices) < 10:
-            return 0.5
+    def get_watchlist_market_data(self, bars_by_symbol: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+        """Compute market data for many symbols with one vectorized pass per bar count
         
-        # Linear regression to determine trend
-        x = list(range(len(prices)))
-        n = len(prices)
+        Symbols with the same number of bars (normally the whole watchlist) are
+        stacked into (N, n) matrices and scored together; any group that fails
+        falls back to get_enhanced_market_data per symbol.
         
-        sum_x = sum(x)
-        sum_y = sum(prices)
-        sum_xy = sum(x[i] * prices[i] for i in range(n))
-        sum_x2 = sum(xi ** 2 for xi in x)
-        
-        # Calculate slope
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
+        Args:
+            bars_by_symbol: Pre-fetched daily bars keyed by symbol
+            
+        Returns:
+            Dict mapping each symbol to the same structure get_enhanced_market_data returns
+        """
+        results: Dict[str, Dict] = {}
+        groups: Dict[int, List[str]] = {}
+        for symbol, bars_data in bars_by_symbol.items():
+            if not bars_data:
+                results[symbol] = {"error": f"No data available for {symbol}"}
+            else:
+                groups.setdefault(len(bars_data), []).append(symbol)
         
-        # Normalize slope to 0-1 scale
-        max_price_change = (max(prices) - min(prices)) / len(prices)
-        if max_price_change == 0:
+        for symbols in groups.values():
+            try:
+                ohlv = np.array(
+                    [[[bar['c'], bar['v'], bar['h'], bar['l']] for bar in bars_by_symbol[symbol]]
+                     for symbol in symbols],
+                    dtype=BATCH_DTYPE
+                )
+                close = ohlv[:, :, 0]
+                indicators = _batch_indicators(close, ohlv[:, :, 1], ohlv[:, :, 2], ohlv[:, :, 3])
+            except Exception as e:
+                logger.warning(f"Batch indicator pass failed, computing per symbol: {e}")
+                for symbol in symbols:
+                    results[symbol] = self.get_enhanced_market_data(symbol, bars_by_symbol[symbol])
+                continue
+            
+            for row, symbol in enumerate(symbols):
+                bars_data = bars_by_symbol[symbol]
+                smas = self._rolling_smas(symbol, close[row].astype(np.float64),
+                                          [bar.get('t') for bar in bars_data[-2:]])
+                data = {'symbol': symbol}
+                data.update({name: float(values[row]) for name, values in indicators.items()})
+                # Orders are priced off current_price, so take it exactly from the bar
+                data['current_price'] = float(bars_data[-1]['c'])
+                data.update({f'sma_{period}': smas[period] for period in SMA_PERIODS})
+                data['momentum_score'] = int(indicators['momentum_score'][row])
+                results[symbol] = data
+        
+        return results
+    
+    def _calculate_trend_strength(self, prices) -> float:
+        """Calculate trend strength (0-1 scale)"""
+        if len(prices) < 10:
             return 0.5
         
-        normalized_slope = slope / max_price_change
-        trend_strength = max(0, min(1, (normalized_slope + 1) / 2))
-        
-        return trend_strength
+        # Linear regression slope, normalized by the price range per bar
+        return float(_trend_strength(np.asarray(prices, dtype=np.float64)))
     
     def _calculate_momentum_score(self, change_1d: float, change_5d: float, 
                                  volume_ratio: float, rsi: float) -> float:
         """Calculate momentum score (0-100)"""
-        # Price momentum component (40%)
-        price_score = 0
-        if change_1d > 2:
-            price_score += 20
-        elif change_1d > 0:
-            price_score += 10
-        
-        if change_5d > 5:
-            price_score += 20
-        elif change_5d > 0:
-            price_score += 10
-        
-        # Volume confirmation (30%)
-        volume_score = 0
-        if volume_ratio > 2:
-            volume_score = 30
-        elif volume_ratio > 1.5:
-            volume_score = 20
-        elif volume_ratio > 1:
-            volume_score = 10
-        
-        # RSI momentum (30%)
-        rsi_score = 0
-        if 50 <= rsi <= 70:  # Strong but not overbought
-            rsi_score = 30
-        elif 40 <= rsi < 50:
-            rsi_score = 20
-        elif 30 <= rsi < 40:
-            rsi_score = 10
-        
-        return price_score + volume_score + rsi_score
+        return int(_momentum_scores(change_1d, change_5d, volume_ratio, rsi))
     
     def apply_momentum_strategy(self, data: Dict) -> Dict:
         """Apply momentum trading strategy"""
@@ -324,20 +639,36 @@ class AdvancedTradingBot:
             "score": len(signals) - len(warnings)
         }
     
-    def evaluate_symbol(self, symbol: str) -> Dict:
-        """Evaluate a symbol for trading opportunity"""
+    def evaluate_symbol(self, symbol: str, bars_data: Optional[List[Dict]] = None,
+                        held_symbols: Optional[set] = None,
+                        market_data: Optional[Dict] = None) -> Dict:
+        """Evaluate a symbol for trading opportunity
+        
+        Args:
+            symbol: Stock symbol
+            bars_data: Pre-fetched daily bars for the symbol; fetched when None
+            held_symbols: Symbols with open positions; probed per symbol when None
+            market_data: Pre-computed market data; skips indicator calculation
+        """
         # Get market data
-        data = self.get_enhanced_market_data(symbol)
+        if market_data is not None:
+            data = market_data
+        else:
+            data = self.get_enhanced_market_data(symbol, bars_data)
         
         if "error" in data:
             return {"action": "error", "reason": data["error"]}
         
         # Check if we already have a position
-        try:
-            position = self.client.get_position(symbol)
-            return {"action": "skip", "reason": f"Already have position in {symbol}"}
-        except:
-            pass  # No position, continue
+        if held_symbols is not None:
+            if symbol in held_symbols:
+                return {"action": "skip", "reason": f"Already have position in {symbol}"}
+        else:
+            try:
+                position = self.client.get_position(symbol)
+                return {"action": "skip", "reason": f"Already have position in {symbol}"}
+            except:
+                pass  # No position, continue
         
         # Apply strategy
         if self.strategy == TradingStrategy.MOMENTUM:
@@ -356,7 +687,7 @@ class AdvancedTradingBot:
     
     def calculate_position_size(self, symbol: str, price: float, action: str = "buy") -> int:
         """Calculate position size with advanced risk management"""
-        account = self.client.get_account()
+        account = self.get_account_cached()
         portfolio_value = float(account['portfolio_value'])
         
         # Base position size from risk level
@@ -430,6 +761,9 @@ class AdvancedTradingBot:
             stop_order = {"stop_price": stop_loss_price}
             profit_order = {"limit_price": take_profit_price}
             
+            # Cash and buying power changed; drop the cached account snapshot
+            self._account_cache = None
+            
             # Track the trade
             self.daily_trades += 1
             self.positions_tracking[symbol] = {
@@ -456,12 +790,56 @@ class AdvancedTradingBot:
             logger.error(f"Failed to execute trade for {symbol}: {e}")
             return {"status": "error", "message": str(e)}
     
-    def scan_and_trade(self) -> List[Dict]:
-        """Scan watchlist and execute trades"""
+    def fetch_watchlist_bars(self, symbols: List[str]) -> Optional[Dict[str, List[Dict]]]:
+        """Fetch daily bars for all symbols in batched requests
+        
+        Completed bars cached on disk for today are reused, so cached symbols
+        only request today's still-forming bar while missing symbols get the
+        full lookback. Returns None if a batched request fails so callers can
+        fall back to per-symbol fetches.
+        """
+        if not symbols:
+            return {}
+        all_bars = load_cached_bars(symbols)
+        missing = [symbol for symbol in symbols if symbol not in all_bars]
+        cached = [symbol for symbol in symbols if symbol in all_bars]
+        
+        now = datetime.now()
+        try:
+            fetched = {}
+            if missing:
+                start = (now - timedelta(days=BARS_LOOKBACK_DAYS)).strftime('%Y-%m-%d')
+                fetched = self.client.get_bars_multi(missing, timeframe="1Day", start=start, limit=BARS_LIMIT)
+            latest = {}
+            if cached:
+                latest = self.client.get_bars_multi(cached, timeframe="1Day", start=now.strftime('%Y-%m-%d'), limit=BARS_LIMIT)
+        except Exception as e:
+            logger.warning(f"Batched bars request failed, falling back to per-symbol fetch: {e}")
+            return None
+        
+        if cached:
+            logger.info(f"Using cached completed bars for {len(cached)} of {len(symbols)} symbols")
+        for symbol, bars in latest.items():
+            if symbol in all_bars:
+                todays = [bar for bar in bars if not is_completed_bar(bar)]
+                all_bars[symbol] = (all_bars[symbol] + todays)[-BARS_LIMIT:]
+        
+        store_bars({symbol: bars for symbol, bars in fetched.items() if bars})
+        all_bars.update(fetched)
+        return all_bars
+    
+    def scan_and_trade(self, prefetched_bars: Optional[Dict[str, List[Dict]]] = None) -> List[Dict]:
+        """Scan watchlist and execute trades
+        
+        Args:
+            prefetched_bars: Daily bars by symbol already fetched by the caller
+                (e.g. one batch covering several bots' watchlists); skips
+                this bot's own bars request
+        """
         logger.info(f"Scanning {len(self.watchlist)} symbols with {self.strategy.value} strategy...")
         
         # Check if market is open
-        if not self.client.is_market_open():
+        if not self.is_market_open_cached():
             logger.info("Market is closed")
             return []
         
@@ -476,7 +854,7 @@ class AdvancedTradingBot:
                 self.start_of_day_equity = float(persisted)
             else:
                 try:
-                    acct = self.client.get_account()
+                    acct = self.get_account_cached()
                     self.start_of_day_equity = float(acct.get('equity', acct.get('portfolio_value', 0.0)))
                     save_today_start_equity(self.mode, self.start_of_day_equity)
                 except Exception:
@@ -484,7 +862,7 @@ class AdvancedTradingBot:
 
         # Daily loss circuit breaker
         try:
-            acct = self.client.get_account()
+            acct = self.get_account_cached()
             current_equity = float(acct.get('equity', acct.get('portfolio_value', 0.0)))
             if self.start_of_day_equity and self.start_of_day_equity > 0:
                 loss_pct = (self.start_of_day_equity - current_equity) / self.start_of_day_equity
@@ -494,45 +872,83 @@ class AdvancedTradingBot:
         except Exception:
             pass
 
-        opportunities = []
+        # No trade could be placed, so skip fetching and scoring the watchlist
+        if self.daily_trades >= self.risk_config.max_daily_trades:
+            logger.info(f"Daily trade limit reached ({self.daily_trades}/{self.risk_config.max_daily_trades}), skipping scan")
+            return []
+
         executed_trades = []
         
-        # Evaluate all symbols
-        for symbol in self.watchlist:
-            try:
-                evaluation = self.evaluate_symbol(symbol)
+        # Fetch daily bars for the whole watchlist in one request; on failure
+        # each symbol falls back to its own fetch inside evaluate_symbol
+        if prefetched_bars is not None:
+            all_bars = prefetched_bars
+        else:
+            all_bars = self.fetch_watchlist_bars(self.watchlist)
+        
+        # One positions call replaces a get_position probe per symbol
+        try:
+            held_symbols = {position['symbol'] for position in self.client.get_positions()}
+        except Exception as e:
+            logger.warning(f"Could not load open positions, probing per symbol: {e}")
+            held_symbols = None
+        
+        evaluations = []
+        if all_bars is not None:
+            # Indicators for the whole watchlist come from one vectorized pass;
+            # only the strategy rules run per symbol
+            watchlist_data = self.get_watchlist_market_data(
+                {symbol: all_bars.get(symbol, []) for symbol in self.watchlist}
+            )
+            for symbol in self.watchlist:
+                try:
+                    evaluations.append(self.evaluate_symbol(
+                        symbol, held_symbols=held_symbols, market_data=watchlist_data[symbol]
+                    ))
+                except Exception as e:
+                    logger.error(f"Error evaluating {symbol}: {e}")
+        else:
+            # Per-symbol fetches are dominated by HTTP latency, so run them concurrently.
+            # Results are consumed in watchlist order so ranking ties stay deterministic.
+            max_workers = max(1, min(MAX_SCAN_WORKERS, len(self.watchlist)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    (symbol, executor.submit(self.evaluate_symbol, symbol, None, held_symbols))
+                    for symbol in self.watchlist
+                ]
                 
-                if evaluation['action'] in ['strong_buy', 'buy', 'consider']:
-                    opportunities.append(evaluation)
-                    
-            except Exception as e:
-                logger.error(f"Error evaluating {symbol}: {e}")
+                for symbol, future in futures:
+                    try:
+                        evaluations.append(future.result())
+                    except Exception as e:
+                        logger.error(f"Error evaluating {symbol}: {e}")
+        
+        opportunities = [
+            evaluation for evaluation in evaluations
+            if evaluation['action'] in ['strong_buy', 'buy', 'consider']
+        ]
         
-        # Sort opportunities by score
-        opportunities.sort(key=lambda x: x.get('score', 0), reverse=True)
+        # Sort opportunities by score; every strategy result carries one
+        opportunities.sort(key=itemgetter('score'), reverse=True)
         
         logger.info(f"Found {len(opportunities)} trading opportunities")
         
-        # Execute top opportunities, respecting max_open_positions
+        # Execute top opportunities; execute_trade enforces the daily trade and
+        # max_open_positions limits itself, so stop as soon as either is hit
         for opp in opportunities[:3]:  # Limit to top 3
-            if self.daily_trades >= self.risk_config.max_daily_trades:
-                break
-            try:
-                open_positions = self.client.get_positions()
-                if len(open_positions) >= self.risk_config.max_open_positions:
-                    break
-            except Exception:
-                pass
-
             result = self.execute_trade(opp['symbol'], opp)
             if result['status'] == 'success':
                 executed_trades.append(result)
+            elif result.get('reason') in ("Daily trade limit reached", "Max open positions reached"):
+                break
+        
+        self._save_sma_state()
         
         return executed_trades
     
     def get_portfolio_summary(self) -> Dict:
         """Get comprehensive portfolio summary"""
-        account = self.client.get_account()
+        account = self.get_account_cached()
         positions = self.client.get_positions()
         
         total_value = float(account['portfolio_value'])
@@ -0,0 +1,51 @@
+# alpaca_async_client.py
+"""
+Asyncio front end for AlpacaTradingClient
+
+Every public client method is exposed as a coroutine, so market data
+fan-out can be written as ``await asyncio.gather(...)`` and the request
+round trips overlap instead of running back to back. Calls run on worker
+threads against the shared pooled session, so rate limiting, retries and
+response caching behave exactly as in the synchronous client.
+"""
+
+import asyncio
+import functools
+from typing import Optional
+
+from alpaca_trading_client import AlpacaTradingClient, HTTP_POOL_SIZE
+
+
+class AsyncAlpacaTradingClient:
+    """
+    Awaitable wrapper around an AlpacaTradingClient
+
+    Example:
+        aclient = AsyncAlpacaTradingClient(get_client(TradingMode.PAPER))
+        quotes = await asyncio.gather(*(aclient.get_latest_quote(s) for s in symbols))
+    """
+
+    def __init__(self, client: AlpacaTradingClient, max_in_flight: int = HTTP_POOL_SIZE):
+        """
+        Args:
+            client: Connected synchronous client to issue requests with
+            max_in_flight: Maximum concurrent requests; defaults to the
+                connection pool size so no request waits on a socket
+        """
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            async with self._semaphore:
+                return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return call
@@ -5,12 +5,36 @@ Copy this file and update with your actual credentials
 """
 
 import os
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Dict, Iterable
 from dotenv import load_dotenv
 
-from alpaca_trading_client import AlpacaCredentials, TradingMode, create_paper_client, create_live_client
+from alpaca_trading_client import (
+    AlpacaCredentials, AlpacaTradingClient, TradingMode, create_paper_client, create_live_client
+)
 
-# Load variables from .env file
-load_dotenv()
+_ENV_LOADED = False
+
+# Environment variables holding the (API key, secret) pair for each mode
+_CREDENTIAL_VARS = {
+    TradingMode.PAPER: ("ALPACA_PAPER_API_KEY", "ALPACA_PAPER_SECRET"),
+    TradingMode.LIVE: ("ALPACA_LIVE_API_KEY", "ALPACA_LIVE_SECRET"),
+}
+
+# Clients already constructed by get_client, keyed by mode
+_clients: Dict[TradingMode, AlpacaTradingClient] = {}
+
+
+def _ensure_env() -> None:
+    """Load variables from the .env file once per process"""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
+
+_ensure_env()
 
 # Effective mode helper always defaults to PAPER for safety
 def get_effective_mode() -> TradingMode:
@@ -46,6 +70,7 @@ MARKET_OPEN_HOUR = 9
 MARKET_OPEN_MINUTE = 30
 MARKET_CLOSE_HOUR = 16
 MARKET_CLOSE_MINUTE = 0
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -55,80 +80,91 @@ def get_client(mode: TradingMode = None):
     """
     Get Alpaca client based on mode
     
+    The client for each mode is constructed once and reused, so repeated
+    bot instantiations share its HTTP session instead of reconnecting.
+    
     Args:
         mode: Trading mode (defaults to DEFAULT_MODE)
     """
-    # Always reload environment to pick up .env changes
-    load_dotenv()
+    _ensure_env()
 
     if mode is None:
         mode = get_effective_mode()
 
-    if mode == TradingMode.PAPER:
-        paper_api_key = os.getenv("ALPACA_PAPER_API_KEY")
-        paper_secret = os.getenv("ALPACA_PAPER_SECRET")
-        return create_paper_client(paper_api_key, paper_secret)
-    elif mode == TradingMode.LIVE:
-        live_api_key = os.getenv("ALPACA_LIVE_API_KEY")
-        live_secret = os.getenv("ALPACA_LIVE_SECRET")
-        return create_live_client(live_api_key, live_secret)
-    else:
+    if mode not in _CREDENTIAL_VARS:
         raise ValueError(f"Invalid trading mode: {mode}")
 
+    key_var, secret_var = _CREDENTIAL_VARS[mode]
+    api_key = os.getenv(key_var)
+    secret = os.getenv(secret_var)
+    factory = create_paper_client if mode == TradingMode.PAPER else create_live_client
+
+    # Reuse the cached client unless it was switched to another mode or the
+    # credentials in the environment have changed since it was built
+    client = _clients.get(mode)
+    if (client is not None and client.credentials.mode == mode
+            and client.credentials.api_key_id == api_key
+            and client.credentials.secret_key == secret):
+        return client
+
+    # ALPACA_HTTP2=1 opts into the multiplexed HTTP/2 transport
+    http2 = os.getenv("ALPACA_HTTP2", "").strip().lower() in ("1", "true", "yes")
+    client = factory(api_key, secret, http2=http2)
+    _clients[mode] = client
+    return client
+
+def get_batch_quotes(symbols: Iterable[str], client: AlpacaTradingClient = None) -> Dict[str, Dict]:
+    """
+    Get latest quotes for many symbols with one request per 200 symbols
+    
+    The client's get_latest_quote chunks the list and requests the chunks
+    concurrently over its pooled session, so a large watchlist costs roughly
+    one round trip of wall-clock time.
+    
+    Args:
+        symbols: Symbols to quote
+        client: Client to use (defaults to get_client())
+        
+    Returns:
+        Dict mapping symbol to its latest quote
+    """
+    if client is None:
+        client = get_client()
+    return client.get_latest_quote(list(symbols))['quotes']
+
+def is_market_open_local(now: datetime = None) -> bool:
+    """Check regular trading hours on a weekday without any API call.
+
+    Ignores holidays and early closes; see is_market_open_now for those.
+    """
+    now = now or datetime.now(MARKET_TIMEZONE)
+    return (now.weekday() < 5
+            and (MARKET_OPEN_HOUR, MARKET_OPEN_MINUTE) <= (now.hour, now.minute)
+            < (MARKET_CLOSE_HOUR, MARKET_CLOSE_MINUTE))
+
+def is_market_open_now(client: AlpacaTradingClient) -> bool:
+    """Check whether the market is open, avoiding REST calls where possible.
+
+    Outside regular weekday hours this answers locally. Otherwise it defers
+    to client.is_market_open(), which applies today's trading calendar
+    (holidays, early closes) and checks the clock near the open and close.
+    """
+    if not is_market_open_local():
+        return False
+    return client.is_market_open()
+
 def validate_credentials() -> bool:
     """Validate that all required credentials are set for the active mode.
 
     Reads environment variables directly and raises ValueError if any required
     variable is missing. Defaults to PAPER mode when MODE is unset.
     """
-    load_dotenv()
-    mode = get_effective_mode()
-
-    if mode == TradingMode.PAPER:
-        required_vars = ["ALPACA_PAPER_API_KEY", "ALPACA_PAPER_SECRET"]
-    elif mode == TradingMode.LIVE:
-        required_vars = ["ALPACA_LIVE_API_KEY", "ALPACA_LIVE_SECRET"]
-    else:
-        # Should not happen, but be defensive
-        required_vars = ["ALPACA_PAPER_API_KEY", "ALPACA_PAPER_SECRET"]
+    _ensure_env()
+    # get_effective_mode only ever yields a mode present in _CREDENTIAL_VARS
+    required_vars = _CREDENTIAL_VARS[get_effective_mode()]
 
     missing = [var for var in required_vars if not os.getenv(var)]
     if missing:
         raise ValueError(f"Missing credentials: {', '.join(missing)}")
 
     return True
-
-# =============================================================================
-# EXAMPLE USAGE
-# =============================================================================
-
-if __name__ == "__main__":
-    # Validate credentials
-    try:
-        validate_credentials()
-        print("✓ All credentials configured")
-    except ValueError as e:
-        print(f"✗ Configuration error: {e}")
-        exit(1)
-    
-    # Test connection to paper trading
-    try:
-        paper_client = get_client(TradingMode.PAPER)
-        account = paper_client.get_account()
-        print(f"✓ Paper trading connection successful")
-        print(f"  Account ID: {account['id']}")
-        print(f"  Status: {account['status']}")
-        print(f"  Buying Power: ${float(account['buying_power']):,.2f}")
-    except Exception as e:
-        print(f"✗ Paper trading connection failed: {e}")
-    
-    # Test connection to live trading (optional)
-    try:
-        live_client = get_client(TradingMode.LIVE)
-        account = live_client.get_account()
-        print(f"✓ Live trading connection successful")
-        print(f"  Account ID: {account['id']}")
-        print(f"  Status: {account['status']}")
-        print(f"  Buying Power: ${float(account['buying_power']):,.2f}")
-    except Exception as e:
-        print(f"✗ Live trading connection failed: {e}")
@@ -0,0 +1,41 @@
+# alpaca_config_cli.py
+"""
+Connection smoke test for the Alpaca configuration
+
+Run directly to validate credentials and fetch the paper and live accounts.
+Kept out of alpaca_config so importing the config as a library stays lean.
+"""
+
+from alpaca_config import validate_credentials, get_client
+from alpaca_trading_client import TradingMode
+
+if __name__ == "__main__":
+    # Validate credentials
+    try:
+        validate_credentials()
+        print("✓ All credentials configured")
+    except ValueError as e:
+        print(f"✗ Configuration error: {e}")
+        exit(1)
+    
+    # Test connection to paper trading
+    try:
+        paper_client = get_client(TradingMode.PAPER)
+        account = paper_client.get_account()
+        print(f"✓ Paper trading connection successful")
+        print(f"  Account ID: {account['id']}")
+        print(f"  Status: {account['status']}")
+        print(f"  Buying Power: ${float(account['buying_power']):,.2f}")
+    except Exception as e:
+        print(f"✗ Paper trading connection failed: {e}")
+    
+    # Test connection to live trading (optional)
+    try:
+        live_client = get_client(TradingMode.LIVE)
+        account = live_client.get_account()
+        print(f"✓ Live trading connection successful")
+        print(f"  Account ID: {account['id']}")
+        print(f"  Status: {account['status']}")
+        print(f"  Buying Power: ${float(account['buying_power']):,.2f}")
+    except Exception as e:
+        print(f"✗ Live trading connection failed: {e}")
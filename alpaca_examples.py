@@ -5,11 +5,81 @@ Practical examples for using the Alpaca Trading Client
 
 from alpaca_trading_client import (
     AlpacaTradingClient, TradingMode, OrderSide, 
-    OrderType, TimeInForce, create_paper_client
+    OrderType, TimeInForce, create_paper_client,
+    STOP_LOSS_TEMPLATE, STOP_LIMIT_SELL_TEMPLATE
 )
-from alpaca_config import get_client, MAX_POSITION_SIZE
+from alpaca_config import get_client, get_batch_quotes, is_market_open_now, MAX_POSITION_SIZE
+from alpaca_market_stream import AlpacaMarketStream, WEBSOCKETS_AVAILABLE
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
+import io
+import sys
+import threading
+import numpy as np
 import time
 
+# Position with its numeric fields already parsed from the API's strings
+Position = namedtuple("Position", "symbol qty market_value unrealized_pl unrealized_plpc")
+
+# Numeric position fields as columns for vectorized checks
+_POSITION_DTYPE = np.dtype([('qty', 'f8'), ('mv', 'f8'), ('pl', 'f8'), ('plpc', 'f8')])
+
+# Watchlist used by the market data example and the optional live stream
+MARKET_DATA_WATCHLIST = ("AAPL", "MSFT", "GOOGL", "TSLA", "NVDA", "AMD", "SPY")
+
+# Calendar days requested for the 5-day history, enough to span weekends and holidays
+MARKET_DATA_LOOKBACK_DAYS = 10
+
+# Live quote stream started by run_examples when websockets is installed
+_market_stream = None
+
+# Seconds example_market_data waits for the stream to subscribe before using REST
+STREAM_READY_TIMEOUT = 5.0
+
+# Account and positions snapshots are shared across examples for a few seconds;
+# anything that places or closes orders drops them
+SNAPSHOT_TTL = 5
+_snapshots = {}
+
+def _snapshot(client, method_name, convert=None):
+    """Return client.<method_name>() reusing a result younger than SNAPSHOT_TTL
+    
+    convert, if given, is applied once when the result is fetched.
+    """
+    key = (id(client), method_name)
+    now = time.monotonic()
+    cached = _snapshots.get(key)
+    if cached is not None and now - cached[0] < SNAPSHOT_TTL:
+        return cached[1]
+    value = getattr(client, method_name)()
+    if convert is not None:
+        value = convert(value)
+    _snapshots[key] = (now, value)
+    return value
+
+def _get_account(client):
+    return _snapshot(client, "get_account")
+
+def _get_positions(client):
+    return _snapshot(client, "get_positions", _to_positions)
+
+def _invalidate_snapshots():
+    _snapshots.clear()
+
+def _to_positions(raw):
+    """Parse raw position dicts once into Position tuples"""
+    return [
+        Position(p['symbol'], float(p['qty']), float(p['market_value']),
+                 float(p['unrealized_pl']), float(p['unrealized_plpc']))
+        for p in raw
+    ]
+
+def _position_array(positions):
+    """Numeric Position fields as a structured array (one row per position)"""
+    return np.array([p[1:] for p in positions], dtype=_POSITION_DTYPE)
+
 def example_basic_trading():
     """Basic trading operations example"""
     print("=== Basic Trading Example ===")
@@ -17,15 +87,15 @@ def example_basic_trading():
     # Get paper trading client
     client = get_client(TradingMode.PAPER)
     
-    # Check account status
-    account = client.get_account()
-    print(f"Account buying power: ${float(account['buying_power']):,.2f}")
-    
-    # Check if market is open
-    if not client.is_market_open():
+    # Check if market is open first; outside trading hours this needs no request
+    if not is_market_open_now(client):
         print("Market is closed - using example data")
         return
     
+    # Check account status
+    account = _get_account(client)
+    print(f"Account buying power: ${float(account['buying_power']):,.2f}")
+    
     # Get current quote for Apple
     quote = client.get_latest_quote("AAPL")
     current_price = quote['quotes']['AAPL']['bp']  # Bid price
@@ -41,11 +111,11 @@ def example_basic_trading():
         
         # Place market buy order
         order = client.buy_market("AAPL", str(shares_to_buy))
+        _invalidate_snapshots()
         print(f"Order placed successfully: {order['id']}")
         
-        # Wait a moment and check order status
-        time.sleep(2)
-        order_status = client.get_order(order['id'])
+        # Wait for the order to settle and report its status
+        order_status = client.wait_for_order(order['id'], timeout=10)
         print(f"Order status: {order_status['status']}")
     else:
         print("Insufficient buying power for minimum position")
@@ -71,46 +141,83 @@ def example_limit_orders():
     sell_limit_price = current_price * 1.05
     
     sell_order = client.sell_limit("TSLA", "5", f"{sell_limit_price:.2f}")
+    _invalidate_snapshots()
     print(f"Limit sell order placed at ${sell_limit_price:.2f}")
     print(f"Sell Order ID: {sell_order['id']}")
 
+def example_watchlist_limit_prices(place_orders: bool = False, qty: str = "1"):
+    """Screener-style limit pricing for a whole watchlist"""
+    print("=== Watchlist Limit Prices Example ===")
+    
+    client = get_client(TradingMode.PAPER)
+    
+    quotes = get_batch_quotes(MARKET_DATA_WATCHLIST, client)
+    symbols = list(quotes)
+    bids = np.fromiter((float(q['bp']) for q in quotes.values()), dtype=np.float64, count=len(symbols))
+    
+    # Price every symbol at once and format the order payload strings in one pass
+    buy_prices = np.char.mod("%.2f", bids * 0.98)
+    sell_prices = np.char.mod("%.2f", bids * 1.05)
+    
+    for symbol, bid, buy_price, sell_price in zip(symbols, bids, buy_prices, sell_prices):
+        print(f"  {symbol}: Bid ${bid:.2f}, Buy limit ${buy_price}, Sell limit ${sell_price}")
+    
+    if place_orders:
+        for symbol, buy_price in zip(symbols, buy_prices):
+            order = client.buy_limit(symbol, qty, str(buy_price))
+            print(f"Limit buy order placed for {symbol} at ${buy_price}: {order['id']}")
+        _invalidate_snapshots()
+
 def example_portfolio_management():
     """Portfolio management example"""
     print("=== Portfolio Management Example ===")
     
     client = get_client(TradingMode.PAPER)
     
-    # Get all positions
-    positions = client.get_positions()
-    
-    if positions:
-        print("Current positions:")
-        total_value = 0
+    # Independent requests run concurrently over the client's pooled session
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        positions_future = executor.submit(_get_positions, client)
+        orders_future = executor.submit(client.get_orders, status="open")
         
-        for position in positions:
-            symbol = position['symbol']
-            qty = float(position['qty'])
-            market_value = float(position['market_value'])
-            unrealized_pl = float(position['unrealized_pl'])
-            
-            print(f"  {symbol}: {qty} shares, Value: ${market_value:,.2f}, P&L: ${unrealized_pl:,.2f}")
-            total_value += market_value
+        # Get all positions
+        positions = positions_future.result()
         
-        print(f"Total position value: ${total_value:,.2f}")
+        if positions:
+            print("Current positions:")
+            arr = _position_array(positions)
+            
+            for position in positions:
+                print(f"  {position.symbol}: {position.qty} shares, Value: ${position.market_value:,.2f}, "
+                      f"P&L: ${position.unrealized_pl:,.2f}")
+            
+            print(f"Total position value: ${arr['mv'].sum():,.2f}")
+            
+            # Close positions with significant losses (example: >5% loss)
+            losers = np.flatnonzero(arr['plpc'] < -0.05)
+            for i in losers:
+                print(f"Closing position in {positions[i].symbol} due to {positions[i].unrealized_plpc:.1%} loss")
+            
+            loser_symbols = {positions[i].symbol for i in losers}
+            # Close-all liquidates whatever is held when it runs, so it is only
+            # used when a fresh positions read (not the snapshot) holds nothing else
+            if (len(losers) > 1 and len(losers) == len(positions)
+                    and {p['symbol'] for p in client.get_positions()} == loser_symbols):
+                # Every position is closing, so one close-all request covers them
+                for result in client.close_all_positions():
+                    print(f"Position closed: {result}")
+            else:
+                # Submit all closes at once; each is an independent DELETE
+                closing = [executor.submit(client.close_position, positions[i].symbol) for i in losers]
+                for future in closing:
+                    print(f"Position closed: {future.result()}")
+            if len(losers):
+                _invalidate_snapshots()
+        else:
+            print("No open positions")
         
-        # Close positions with significant losses (example: >5% loss)
-        for position in positions:
-            unrealized_pl_pct = float(position['unrealized_plpc'])
-            if unrealized_pl_pct < -0.05:  # More than 5% loss
-                symbol = position['symbol']
-                print(f"Closing position in {symbol} due to {unrealized_pl_pct:.1%} loss")
-                close_result = client.close_position(symbol)
-                print(f"Position closed: {close_result}")
-    else:
-        print("No open positions")
+        # Get open orders
+        orders = orders_future.result()
     
-    # Get open orders
-    orders = client.get_orders(status="open")
     if orders:
         print(f"\nOpen orders: {len(orders)}")
         for order in orders:
@@ -124,12 +231,16 @@ def example_market_data():
     
     client = get_client(TradingMode.PAPER)
     
-    # Get historical data for multiple symbols
-    symbols = "AAPL,MSFT,GOOGL"
-    bars = client.get_bars(symbols, timeframe="1Day", limit=5)
+    # One watchlist drives both requests: a single multi-symbol bars call and
+    # a single batched quotes call, rather than a round trip per symbol. The
+    # API limits a multi-symbol page as a whole, so get_bars_multi follows
+    # pages and keeps the last 5 bars per symbol.
+    watchlist = MARKET_DATA_WATCHLIST
+    start = (datetime.now() - timedelta(days=MARKET_DATA_LOOKBACK_DAYS)).strftime('%Y-%m-%d')
+    bars = client.get_bars_multi(list(watchlist), timeframe="1Day", start=start, limit=5)
     
     print("5-day historical data:")
-    for symbol, symbol_bars in bars['bars'].items():
+    for symbol, symbol_bars in bars.items():
         print(f"\n{symbol}:")
         for bar in symbol_bars[-3:]:  # Show last 3 days
             date = bar['t'][:10]  # Extract date
@@ -137,12 +248,20 @@ def example_market_data():
             volume = bar['v']
             print(f"  {date}: Close ${close_price:.2f}, Volume {volume:,}")
     
-    # Get latest quotes for watchlist
-    watchlist = "AAPL,TSLA,NVDA,AMD"
-    quotes = client.get_latest_quote(watchlist)
+    # Get latest quotes for watchlist; streamed quotes are read from memory and
+    # only symbols the stream hasn't delivered yet go over REST. The stream may
+    # still be connecting (e.g. under --parallel), so wait for it first.
+    stream = _market_stream
+    if stream is not None and stream.wait_ready(STREAM_READY_TIMEOUT):
+        quotes = dict(stream.latest_quotes)
+    else:
+        quotes = {}
+    missing = [symbol for symbol in watchlist if symbol not in quotes]
+    if missing:
+        quotes.update(get_batch_quotes(missing, client))
     
     print(f"\nLatest quotes:")
-    for symbol, quote in quotes['quotes'].items():
+    for symbol, quote in quotes.items():
         bid = quote['bp']
         ask = quote['ap']
         spread = ask - bid
@@ -153,7 +272,7 @@ def example_risk_management():
     print("=== Risk Management Example ===")
     
     client = get_client(TradingMode.PAPER)
-    account = client.get_account()
+    account = _get_account(client)
     
     # Check account restrictions
     if account['trading_blocked']:
@@ -173,28 +292,25 @@ def example_risk_management():
     print(f"Account equity: ${equity:,.2f}")
     
     # Check positions for risk
-    positions = client.get_positions()
+    positions = _get_positions(client)
     if positions:
         print("\nPosition risk analysis:")
-        for position in positions:
-            symbol = position['symbol']
-            market_value = float(position['market_value'])
-            unrealized_pl_pct = float(position['unrealized_plpc'])
-            
-            # Calculate position size as percentage of portfolio
-            position_pct = (market_value / portfolio_value) * 100
-            
-            # Risk flags
-            risk_flags = []
-            if position_pct > 10:
-                risk_flags.append("LARGE_POSITION")
-            if unrealized_pl_pct < -0.10:
-                risk_flags.append("LARGE_LOSS")
-            if unrealized_pl_pct > 0.20:
-                risk_flags.append("CONSIDER_PROFIT_TAKING")
-            
+        arr = _position_array(positions)
+        
+        # Calculate position size as percentage of portfolio
+        position_pct = arr['mv'] * (100.0 / portfolio_value)
+        
+        # Risk flags, evaluated for all positions at once
+        flag_masks = [
+            ("LARGE_POSITION", position_pct > 10),
+            ("LARGE_LOSS", arr['plpc'] < -0.10),
+            ("CONSIDER_PROFIT_TAKING", arr['plpc'] > 0.20),
+        ]
+        
+        for i, position in enumerate(positions):
+            risk_flags = [flag for flag, mask in flag_masks if mask[i]]
             status = " | ".join(risk_flags) if risk_flags else "OK"
-            print(f"  {symbol}: {position_pct:.1f}% of portfolio, {unrealized_pl_pct:.1%} P&L [{status}]")
+            print(f"  {position.symbol}: {position_pct[i]:.1f}% of portfolio, {position.unrealized_plpc:.1%} P&L [{status}]")
 
 def example_advanced_orders():
     """Advanced order types example"""
@@ -215,9 +331,7 @@ def example_advanced_orders():
         stop_order = client.place_order(
             symbol="SPY",
             qty="10",
-            side=OrderSide.SELL,
-            order_type=OrderType.STOP,
-            time_in_force=TimeInForce.GTC,  # Good till canceled
+            template=STOP_LOSS_TEMPLATE,  # Sell stop, good till canceled
             stop_price=f"{stop_price:.2f}"
         )
         print(f"Stop-loss order placed at ${stop_price:.2f}")
@@ -232,9 +346,7 @@ def example_advanced_orders():
         stop_limit_order = client.place_order(
             symbol="SPY",
             qty="5",
-            side=OrderSide.SELL,
-            order_type=OrderType.STOP_LIMIT,
-            time_in_force=TimeInForce.GTC,
+            template=STOP_LIMIT_SELL_TEMPLATE,
             stop_price=f"{stop_limit_stop:.2f}",
             limit_price=f"{stop_limit_price:.2f}"
         )
@@ -255,6 +367,8 @@ def example_advanced_orders():
         print("Trailing stop order placed (5% trail)")
     except Exception as e:
         print(f"Trailing stop failed: {e}")
+    
+    _invalidate_snapshots()
 
 def example_mode_switching():
     """Example of switching between paper and live trading"""
@@ -264,19 +378,20 @@ def example_mode_switching():
     paper_client = get_client(TradingMode.PAPER)
     
     print("Connected to paper trading")
-    paper_account = paper_client.get_account()
+    paper_account = _get_account(paper_client)
     print(f"Paper account equity: ${float(paper_account['equity']):,.2f}")
     
     # Simulate some paper trading activity
-    if paper_client.is_market_open():
+    if is_market_open_now(paper_client):
         try:
             # Small test trade in paper
             test_order = paper_client.buy_market("AAPL", "1")
             print(f"Paper trade executed: {test_order['id']}")
             
-            # Wait and then close position
-            time.sleep(2)
+            # Wait for the fill and then close position
+            paper_client.wait_for_order(test_order['id'], timeout=10)
             paper_client.close_position("AAPL")
+            _invalidate_snapshots()
             print("Paper position closed")
             
         except Exception as e:
@@ -323,8 +438,8 @@ def example_monitoring_and_alerts():
     client = get_client(TradingMode.PAPER)
     
     # Monitor account health
-    account = client.get_account()
-    positions = client.get_positions()
+    account = _get_account(client)
+    positions = _get_positions(client)
     
     alerts = []
     
@@ -334,12 +449,12 @@ def example_monitoring_and_alerts():
         if maintenance_excess < 1000:  # Less than $1000 buffer
             alerts.append(f"🔴 LOW MARGIN BUFFER: ${maintenance_excess:.2f}")
     
-    # Check for large unrealized losses
-    for position in positions:
-        unrealized_pl_pct = float(position['unrealized_plpc'])
-        if unrealized_pl_pct < -0.15:  # More than 15% loss
-            symbol = position['symbol']
-            alerts.append(f"🔴 LARGE LOSS: {symbol} down {unrealized_pl_pct:.1%}")
+    # Check for large unrealized losses, totalling P&L in the same pass
+    total_unrealized_pl = 0.0
+    for symbol, _, _, pl, plpc in positions:
+        total_unrealized_pl += pl
+        if plpc < -0.15:  # More than 15% loss
+            alerts.append(f"🔴 LARGE LOSS: {symbol} down {plpc:.1%}")
     
     # Check for positions approaching day trade limits
     if account['pattern_day_trader'] == False:
@@ -356,18 +471,81 @@ def example_monitoring_and_alerts():
         print("✅ No alerts - account status normal")
     
     # Performance summary
-    total_unrealized_pl = sum(float(pos['unrealized_pl']) for pos in positions)
     print(f"\nPerformance Summary:")
     print(f"  Total unrealized P&L: ${total_unrealized_pl:,.2f}")
     print(f"  Account equity: ${float(account['equity']):,.2f}")
     print(f"  Day trade buying power: ${float(account['daytrading_buying_power']):,.2f}")
 
+# Examples that only read account/market state and can safely run side by side
+READ_ONLY_EXAMPLES = {
+    "example_market_data", "example_watchlist_limit_prices",
+    "example_risk_management", "example_monitoring_and_alerts"
+}
+
+class _BufferedExampleOutput(io.TextIOBase):
+    """
+    stdout stand-in that buffers each running example's output
+    
+    Writes from a thread inside capture() go to that thread's buffer, which
+    is written to the real stream in one call when the example finishes.
+    This coalesces an example's prints into a single write and keeps
+    concurrently running examples from interleaving. Other writes (such as
+    input() prompts) pass straight through.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffers = {}
+    
+    def writable(self):
+        return True
+    
+    def write(self, text):
+        buffer = self._buffers.get(threading.get_ident())
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    @contextmanager
+    def capture(self):
+        ident = threading.get_ident()
+        self._buffers[ident] = io.StringIO()
+        try:
+            yield
+        finally:
+            self._stream.write(self._buffers.pop(ident).getvalue())
+            self._stream.flush()
+
+def _run_example(i, example_func):
+    """Run one example with its banner, reporting failures and elapsed time"""
+    output = sys.stdout
+    with output.capture() if isinstance(output, _BufferedExampleOutput) else nullcontext():
+        print(f"\n{'='*60}")
+        print(f"EXAMPLE {i}: {example_func.__name__.replace('example_', '').replace('_', ' ').title()}")
+        print('='*60)
+        started = time.perf_counter()
+        try:
+            example_func()
+        except Exception as e:
+            print(f"❌ Example failed: {e}")
+        print(f"⏱  {example_func.__name__} took {time.perf_counter() - started:.2f}s")
+
 # Main execution function
-def run_examples():
-    """Run all examples"""
+def run_examples(interactive: bool = True, parallel: bool = False):
+    """Run all examples
+    
+    Args:
+        interactive: Pause for Enter between examples
+        parallel: Run the read-only examples concurrently and then the
+            order-placing ones in sequence
+    
+    Each example's output is buffered and written once it finishes.
+    """
     examples = [
         example_basic_trading,
         example_limit_orders,
+        example_watchlist_limit_prices,
         example_portfolio_management,
         example_market_data,
         example_risk_management,
@@ -375,20 +553,51 @@ def run_examples():
         example_mode_switching,
         example_monitoring_and_alerts
     ]
+    numbered = list(enumerate(examples, 1))
     
-    for i, example_func in enumerate(examples, 1):
+    global _market_stream
+    if WEBSOCKETS_AVAILABLE:
         try:
-            print(f"\n{'='*60}")
-            print(f"EXAMPLE {i}: {example_func.__name__.replace('example_', '').replace('_', ' ').title()}")
-            print('='*60)
-            example_func()
+            _market_stream = AlpacaMarketStream(get_client(TradingMode.PAPER).credentials, MARKET_DATA_WATCHLIST)
+            _market_stream.start()
         except Exception as e:
-            print(f"❌ Example failed: {e}")
+            print(f"Live market data stream unavailable, using REST: {e}")
+            _market_stream = None
+    
+    real_stdout = sys.stdout
+    sys.stdout = _BufferedExampleOutput(real_stdout)
+    try:
+        _run_examples(numbered, interactive, parallel)
+    finally:
+        sys.stdout = real_stdout
+        if _market_stream is not None:
+            _market_stream.stop()
+            _market_stream = None
+
+def _run_examples(numbered, interactive, parallel):
+    """Run numbered examples, optionally with the read-only ones concurrently"""
+    if parallel:
+        concurrent = [(i, f) for i, f in numbered if f.__name__ in READ_ONLY_EXAMPLES]
+        numbered = [(i, f) for i, f in numbered if f.__name__ not in READ_ONLY_EXAMPLES]
+        with ThreadPoolExecutor(max_workers=len(concurrent)) as executor:
+            list(executor.map(lambda item: _run_example(*item), concurrent))
+    
+    for position, (i, example_func) in enumerate(numbered, 1):
+        _run_example(i, example_func)
         
-        if i < len(examples):
+        if interactive and position < len(numbered):
             input("\nPress Enter to continue to next example...")
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Alpaca Trading Examples")
+    parser.add_argument("--non-interactive", action="store_true",
+                        help="Run all examples without pausing between them")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Run the read-only examples concurrently")
+    args = parser.parse_args()
+    
     print("Alpaca Trading Examples")
     print("Make sure you've configured your credentials in alpaca_config.py")
     
@@ -397,8 +606,8 @@ if __name__ == "__main__":
         validate_credentials()
         print("✅ Credentials validated")
         
-        run_examples()
+        run_examples(interactive=not args.non_interactive, parallel=args.parallel)
         
     except Exception as e:
         print(f"❌ Setup error: {e}")
-        print("Please check your configuration in alpaca_config.py")
\ No newline at end of file
+        print("Please check your configuration in alpaca_config.py")
@@ -0,0 +1,196 @@
+# alpaca_market_stream.py
+"""
+Alpaca real-time market data stream
+
+Keeps the latest bar and quote per symbol in memory from the market data
+websocket, so repeated reads are dictionary lookups instead of REST round
+trips. The stream runs its own asyncio loop on a background thread so it can
+be used from the synchronous client code.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from alpaca_trading_client import AlpacaCredentials
+
+# Optional websocket dependency; without it callers stay on REST
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+# Optional faster event loop for the stream thread
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+logger = logging.getLogger("AlpacaMarketStream")
+
+STREAM_URL = "wss://stream.data.alpaca.markets/v2/{feed}"
+
+# Seconds to wait before reconnecting after the stream drops (doubles up to the max)
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+
+class StreamRejectedError(ConnectionError):
+    """The server refused authentication or the subscription (e.g. bad keys,
+    connection limit exceeded); reconnecting would fail the same way"""
+
+
+class AlpacaMarketStream:
+    """
+    Background subscription to Alpaca minute bars and quotes
+    """
+
+    def __init__(self, credentials: AlpacaCredentials, symbols: List[str], feed: str = "iex"):
+        """
+        Initialize the stream (call start() to connect)
+
+        Args:
+            credentials: AlpacaCredentials used to authenticate
+            symbols: Symbols to subscribe to for bars and quotes
+            feed: Market data feed ('iex' or 'sip')
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ImportError("websockets is required for AlpacaMarketStream")
+
+        self.credentials = credentials
+        self.symbols = list(symbols)
+        self.url = STREAM_URL.format(feed=feed)
+
+        # Latest message per symbol, keyed by the 'S' field
+        self.latest_bars: Dict[str, Dict] = {}
+        self.latest_quotes: Dict[str, Dict] = {}
+
+        self._ready = threading.Event()
+        # Set once the stream is ready or has failed for good, so wait_ready
+        # returns early on a rejected connection
+        self._settled = threading.Event()
+        self._stopping = threading.Event()
+        self.failed = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws = None
+
+    def start(self) -> None:
+        """Start streaming on a daemon thread"""
+        if self._thread is not None:
+            return
+        self.failed = False
+        self._settled.clear()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="alpaca-market-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close the websocket and wait for the background thread to exit"""
+        self._stopping.set()
+        if self._loop is not None and self._ws is not None:
+            self._loop.call_soon_threadsafe(lambda: asyncio.ensure_future(self._ws.close()))
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wait_ready(self, timeout: float = 10.0) -> bool:
+        """Block until the stream is authenticated and subscribed
+
+        Returns False on timeout, or as soon as the stream has been rejected.
+        """
+        self._settled.wait(timeout)
+        return self._ready.is_set()
+
+    def _run_loop(self) -> None:
+        self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._run())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    async def _run(self) -> None:
+        """Connect, subscribe and consume messages, reconnecting until stopped
+
+        A rejected auth or subscription stops the stream and clears its data
+        instead of reconnecting.
+        """
+        delay = RECONNECT_DELAY
+        while not self._stopping.is_set():
+            try:
+                async with websockets.connect(self.url) as ws:
+                    self._ws = ws
+                    await self._authenticate(ws)
+                    await self._subscribe(ws)
+                    self._ready.set()
+                    self._settled.set()
+                    delay = RECONNECT_DELAY
+
+                    async for raw in ws:
+                        self._handle_messages(json.loads(raw))
+            except StreamRejectedError as e:
+                logger.error(f"Market data stream rejected, stopping: {e}")
+                self.failed = True
+                self._stopping.set()
+                self.latest_bars.clear()
+                self.latest_quotes.clear()
+            except Exception as e:
+                if self._stopping.is_set():
+                    break
+                logger.warning(f"Market data stream dropped, reconnecting in {delay:.0f}s: {e}")
+            finally:
+                self._ws = None
+                self._ready.clear()
+                if self.failed:
+                    self._settled.set()
+                else:
+                    self._settled.clear()
+
+            if not self._stopping.is_set():
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _authenticate(self, ws) -> None:
+        """Send credentials and wait for the authenticated acknowledgement"""
+        await ws.send(json.dumps({
+            "action": "auth",
+            "key": self.credentials.api_key_id,
+            "secret": self.credentials.secret_key
+        }))
+        while True:
+            for message in json.loads(await ws.recv()):
+                if message.get("T") == "error":
+                    raise StreamRejectedError(f"Stream error {message.get('code')}: {message.get('msg')}")
+                if message.get("T") == "success" and message.get("msg") == "authenticated":
+                    return
+
+    async def _subscribe(self, ws) -> None:
+        """Subscribe to bars and quotes and wait for the subscription acknowledgement"""
+        await ws.send(json.dumps({
+            "action": "subscribe",
+            "bars": self.symbols,
+            "quotes": self.symbols
+        }))
+        while True:
+            messages = json.loads(await ws.recv())
+            for message in messages:
+                if message.get("T") == "error":
+                    raise StreamRejectedError(f"Stream error {message.get('code')}: {message.get('msg')}")
+                if message.get("T") == "subscription":
+                    self._handle_messages(messages)
+                    return
+
+    def _handle_messages(self, messages: List[Dict]) -> None:
+        for message in messages:
+            kind = message.get("T")
+            if kind == "b":
+                self.latest_bars[message["S"]] = message
+            elif kind == "q":
+                self.latest_quotes[message["S"]] = message
+            elif kind == "error":
+                logger.error(f"Stream error {message.get('code')}: {message.get('msg')}")
@@ -1,12 +1,34 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
 import logging
+import math
+import random
 import time
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Sequence, Union
 from enum import Enum
 from dataclasses import dataclass
 from os import getenv
+from zoneinfo import ZoneInfo
+
+# Optional faster JSON decoding for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional HTTP/2 transport (httpx with the h2 extra)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +37,167 @@ logging.basicConfig(
 )
 logger = logging.getLogger("AlpacaTrading")
 
+# Keep-alive connections per host; sized above the bot's scan worker count so
+# concurrent requests reuse pooled connections instead of opening new ones
+HTTP_POOL_SIZE = 16
+
+# Transport-level retries for connection-establishment failures only, where
+# nothing reached the server. Read failures are never resent here, since a
+# position-close DELETE or order POST may already have been processed; that
+# includes a dropped keep-alive socket (RemoteDisconnected/ConnectionReset
+# surface as a read-side ProtocolError), which _make_request retries for
+# idempotent requests. Throttling and 5xx responses are also retried by
+# _make_request, which keeps the rate limiter in step with the server.
+HTTP_RETRIES = Retry(total=3, connect=3, read=False, backoff_factor=0.2,
+                     respect_retry_after_header=False)
+
+# Request-level retries in _make_request: exponential backoff from 1s,
+# capped, with +/- jitter so parallel clients do not retry in lockstep
+MAX_REQUEST_RETRIES = 3
+MAX_BACKOFF_SECONDS = 32.0
+BACKOFF_JITTER = 0.1
+
+# Server errors worth retrying for idempotent requests; 429 is retried for
+# every method since a throttled request was not processed. Network failures
+# are retried for idempotent requests unless the transport already retried
+# them (connection failures), so attempts do not multiply.
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# (connect, read) timeout in seconds for every API request
+REQUEST_TIMEOUT = (3.05, 27)
+
+# HTTP methods _make_request supports, and those that send a JSON body
+HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+BODY_METHODS = frozenset({"POST", "PUT"})
+
+# Alpaca market data endpoints accept at most this many symbols per request
+MAX_SYMBOLS_PER_REQUEST = 200
+
+# Upper bound on chunked market data requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Seconds slowly changing responses are served from the in-process cache
+CLOCK_CACHE_TTL = 1.0
+ACCOUNT_CACHE_TTL = 2.0
+CALENDAR_CACHE_TTL = 3600.0
+
+# Exchange timezone for the trading calendar's open/close times
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+
+# Within this many seconds of the open or close, is_market_open asks the
+# clock endpoint instead of trusting the cached schedule
+MARKET_BOUNDARY_SECONDS = 60
+
+# Responses kept for conditional GETs (If-None-Match / If-Modified-Since);
+# the oldest entry is dropped beyond this many
+VALIDATOR_CACHE_SIZE = 256
+
+# Order statuses after which an order will not change further
+ORDER_FINAL_STATUSES = frozenset({
+    "filled", "canceled", "expired", "rejected", "done_for_day", "replaced"
+})
+
+# Alpaca's 404 message when a symbol is valid but no position is held
+POSITION_NOT_FOUND_MESSAGE = "position does not exist"
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt`` (0-based)"""
+    base = min(2.0 ** attempt, MAX_BACKOFF_SECONDS)
+    jitter = random.uniform(-BACKOFF_JITTER, BACKOFF_JITTER)
+    return max(0.1, base * (1 + jitter))
+
+def _retry_after(response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, or None when absent/unparseable"""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+def _transport_retried(error: requests.RequestException) -> bool:
+    """True for connection failures the session transport has already retried"""
+    if error.args and isinstance(error.args[0], MaxRetryError):
+        return True
+    return HTTPX_AVAILABLE and isinstance(error.__cause__, (httpx.ConnectError, httpx.ConnectTimeout))
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed
+    
+    Raises ValueError on an invalid body, like Response.json().
+    """
+    if ORJSON_AVAILABLE:
+        content = response.content
+        if isinstance(content, (bytes, bytearray)):
+            return orjson.loads(content)
+    return response.json()
+
+class AlpacaAPIError(RuntimeError):
+    """
+    Error response from the Alpaca API
+    
+    Carries the HTTP status and server message so callers can branch on
+    status_code instead of parsing the exception text.
+    """
+    
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"Alpaca API error ({status_code}): {message}")
+        self.status_code = status_code
+        self.message = message
+
+class Http2Session:
+    """
+    requests.Session-compatible wrapper around an HTTP/2 httpx.Client
+    
+    Concurrent requests to the same host multiplex over one TLS connection.
+    Failed connection attempts are retried HTTP_RETRIES.total times, like
+    the requests adapter. Only the surface _make_request uses is provided:
+    headers, mount() and get/post/put/delete returning responses with an
+    ``ok`` attribute and raising requests exceptions on transport failures.
+    """
+    
+    def __init__(self):
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=HTTP_RETRIES.total,
+            limits=httpx.Limits(max_connections=HTTP_POOL_SIZE, max_keepalive_connections=HTTP_POOL_SIZE,
+                                keepalive_expiry=60)
+        )
+        self._client = httpx.Client(transport=transport)
+        self.headers = self._client.headers
+    
+    def mount(self, prefix: str, adapter) -> None:
+        """No-op; connection pooling is configured on the httpx client"""
+    
+    def request(self, method: str, url: str, params: Dict = None, json: Any = None, timeout=None,
+                headers: Dict = None):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        try:
+            response = self._client.request(method, url, params=params, json=json, timeout=timeout,
+                                            headers=headers)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        response.ok = response.is_success
+        return response
+    
+    def get(self, url, params=None, timeout=None, headers=None):
+        return self.request("GET", url, params=params, timeout=timeout, headers=headers)
+    
+    def post(self, url, params=None, json=None, timeout=None):
+        return self.request("POST", url, params=params, json=json, timeout=timeout)
+    
+    def put(self, url, params=None, json=None, timeout=None):
+        return self.request("PUT", url, params=params, json=json, timeout=timeout)
+    
+    def delete(self, url, params=None, timeout=None):
+        return self.request("DELETE", url, params=params, timeout=timeout)
+    
+    def close(self) -> None:
+        self._client.close()
+
 class TradingMode(Enum):
     """Trading mode enumeration"""
     PAPER = "paper"
@@ -39,55 +222,125 @@ class TimeInForce(Enum):
     IOC = "ioc"  # Immediate or Cancel
     FOK = "fok"  # Fill or Kill
 
-@dataclass
+# Pre-serialized side/type/time_in_force fields for common orders; pass one as
+# place_order(template=...) to skip the enum handling on submission
+MARKET_BUY_TEMPLATE = {"side": "buy", "type": "market", "time_in_force": "day"}
+MARKET_SELL_TEMPLATE = {"side": "sell", "type": "market", "time_in_force": "day"}
+STOP_LOSS_TEMPLATE = {"side": "sell", "type": "stop", "time_in_force": "gtc"}
+STOP_LIMIT_SELL_TEMPLATE = {"side": "sell", "type": "stop_limit", "time_in_force": "gtc"}
+
+# Wire values accepted by place_order when plain strings are passed
+_VALID_SIDES = frozenset(member.value for member in OrderSide)
+_VALID_ORDER_TYPES = frozenset(member.value for member in OrderType)
+_VALID_TIME_IN_FORCE = frozenset(member.value for member in TimeInForce)
+
+def _wire_value(value, valid: frozenset, field: str) -> str:
+    """Return the API string for an enum member or an already-serialized string"""
+    if isinstance(value, str):
+        if value not in valid:
+            raise ValueError(f"Invalid {field}: {value}")
+        return value
+    return value.value
+
+@dataclass(slots=True, frozen=True)
 class AlpacaCredentials:
-    """Alpaca API credentials"""
+    """Alpaca API credentials (immutable and hashable; replace the object to change them)"""
     api_key_id: str
     secret_key: str
     mode: TradingMode
 
 class RateLimitTracker:
-    """Simple rate limit tracker for Alpaca API"""
+    """
+    Token bucket rate limiter for Alpaca API
+    
+    The bucket holds up to max_requests tokens and refills continuously at
+    max_requests per time_window, so each check is O(1) with no per-request
+    history. check_rate_limit() only peeks; record_request() spends a token.
+    """
     
     def __init__(self, max_requests: int = 200, time_window: int = 60):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        self.rate = max_requests / time_window  # Tokens per second
+        self.tokens = float(max_requests)
+        self.last_refill = time.time()
+        self._lock = threading.Lock()  # Shared across worker threads scanning in parallel
+    
+    def _refill(self, now: float) -> None:
+        # Clamp so a clock stepping backwards never drains the bucket
+        elapsed = max(0.0, now - self.last_refill)
+        self.tokens = min(float(self.max_requests), self.tokens + elapsed * self.rate)
+        self.last_refill = now
     
     def check_rate_limit(self) -> tuple[bool, int]:
         """Check if we can make a request"""
-        now = time.time()
-        # Remove old requests outside the time window
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
-        
-        if len(self.requests) < self.max_requests:
-            return True, 0
-        else:
-            # Calculate wait time until oldest request expires
-            oldest_request = min(self.requests)
-            wait_time = int(self.time_window - (now - oldest_request)) + 1
-            return False, wait_time
+        with self._lock:
+            self._refill(time.time())
+            
+            if self.tokens >= 1:
+                return True, 0
+            else:
+                # Seconds until a full token has refilled
+                wait_time = math.ceil((1 - self.tokens) / self.rate)
+                return False, wait_time
     
     def record_request(self):
         """Record a new request"""
-        self.requests.append(time.time())
+        with self._lock:
+            self._refill(time.time())
+            self.tokens -= 1
+    
+    def penalize(self, seconds: float):
+        """Drain the bucket after the server throttled us for ``seconds``"""
+        with self._lock:
+            self._refill(time.time())
+            self.tokens -= max(1.0, seconds * self.rate)
 
 class AlpacaTradingClient:
     """
     Comprehensive Alpaca trading client with paper/live switching
     """
     
-    def __init__(self, credentials: AlpacaCredentials):
+    def __init__(self, credentials: AlpacaCredentials, http2: bool = False,
+                 lazy_validation: bool = False):
         """
         Initialize the Alpaca trading client
         
         Args:
             credentials: AlpacaCredentials object with API keys and mode
+            http2: Multiplex requests over HTTP/2 (needs httpx[http2]; falls
+                back to the pooled HTTP/1.1 session when unavailable)
+            lazy_validation: Defer the credential check to the first request
+                instead of making it during construction (see validate_now)
         """
         self.credentials = credentials
-        self.session = requests.Session()
+        self.lazy_validation = lazy_validation
+        self.session = None
+        if http2:
+            if not HTTPX_AVAILABLE:
+                logger.warning("HTTP/2 requested but httpx is not installed; using HTTP/1.1")
+            else:
+                try:
+                    self.session = Http2Session()
+                except ImportError as e:
+                    logger.warning(f"HTTP/2 unavailable ({e}); using HTTP/1.1")
+        if self.session is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                  max_retries=HTTP_RETRIES)
+            self.session.mount("https://", adapter)
         self.rate_tracker = RateLimitTracker(max_requests=200, time_window=60)
         
+        # (endpoint, params) -> (monotonic fetch time, response)
+        self._cache: Dict[tuple, tuple] = {}
+        # Bumped on every invalidation so a fetch that was in flight across
+        # one does not re-cache its stale response
+        self._cache_generation = 0
+        # cache_key -> (conditional request headers, parsed response)
+        self._validators: Dict[tuple, tuple] = {}
+        # (date, (open, close) datetimes or None on a holiday) for is_market_open
+        self._today_schedule: Optional[tuple] = None
+        
         # Set base URLs based on trading mode
         self.base_urls = {
             TradingMode.PAPER: {
@@ -99,8 +352,12 @@ class AlpacaTradingClient:
                 "data": "https://data.alpaca.markets"
             }
         }
+        # Base URLs for the active mode, refreshed by switch_mode
+        self._bases = self.base_urls[credentials.mode]
         
-        # Set up authentication headers
+        # Set up authentication headers. These are written only here and in
+        # switch_mode; per-request calls never touch session headers, so
+        # change credentials through switch_mode rather than the session.
         self.session.headers.update({
             "APCA-API-KEY-ID": credentials.api_key_id,
             "APCA-API-SECRET-KEY": credentials.secret_key,
@@ -108,29 +365,54 @@ class AlpacaTradingClient:
             "User-Agent": "AlpacaTradingClient/1.0"
         })
         
-        # Validate connection on initialization
-        self._validate_connection()
+        # Validate connection on initialization unless deferred to first use.
+        # Credentials that passed once are not re-checked by switch_mode.
+        # _validated is set first so the account request isn't itself gated.
+        self._validated = not lazy_validation
+        self._validated_credentials = set()
+        if not lazy_validation:
+            self._validate_connection()
+            self._validated_credentials.add(credentials)
     
-    def _validate_connection(self) -> bool:
+    def validate_now(self) -> bool:
+        """Check the credentials immediately, raising ConnectionError if they are rejected"""
+        self._validated = True  # _validate_connection goes through _make_request
+        try:
+            account_info = self._validate_connection()
+        except ConnectionError:
+            self._validated = False
+            raise
+        self._validated_credentials.add(self.credentials)
+        # The validation fetch doubles as the first account read
+        self._cache[("account",)] = (time.monotonic(), account_info)
+        return True
+    
+    def _validate_connection(self) -> Dict[str, Any]:
         """Validate API connection and credentials"""
         try:
-            account_info = self.get_account()
+            account_info = self._make_request("v2/account")
             logger.info(f"Connected to Alpaca {self.credentials.mode.value} trading account: {account_info.get('id', 'Unknown')}")
-            return True
+            return account_info
         except Exception as e:
             logger.error(f"Failed to connect to Alpaca API: {str(e)}")
-            raise ConnectionError(f"Invalid Alpaca credentials or connection failed: {str(e)}")
+            raise ConnectionError(f"Invalid Alpaca credentials or connection failed: {str(e)}") from e
     
     def switch_mode(self, new_credentials: AlpacaCredentials):
         """
         Switch between paper and live trading modes
         
+        The session is shared across modes (it pools connections per host, so
+        both trading hosts stay warm) and credentials that were already
+        validated on this client are not checked again.
+        
         Args:
             new_credentials: New credentials for the target mode
         """
         logger.info(f"Switching from {self.credentials.mode.value} to {new_credentials.mode.value} mode")
         
         self.credentials = new_credentials
+        self._bases = self.base_urls[new_credentials.mode]
+        self.invalidate_cache()
         
         # Update authentication headers
         self.session.headers.update({
@@ -138,10 +420,68 @@ class AlpacaTradingClient:
             "APCA-API-SECRET-KEY": new_credentials.secret_key
         })
         
-        # Validate new connection
-        self._validate_connection()
+        # Validate new connection unless these credentials already passed
+        if new_credentials in self._validated_credentials:
+            self._validated = True
+        elif self.lazy_validation:
+            self._validated = False
+        else:
+            self.validate_now()
+    
+    def _cached_request(self, key: tuple, ttl: float, fetch) -> Any:
+        """Return the cached response for key if younger than ttl, else fetch and cache it"""
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        generation = self._cache_generation
+        value = fetch()
+        if generation == self._cache_generation:
+            self._cache[key] = (now, value)
+        return value
     
-    def _make_request(self, endpoint: str, method: str = "GET", params: Dict = None, data: Dict = None, api_type: str = "trading") -> Dict[str, Any]:
+    def invalidate_cache(self, *keys: tuple) -> None:
+        """Drop the given cache entries, or everything when no keys are given"""
+        self._cache_generation += 1
+        if not keys:
+            self._cache.clear()
+        for key in keys:
+            self._cache.pop(key, None)
+    
+    def _account_changing_request(self, endpoint: str, **kwargs) -> Any:
+        """
+        Make a request that changes the account (orders, closes, cancels)
+        
+        The cached account is dropped once the request completes, whether or
+        not it succeeded, so a get_account() from another thread while it is
+        in flight cannot re-cache the pre-order account.
+        """
+        try:
+            return self._make_request(endpoint, **kwargs)
+        finally:
+            self.invalidate_cache(("account",))
+    
+    def _store_validators(self, cache_key: tuple, response, result: Any) -> None:
+        """Remember a response's ETag / Last-Modified for conditional GETs"""
+        conditional = {}
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str):
+            conditional["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if isinstance(last_modified, str):
+            conditional["If-Modified-Since"] = last_modified
+        
+        self._validators.pop(cache_key, None)
+        if not conditional:
+            return
+        self._validators[cache_key] = (conditional, result)
+        if len(self._validators) > VALIDATOR_CACHE_SIZE:
+            del self._validators[next(iter(self._validators))]
+    
+    def _make_request(self, endpoint: str, method: str = "GET", params: Dict = None, data: Dict = None,
+                      api_type: str = "trading", cache_key: Optional[tuple] = None,
+                      max_retries: int = MAX_REQUEST_RETRIES,
+                      idempotent: Optional[bool] = None) -> Dict[str, Any]:
         """
         Make authenticated request to Alpaca API with rate limiting
         
@@ -151,59 +491,99 @@ class AlpacaTradingClient:
             params: Query parameters
             data: Request body data
             api_type: Either 'trading' or 'data'
+            cache_key: For GETs, key under which the response's ETag /
+                Last-Modified is kept; later calls send a conditional
+                request and reuse the stored body on 304 Not Modified
+            max_retries: Retries after a 429 (any method), or a 5xx response
+                or network failure (idempotent requests only)
+            idempotent: Whether resending after a 5xx or network failure is
+                safe; defaults by method. Pass False for DELETEs with side
+                effects such as position closes, which place sell orders
         """
-        # Check rate limit
-        can_request, wait_time = self.rate_tracker.check_rate_limit()
-        if not can_request:
-            logger.warning(f"Rate limit reached. Waiting {wait_time} seconds...")
-            time.sleep(wait_time)
+        verb = method.upper()
+        if verb not in HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        # Record the request
-        self.rate_tracker.record_request()
+        if not self._validated:
+            self.validate_now()
         
-        # Construct URL
-        base_url = self.base_urls[self.credentials.mode][api_type]
-        url = f"{base_url}/{endpoint}".rstrip("/")
+        # Construct URL and per-call arguments once for all attempts
+        url = self._bases[api_type] + "/" + endpoint
+        if idempotent is None:
+            idempotent = verb in IDEMPOTENT_METHODS
+        kwargs = {"params": params, "timeout": REQUEST_TIMEOUT}
+        if verb in BODY_METHODS:
+            kwargs["json"] = data
+        validated = None
+        if cache_key is not None and verb == "GET":
+            validated = self._validators.get(cache_key)
+            if validated is not None:
+                kwargs["headers"] = validated[0]
         
-        try:
-            # Make request
-            if method.upper() == "GET":
-                response = self.session.get(url, params=params, timeout=(3.05, 27))
-            elif method.upper() == "POST":
-                response = self.session.post(url, params=params, json=data, timeout=(3.05, 27))
-            elif method.upper() == "PUT":
-                response = self.session.put(url, params=params, json=data, timeout=(3.05, 27))
-            elif method.upper() == "DELETE":
-                response = self.session.delete(url, params=params, timeout=(3.05, 27))
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        for attempt in range(max_retries + 1):
+            # Check rate limit
+            can_request, wait_time = self.rate_tracker.check_rate_limit()
+            if not can_request:
+                logger.warning(f"Rate limit reached. Waiting {wait_time} seconds...")
+                time.sleep(wait_time)
+            
+            # Record the request
+            self.rate_tracker.record_request()
+            
+            try:
+                # Make request (looked up per attempt; the session can be swapped)
+                response = getattr(self.session, verb.lower())(url, **kwargs)
+            except requests.RequestException as e:
+                if idempotent and attempt < max_retries and not _transport_retried(e):
+                    delay = _backoff_delay(attempt)
+                    logger.warning(f"Request failed ({e}); retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                    continue
+                error_msg = f"Request failed after {attempt + 1} attempts: {str(e)}"
+                logger.error(error_msg)
+                raise ConnectionError(error_msg) from e
             
             # Handle response
+            if validated is not None and response.status_code == 304:
+                return validated[1]
             if response.ok:
                 try:
-                    return response.json()
+                    result = _decode_json(response)
                 except ValueError:
                     return {"status": "success", "data": response.text}
-            else:
-                # Handle error responses
-                try:
-                    error_data = response.json()
-                except ValueError:
-                    error_data = {"message": response.text}
-                
-                error_msg = f"Alpaca API error ({response.status_code}): {error_data.get('message', 'Unknown error')}"
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
-                
-        except requests.RequestException as e:
-            error_msg = f"Request failed: {str(e)}"
-            logger.error(error_msg)
-            raise ConnectionError(error_msg)
+                if cache_key is not None:
+                    self._store_validators(cache_key, response, result)
+                return result
+            
+            status = response.status_code
+            if attempt < max_retries and (status == 429 or (idempotent and status in RETRY_STATUSES)):
+                if status == 429:
+                    # Honour the server's Retry-After and hold the local bucket back as long
+                    delay = _retry_after(response)
+                    if delay is None:
+                        delay = _backoff_delay(attempt)
+                    self.rate_tracker.penalize(delay)
+                else:
+                    delay = _backoff_delay(attempt)
+                logger.warning(f"Alpaca API returned {status}; retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            
+            # Handle error responses
+            try:
+                error_data = _decode_json(response)
+            except ValueError:
+                error_data = {"message": response.text}
+            
+            error = AlpacaAPIError(status, error_data.get('message', 'Unknown error'))
+            logger.error(str(error))
+            raise error
     
     # Account Information Methods
     def get_account(self) -> Dict[str, Any]:
-        """Get account information"""
-        return self._make_request("v2/account")
+        """Get account information (cached for ACCOUNT_CACHE_TTL seconds)"""
+        return self._cached_request(("account",), ACCOUNT_CACHE_TTL,
+                                    lambda: self._make_request("v2/account"))
     
     def get_positions(self) -> List[Dict[str, Any]]:
         """Get all open positions"""
@@ -213,6 +593,21 @@ class AlpacaTradingClient:
         """Get position for a specific symbol"""
         return self._make_request(f"v2/positions/{symbol}")
     
+    def has_position(self, symbol: str) -> bool:
+        """
+        Check whether a position is open for a symbol
+        
+        Raises:
+            AlpacaAPIError: For any other error, including a 404 for an unknown symbol
+        """
+        try:
+            self.get_position(symbol)
+        except AlpacaAPIError as e:
+            if e.status_code == 404 and POSITION_NOT_FOUND_MESSAGE in e.message:
+                return False
+            raise
+        return True
+    
     def close_position(self, symbol: str, qty: Optional[str] = None, percentage: Optional[str] = None) -> Dict[str, Any]:
         """
         Close position for a symbol
@@ -222,28 +617,34 @@ class AlpacaTradingClient:
             qty: Quantity to close (optional, closes all if not specified)
             percentage: Percentage to close (optional)
         """
-        data = {}
+        # The API reads these as query parameters; DELETE requests carry no body
+        params = {}
         if qty:
-            data["qty"] = qty
+            params["qty"] = qty
         if percentage:
-            data["percentage"] = percentage
+            params["percentage"] = percentage
             
-        return self._make_request(f"v2/positions/{symbol}", method="DELETE", data=data)
+        # Closing places a sell order and the first request may already have
+        # gone through, so only a 429 (never processed) is retried
+        return self._account_changing_request(f"v2/positions/{symbol}", method="DELETE",
+                                              params=params or None, idempotent=False)
     
     def close_all_positions(self, cancel_orders: bool = False) -> List[Dict[str, Any]]:
         """Close all positions"""
         params = {"cancel_orders": str(cancel_orders).lower()}
-        return self._make_request("v2/positions", method="DELETE", params=params)
+        return self._account_changing_request("v2/positions", method="DELETE", params=params,
+                                              idempotent=False)
     
     # Order Management Methods
     def place_order(self, symbol: str, qty: Optional[str] = None, notional: Optional[str] = None, 
-                   side: OrderSide = OrderSide.BUY, order_type: OrderType = OrderType.MARKET,
-                   time_in_force: TimeInForce = TimeInForce.DAY, limit_price: Optional[str] = None,
+                   side: Union[OrderSide, str] = "buy", order_type: Union[OrderType, str] = "market",
+                   time_in_force: Union[TimeInForce, str] = "day", limit_price: Optional[str] = None,
                    stop_price: Optional[str] = None, trail_price: Optional[str] = None,
                    trail_percent: Optional[str] = None,
                    order_class: Optional[str] = None,
                    take_profit: Optional[Dict[str, Any]] = None,
-                   stop_loss: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                   stop_loss: Optional[Dict[str, Any]] = None,
+                   template: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Place a trading order
         
@@ -251,44 +652,36 @@ class AlpacaTradingClient:
             symbol: Stock symbol
             qty: Quantity of shares (use either qty or notional)
             notional: Dollar amount to trade (fractional shares)
-            side: Buy or sell
-            order_type: Market, limit, stop, or stop_limit
-            time_in_force: How long order remains active
+            side: Buy or sell (enum member or its string value)
+            order_type: Market, limit, stop, or stop_limit (enum member or string)
+            time_in_force: How long order remains active (enum member or string)
             limit_price: Limit price for limit orders
             stop_price: Stop price for stop orders
             trail_price: Trail amount for trailing stops
             trail_percent: Trail percentage for trailing stops
+            template: Pre-serialized side/type/time_in_force fields (e.g.
+                STOP_LOSS_TEMPLATE); overrides side, order_type and time_in_force
         """
         if not qty and not notional:
             raise ValueError("Either qty or notional must be specified")
         
-        data = {
-            "symbol": symbol,
-            "side": side.value,
-            "type": order_type.value,
-            "time_in_force": time_in_force.value
-        }
+        if template is not None:
+            data = {**template, "symbol": symbol}
+        else:
+            data = {
+                "symbol": symbol,
+                "side": _wire_value(side, _VALID_SIDES, "side"),
+                "type": _wire_value(order_type, _VALID_ORDER_TYPES, "order_type"),
+                "time_in_force": _wire_value(time_in_force, _VALID_TIME_IN_FORCE, "time_in_force")
+            }
         
-        if qty:
-            data["qty"] = qty
-        if notional:
-            data["notional"] = notional
-        if limit_price:
-            data["limit_price"] = limit_price
-        if stop_price:
-            data["stop_price"] = stop_price
-        if trail_price:
-            data["trail_price"] = trail_price
-        if trail_percent:
-            data["trail_percent"] = trail_percent
-        if order_class:
-            data["order_class"] = order_class
-        if take_profit:
-            data["take_profit"] = take_profit
-        if stop_loss:
-            data["stop_loss"] = stop_loss
-        
-        return self._make_request("v2/orders", method="POST", data=data)
+        optional = (("qty", qty), ("notional", notional), ("limit_price", limit_price),
+                    ("stop_price", stop_price), ("trail_price", trail_price),
+                    ("trail_percent", trail_percent), ("order_class", order_class),
+                    ("take_profit", take_profit), ("stop_loss", stop_loss))
+        data.update({key: value for key, value in optional if value})
+        
+        return self._account_changing_request("v2/orders", method="POST", data=data)
     
     def get_orders(self, status: str = "open", limit: int = 50, 
                    after: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -316,28 +709,60 @@ class AlpacaTradingClient:
         """Get specific order by ID"""
         return self._make_request(f"v2/orders/{order_id}")
     
+    def wait_for_order(self, order_id: str, timeout: float = 30.0,
+                       poll_interval: float = 0.25, max_interval: float = 2.0) -> Dict[str, Any]:
+        """
+        Wait until an order reaches a final status
+        
+        Polls with a short, growing interval so a quick fill is seen within a
+        fraction of a second instead of after a fixed sleep.
+        
+        Args:
+            order_id: Order ID to wait on
+            timeout: Maximum seconds to wait
+            poll_interval: Initial delay between polls
+            max_interval: Upper bound on the delay between polls
+            
+        Returns:
+            The latest order state (final unless the timeout elapsed)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            order = self.get_order(order_id)
+            remaining = deadline - time.monotonic()
+            if order.get("status") in ORDER_FINAL_STATUSES or remaining <= 0:
+                return order
+            time.sleep(min(poll_interval, remaining))
+            poll_interval = min(poll_interval * 2, max_interval)
+    
     def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """Cancel specific order"""
-        return self._make_request(f"v2/orders/{order_id}", method="DELETE")
+        return self._account_changing_request(f"v2/orders/{order_id}", method="DELETE")
     
     def cancel_all_orders(self) -> List[Dict[str, Any]]:
         """Cancel all open orders"""
-        return self._make_request("v2/orders", method="DELETE")
+        return self._account_changing_request("v2/orders", method="DELETE")
     
     # Market Data Methods
-    def get_bars(self, symbols: str, timeframe: str = "1Day", 
+    def get_bars(self, symbols: Union[str, Sequence[str]], timeframe: str = "1Day", 
                 start: Optional[str] = None, end: Optional[str] = None,
                 limit: int = 1000) -> Dict[str, Any]:
         """
         Get historical bars
         
         Args:
-            symbols: Comma-separated symbols
+            symbols: Comma-separated symbols, or a list which is split into
+                requests of MAX_SYMBOLS_PER_REQUEST and merged under "bars"
             timeframe: Bar timeframe (1Min, 5Min, 15Min, 1Hour, 1Day)
             start: Start date (YYYY-MM-DD)
             end: End date (YYYY-MM-DD)
             limit: Number of bars to return
         """
+        if not isinstance(symbols, str):
+            return self._chunked_symbols(
+                lambda chunk: self.get_bars(chunk, timeframe=timeframe, start=start, end=end, limit=limit),
+                symbols, "bars")
+        
         params = {
             "symbols": symbols,
             "timeframe": timeframe,
@@ -348,37 +773,184 @@ class AlpacaTradingClient:
         if end:
             params["end"] = end
             
-        return self._make_request("v2/stocks/bars", params=params, api_type="data")
+        return self._make_request("v2/stocks/bars", params=params, api_type="data",
+                                  cache_key=("bars", symbols, timeframe, start, end, limit))
     
-    def get_latest_quote(self, symbols: str) -> Dict[str, Any]:
-        """Get latest quote for symbols"""
+    def get_bars_multi(self, symbols: List[str], timeframe: str = "1Day",
+                       start: Optional[str] = None, end: Optional[str] = None,
+                       limit: int = 1000) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get historical bars for many symbols in one paginated request
+        
+        The API applies ``limit`` to the whole response rather than per symbol,
+        so pages are followed via ``next_page_token`` and each symbol is then
+        trimmed to its most recent ``limit`` bars.
+        
+        Args:
+            symbols: List of stock symbols
+            timeframe: Bar timeframe (1Min, 5Min, 15Min, 1Hour, 1Day)
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+            limit: Maximum number of bars to keep per symbol
+            
+        Returns:
+            Dict mapping each requested symbol to its list of bars
+        """
+        bars_by_symbol: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in symbols}
+        params = {
+            "symbols": ",".join(symbols),
+            "timeframe": timeframe,
+            "limit": 10000
+        }
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        
+        while True:
+            response = self._make_request("v2/stocks/bars", params=params, api_type="data")
+            for symbol, bars in (response.get("bars") or {}).items():
+                bars_by_symbol.setdefault(symbol, []).extend(bars)
+            
+            page_token = response.get("next_page_token")
+            if not page_token:
+                break
+            params["page_token"] = page_token
+        
+        return {symbol: bars[-limit:] for symbol, bars in bars_by_symbol.items()}
+    
+    def get_bars_stream(self, symbols: Union[str, Sequence[str]], timeframe: str = "1Day",
+                        start: Optional[str] = None, end: Optional[str] = None,
+                        page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over historical bars one page at a time
+        
+        Only the current page is held in memory, so large pulls can be fed
+        straight into e.g. ``pd.DataFrame.from_records(client.get_bars_stream(...))``
+        without first building the full symbol -> bars dict. Each yielded
+        bar has its symbol added under "S", as in the streaming API.
+        
+        Args:
+            symbols: Comma-separated symbols or a list of symbols
+            timeframe: Bar timeframe (1Min, 5Min, 15Min, 1Hour, 1Day)
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+            page_size: Bars requested per page (the API allows up to 10000)
+        """
+        params = {
+            "symbols": symbols if isinstance(symbols, str) else ",".join(symbols),
+            "timeframe": timeframe,
+            "limit": page_size
+        }
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        
+        while True:
+            response = self._make_request("v2/stocks/bars", params=params, api_type="data")
+            for symbol, bars in (response.get("bars") or {}).items():
+                for bar in bars:
+                    bar["S"] = symbol
+                    yield bar
+            
+            page_token = response.get("next_page_token")
+            if not page_token:
+                return
+            params["page_token"] = page_token
+    
+    def get_latest_quote(self, symbols: Union[str, Sequence[str]]) -> Dict[str, Any]:
+        """Get latest quote for symbols (comma-separated, or a list merged under "quotes")"""
+        if not isinstance(symbols, str):
+            return self._chunked_symbols(self.get_latest_quote, symbols, "quotes")
         params = {"symbols": symbols}
         return self._make_request("v2/stocks/quotes/latest", params=params, api_type="data")
     
-    def get_latest_trade(self, symbols: str) -> Dict[str, Any]:
-        """Get latest trade for symbols"""
+    def get_latest_trade(self, symbols: Union[str, Sequence[str]]) -> Dict[str, Any]:
+        """Get latest trade for symbols (comma-separated, or a list merged under "trades")"""
+        if not isinstance(symbols, str):
+            return self._chunked_symbols(self.get_latest_trade, symbols, "trades")
         params = {"symbols": symbols}
         return self._make_request("v2/stocks/trades/latest", params=params, api_type="data")
     
+    def _chunked_symbols(self, fetch, symbols: Sequence[str], key: str) -> Dict[str, Any]:
+        """
+        Fetch a list of symbols in MAX_SYMBOLS_PER_REQUEST chunks and merge
+        each response's per-symbol ``key`` mapping into one response
+        
+        Chunks are requested concurrently over the pooled session.
+        """
+        symbols = list(symbols)
+        chunks = [
+            ",".join(symbols[i:i + MAX_SYMBOLS_PER_REQUEST])
+            for i in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST)
+        ]
+        if len(chunks) <= 1:
+            responses = [fetch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(chunks))) as executor:
+                responses = list(executor.map(fetch, chunks))
+        
+        merged = {}
+        for response in responses:
+            merged.update(response.get(key) or {})
+        return {key: merged}
+    
     # Utility Methods
     def get_trading_calendar(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get trading calendar"""
+        """Get trading calendar (cached per date range for CALENDAR_CACHE_TTL seconds)"""
         params = {}
         if start:
             params["start"] = start
         if end:
             params["end"] = end
             
-        return self._make_request("v2/calendar", params=params)
+        return self._cached_request(("calendar", start, end), CALENDAR_CACHE_TTL,
+                                    lambda: self._make_request("v2/calendar", params=params or None,
+                                                               cache_key=("calendar", start, end)))
     
     def get_clock(self) -> Dict[str, Any]:
-        """Get market clock information"""
-        return self._make_request("v2/clock")
+        """Get market clock information (cached for CLOCK_CACHE_TTL seconds)"""
+        return self._cached_request(("clock",), CLOCK_CACHE_TTL,
+                                    lambda: self._make_request("v2/clock"))
+    
+    def _todays_schedule(self, now: datetime) -> Optional[tuple]:
+        """Return today's (open, close) datetimes, or None on a market holiday"""
+        today = now.date()
+        if self._today_schedule is None or self._today_schedule[0] != today:
+            day_str = today.isoformat()
+            calendar = self.get_trading_calendar(start=day_str, end=day_str)
+            day = next((entry for entry in calendar if entry.get("date") == day_str), None)
+            session = None
+            if day:
+                session = tuple(
+                    datetime.combine(today, datetime.strptime(day[key], "%H:%M").time(), tzinfo=MARKET_TIMEZONE)
+                    for key in ("open", "close")
+                )
+            self._today_schedule = (today, session)
+        return self._today_schedule[1]
     
     def is_market_open(self) -> bool:
-        """Check if market is currently open"""
-        clock = self.get_clock()
-        return clock.get("is_open", False)
+        """
+        Check if market is currently open
+        
+        Answers from today's trading calendar, fetched once per day. The
+        clock endpoint is only consulted within MARKET_BOUNDARY_SECONDS of
+        the open or close, or when the calendar can't be read.
+        """
+        now = datetime.now(MARKET_TIMEZONE)
+        try:
+            session = self._todays_schedule(now)
+        except Exception:
+            return self.get_clock().get("is_open", False)
+        if session is None:
+            return False
+        
+        open_at, close_at = session
+        boundary = timedelta(seconds=MARKET_BOUNDARY_SECONDS)
+        if abs(now - open_at) <= boundary or abs(now - close_at) <= boundary:
+            return self.get_clock().get("is_open", False)
+        return open_at <= now < close_at
     
     # Convenience Methods
     def buy_market(self, symbol: str, qty: str) -> Dict[str, Any]:
@@ -436,23 +1008,25 @@ class AlpacaTradingClient:
 
 
 # Example usage and configuration
-def create_paper_client(api_key_id: str, secret_key: str) -> AlpacaTradingClient:
+def create_paper_client(api_key_id: str, secret_key: str, http2: bool = False,
+                        lazy_validation: bool = False) -> AlpacaTradingClient:
     """Create paper trading client"""
     credentials = AlpacaCredentials(
         api_key_id=api_key_id,
         secret_key=secret_key,
         mode=TradingMode.PAPER
     )
-    return AlpacaTradingClient(credentials)
+    return AlpacaTradingClient(credentials, http2=http2, lazy_validation=lazy_validation)
 
-def create_live_client(api_key_id: str, secret_key: str) -> AlpacaTradingClient:
+def create_live_client(api_key_id: str, secret_key: str, http2: bool = False,
+                       lazy_validation: bool = False) -> AlpacaTradingClient:
     """Create live trading client"""
     credentials = AlpacaCredentials(
         api_key_id=api_key_id,
         secret_key=secret_key,
         mode=TradingMode.LIVE
     )
-    return AlpacaTradingClient(credentials)
+    return AlpacaTradingClient(credentials, http2=http2, lazy_validation=lazy_validation)
 
 if __name__ == "__main__":
     # Paper trading credentials
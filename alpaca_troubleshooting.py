@@ -6,6 +6,7 @@ Troubleshooting script for Alpaca API connection issues
 import os
 import requests
 import base64
+from concurrent.futures import ThreadPoolExecutor
 
 def check_credentials():
     """Check if credentials are properly configured"""
@@ -108,12 +109,19 @@ def check_network_connectivity():
         "https://data.alpaca.markets"
     ]
     
-    for url in urls_to_test:
+    def probe(url):
         try:
-            response = requests.get(url, timeout=5)
-            print(f"✓ {url} - Reachable (Status: {response.status_code})")
+            return url, session.get(url, timeout=5), None
         except requests.RequestException as e:
-            print(f"✗ {url} - Unreachable: {e}")
+            return url, None, e
+    
+    # Probe all hosts at once so the check takes the slowest probe, not the sum
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(urls_to_test)) as executor:
+        for url, response, error in executor.map(probe, urls_to_test):
+            if error is None:
+                print(f"✓ {url} - Reachable (Status: {response.status_code})")
+            else:
+                print(f"✗ {url} - Unreachable: {error}")
 
 def main():
     """Main troubleshooting function"""
@@ -2,253 +2,309 @@
 """
 Schema validation for Alpaca API responses and configuration using Pydantic models
 Prevents runtime KeyErrors and type errors as recommended in technical review
+
+Requires Pydantic v2, whose validation runs in the compiled pydantic-core
+extension (install the binary wheel). Model schemas are built when the
+classes are defined, so the first response validated pays no build cost.
 """
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, get_args, get_origin
 from datetime import datetime
-from decimal import Decimal
 import logging
-from pydantic import BaseModel, Field, field_validator, model_validator
+from functools import lru_cache
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from pydantic import ValidationError
 
+# Optional msgspec decoder for raw response bytes; Pydantic models remain the fallback
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 logger = logging.getLogger("ApiSchemas")
 
 class SchemaValidationError(Exception):
     """Raised when API response doesn't match expected schema"""
     pass
 
-# Pydantic Models for API Responses
+class DictAccessMixin:
+    """Adds dict-style reads to response models, so validated responses
+    support both ``m.id`` and ``m['id']`` without a wrapper object.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
 
-class AccountModel(BaseModel):
+    def unwrap(self):
+        """Return the model itself (kept for callers of the old accessor wrapper)."""
+        return self
+
+# Distinct payloads remembered by the memoizing validators
+VALIDATION_CACHE_SIZE = 128
+
+# Pydantic Models for API Responses
+# Alpaca sends most numbers as strings ("50000.00"). Fields are typed as plain
+# float/int so pydantic-core's lax mode coerces them natively, with no Python
+# validator callbacks or union dispatch per field. Order timestamps are parsed
+# to datetime once, at validation, by pydantic-core's ISO 8601 parser.
+#
+# Responses are read-only snapshots: unknown fields are dropped rather than
+# kept in a per-instance extras dict, and instances are frozen (hashable,
+# no assignment validation).
+_RESPONSE_MODEL_CONFIG = ConfigDict(extra='ignore', frozen=True)
+
+class AccountModel(DictAccessMixin, BaseModel):
     """Pydantic model for Alpaca account API response"""
     id: str = Field(..., description="Account ID")
     account_number: str = Field(..., description="Account number")
     status: str = Field(..., description="Account status")
     currency: Optional[str] = Field("USD", description="Account currency")
-    buying_power: Union[str, float, Decimal] = Field(..., description="Available buying power")
-    cash: Union[str, float, Decimal] = Field(..., description="Cash balance")
-    portfolio_value: Union[str, float, Decimal] = Field(..., description="Total portfolio value")
-    equity: Optional[Union[str, float, Decimal]] = Field(None, description="Current equity")
-    last_equity: Optional[Union[str, float, Decimal]] = Field(None, description="Previous equity")
-    multiplier: Optional[Union[str, int]] = Field(None, description="Account multiplier")
+    buying_power: float = Field(..., description="Available buying power")
+    cash: float = Field(..., description="Cash balance")
+    portfolio_value: float = Field(..., description="Total portfolio value")
+    equity: Optional[float] = Field(None, description="Current equity")
+    last_equity: Optional[float] = Field(None, description="Previous equity")
+    multiplier: Optional[int] = Field(None, description="Account multiplier")
     daytrade_count: Optional[int] = Field(None, description="Day trade count")
-    sma: Optional[Union[str, float, Decimal]] = Field(None, description="SMA value")
+    sma: Optional[float] = Field(None, description="SMA value")
     pattern_day_trader: Optional[bool] = Field(None, description="Pattern day trader flag")
     
-    @field_validator('buying_power', 'cash', 'portfolio_value', 'equity', 'last_equity', 'sma', mode='before')
-    def convert_numeric_strings(cls, v):
-        """Convert numeric strings to float"""
-        if isinstance(v, str):
-            try:
-                return float(v)
-            except ValueError:
-                return v
-        return v
-    
-    @field_validator('multiplier', mode='before')
-    def convert_multiplier(cls, v):
-        """Convert multiplier to int"""
-        if isinstance(v, str):
-            try:
-                return int(v)
-            except ValueError:
-                return v
-        return v
-    
-    class Config:
-        extra = "allow"  # Allow extra fields from API
-        validate_assignment = True
+    model_config = _RESPONSE_MODEL_CONFIG
 
-class PositionModel(BaseModel):
+class PositionModel(DictAccessMixin, BaseModel):
     """Pydantic model for Alpaca position API response"""
     asset_id: str = Field(..., description="Asset ID")
     symbol: str = Field(..., description="Stock symbol")
     exchange: Optional[str] = Field(None, description="Exchange")
     asset_class: str = Field(..., description="Asset class")
-    qty: Union[str, int] = Field(..., description="Position quantity")
-    avg_entry_price: Optional[Union[str, float, Decimal]] = Field(None, description="Average entry price")
-    avg_cost: Optional[Union[str, float, Decimal]] = Field(None, description="Average cost")
-    market_value: Optional[Union[str, float, Decimal]] = Field(None, description="Current market value")
-    cost_basis: Optional[Union[str, float, Decimal]] = Field(None, description="Cost basis")
-    unrealized_pl: Optional[Union[str, float, Decimal]] = Field(None, description="Unrealized P&L")
-    unrealized_plpc: Optional[Union[str, float, Decimal]] = Field(None, description="Unrealized P&L percentage")
-    unrealized_intraday_pl: Optional[Union[str, float, Decimal]] = Field(None, description="Unrealized intraday P&L")
-    unrealized_intraday_plpc: Optional[Union[str, float, Decimal]] = Field(None, description="Unrealized intraday P&L percentage")
-    current_price: Optional[Union[str, float, Decimal]] = Field(None, description="Current price")
-    lastday_price: Optional[Union[str, float, Decimal]] = Field(None, description="Previous day price")
-    change_today: Optional[Union[str, float, Decimal]] = Field(None, description="Today's change")
-    
-    @field_validator('qty', mode='before')
-    def convert_qty(cls, v):
-        """Convert quantity to int"""
-        if isinstance(v, str):
-            try:
-                return int(v)
-            except ValueError:
-                return v
-        return v
-    
-    @field_validator('avg_entry_price', 'avg_cost', 'market_value', 'cost_basis', 
-               'unrealized_pl', 'unrealized_plpc', 'unrealized_intraday_pl', 
-               'unrealized_intraday_plpc', 'current_price', 'lastday_price', 'change_today', mode='before')
-    def convert_numeric_strings(cls, v):
-        """Convert numeric strings to float"""
-        if isinstance(v, str):
-            try:
-                return float(v)
-            except ValueError:
-                return v
-        return v
-    
-    class Config:
-        extra = "allow"
-        validate_assignment = True
-
-class OrderModel(BaseModel):
+    qty: float = Field(..., description="Position quantity")
+    avg_entry_price: Optional[float] = Field(None, description="Average entry price")
+    avg_cost: Optional[float] = Field(None, description="Average cost")
+    market_value: Optional[float] = Field(None, description="Current market value")
+    cost_basis: Optional[float] = Field(None, description="Cost basis")
+    unrealized_pl: Optional[float] = Field(None, description="Unrealized P&L")
+    unrealized_plpc: Optional[float] = Field(None, description="Unrealized P&L percentage")
+    unrealized_intraday_pl: Optional[float] = Field(None, description="Unrealized intraday P&L")
+    unrealized_intraday_plpc: Optional[float] = Field(None, description="Unrealized intraday P&L percentage")
+    current_price: Optional[float] = Field(None, description="Current price")
+    lastday_price: Optional[float] = Field(None, description="Previous day price")
+    change_today: Optional[float] = Field(None, description="Today's change")
+    
+    model_config = _RESPONSE_MODEL_CONFIG
+
+class OrderModel(DictAccessMixin, BaseModel):
     """Pydantic model for Alpaca order API response"""
     id: str = Field(..., description="Order ID")
     client_order_id: str = Field(..., description="Client order ID")
-    created_at: str = Field(..., description="Order creation timestamp")
-    updated_at: Optional[str] = Field(None, description="Order update timestamp")
-    submitted_at: Optional[str] = Field(None, description="Order submission timestamp")
-    filled_at: Optional[str] = Field(None, description="Order fill timestamp")
-    expired_at: Optional[str] = Field(None, description="Order expiration timestamp")
-    canceled_at: Optional[str] = Field(None, description="Order cancellation timestamp")
-    failed_at: Optional[str] = Field(None, description="Order failure timestamp")
-    replaced_at: Optional[str] = Field(None, description="Order replacement timestamp")
+    created_at: datetime = Field(..., description="Order creation timestamp")
+    updated_at: Optional[datetime] = Field(None, description="Order update timestamp")
+    submitted_at: Optional[datetime] = Field(None, description="Order submission timestamp")
+    filled_at: Optional[datetime] = Field(None, description="Order fill timestamp")
+    expired_at: Optional[datetime] = Field(None, description="Order expiration timestamp")
+    canceled_at: Optional[datetime] = Field(None, description="Order cancellation timestamp")
+    failed_at: Optional[datetime] = Field(None, description="Order failure timestamp")
+    replaced_at: Optional[datetime] = Field(None, description="Order replacement timestamp")
     asset_id: str = Field(..., description="Asset ID")
     symbol: str = Field(..., description="Stock symbol")
     asset_class: str = Field(..., description="Asset class")
-    notional: Optional[Union[str, float, Decimal]] = Field(None, description="Notional amount")
-    qty: Optional[Union[str, int]] = Field(None, description="Order quantity")
-    filled_qty: Union[str, int] = Field(..., description="Filled quantity")
-    filled_avg_price: Optional[Union[str, float, Decimal]] = Field(None, description="Average fill price")
+    notional: Optional[float] = Field(None, description="Notional amount")
+    qty: Optional[float] = Field(None, description="Order quantity")
+    filled_qty: float = Field(..., description="Filled quantity")
+    filled_avg_price: Optional[float] = Field(None, description="Average fill price")
     order_class: str = Field(..., description="Order class")
     order_type: str = Field(..., description="Order type")
     type: str = Field(..., description="Order type (alias)")
     side: str = Field(..., description="Order side (buy/sell)")
     time_in_force: str = Field(..., description="Time in force")
-    limit_price: Optional[Union[str, float, Decimal]] = Field(None, description="Limit price")
-    stop_price: Optional[Union[str, float, Decimal]] = Field(None, description="Stop price")
+    limit_price: Optional[float] = Field(None, description="Limit price")
+    stop_price: Optional[float] = Field(None, description="Stop price")
     status: str = Field(..., description="Order status")
     extended_hours: Optional[bool] = Field(None, description="Extended hours flag")
     legs: Optional[List[Dict]] = Field(None, description="Multi-leg order legs")
     
-    @field_validator('qty', 'filled_qty', mode='before')
-    def convert_qty(cls, v):
-        """Convert quantities to int"""
-        if isinstance(v, str):
-            try:
-                return int(v)
-            except ValueError:
-                return v
-        return v
-    
-    @field_validator('notional', 'filled_avg_price', 'limit_price', 'stop_price', mode='before')
-    def convert_numeric_strings(cls, v):
-        """Convert numeric strings to float"""
-        if isinstance(v, str):
-            try:
-                return float(v)
-            except ValueError:
-                return v
-        return v
-    
-    class Config:
-        extra = "allow"
-        validate_assignment = True
+    model_config = _RESPONSE_MODEL_CONFIG
 
-class BarModel(BaseModel):
+class BarModel(DictAccessMixin, BaseModel):
     """Pydantic model for Alpaca bar (price) data"""
     t: str = Field(..., description="Timestamp")
-    o: Union[str, float, Decimal] = Field(..., description="Open price")
-    h: Union[str, float, Decimal] = Field(..., description="High price")
-    l: Union[str, float, Decimal] = Field(..., description="Low price")
-    c: Union[str, float, Decimal] = Field(..., description="Close price")
-    v: Union[str, int] = Field(..., description="Volume")
+    o: float = Field(..., description="Open price")
+    h: float = Field(..., description="High price")
+    l: float = Field(..., description="Low price")
+    c: float = Field(..., description="Close price")
+    v: int = Field(..., description="Volume")
     n: Optional[int] = Field(None, description="Trade count")
-    vw: Optional[Union[str, float, Decimal]] = Field(None, description="Volume weighted average price")
-    
-    @field_validator('o', 'h', 'l', 'c', 'vw', mode='before')
-    def convert_prices(cls, v):
-        """Convert price strings to float"""
-        if isinstance(v, str):
-            try:
-                return float(v)
-            except ValueError:
-                return v
-        return v
+    vw: Optional[float] = Field(None, description="Volume weighted average price")
     
-    @field_validator('v', mode='before')
-    def convert_volume(cls, v):
-        """Convert volume to int"""
-        if isinstance(v, str):
-            try:
-                return int(v)
-            except ValueError:
-                return v
-        return v
-    
-    class Config:
-        extra = "allow"
-        validate_assignment = True
+    model_config = _RESPONSE_MODEL_CONFIG
 
-class BarsResponseModel(BaseModel):
+class BarsResponseModel(DictAccessMixin, BaseModel):
     """Pydantic model for Alpaca bars API response"""
     bars: Dict[str, List[BarModel]] = Field(..., description="Bars data by symbol")
     symbol: Optional[str] = Field(None, description="Symbol")
     timeframe: Optional[str] = Field(None, description="Timeframe")
     next_page_token: Optional[str] = Field(None, description="Next page token")
     
-    class Config:
-        extra = "allow"
-        validate_assignment = True
+    model_config = _RESPONSE_MODEL_CONFIG
+
+# List adapters validate whole collection responses inside pydantic-core
+_POSITIONS_ADAPTER = TypeAdapter(List[PositionModel])
+_ORDERS_ADAPTER = TypeAdapter(List[OrderModel])
+
+# msgspec Structs mirroring the response models above. Numeric fields are typed
+# natively and decoded with strict=False, so Alpaca's numeric strings are coerced
+# in C while decoding. Quantities are floats because Alpaca reports fractional
+# shares.
+
+if MSGSPEC_AVAILABLE:
+    class _AccessStruct(msgspec.Struct):
+        """Struct base with the same dict-style reads as DictAccessMixin"""
+
+        def __getitem__(self, key: str):
+            return getattr(self, key)
+
+        def unwrap(self):
+            return self
+
+    class AccountStruct(_AccessStruct, kw_only=True, omit_defaults=True, frozen=True):
+        """msgspec mirror of AccountModel"""
+        id: str
+        account_number: str
+        status: str
+        currency: Optional[str] = "USD"
+        buying_power: float
+        cash: float
+        portfolio_value: float
+        equity: Optional[float] = None
+        last_equity: Optional[float] = None
+        multiplier: Optional[int] = None
+        daytrade_count: Optional[int] = None
+        sma: Optional[float] = None
+        pattern_day_trader: Optional[bool] = None
+
+    class PositionStruct(_AccessStruct, kw_only=True, omit_defaults=True, frozen=True):
+        """msgspec mirror of PositionModel"""
+        asset_id: str
+        symbol: str
+        exchange: Optional[str] = None
+        asset_class: str
+        qty: float
+        avg_entry_price: Optional[float] = None
+        avg_cost: Optional[float] = None
+        market_value: Optional[float] = None
+        cost_basis: Optional[float] = None
+        unrealized_pl: Optional[float] = None
+        unrealized_plpc: Optional[float] = None
+        unrealized_intraday_pl: Optional[float] = None
+        unrealized_intraday_plpc: Optional[float] = None
+        current_price: Optional[float] = None
+        lastday_price: Optional[float] = None
+        change_today: Optional[float] = None
+
+    class OrderStruct(_AccessStruct, kw_only=True, omit_defaults=True, frozen=True):
+        """msgspec mirror of OrderModel"""
+        id: str
+        client_order_id: str
+        created_at: datetime
+        updated_at: Optional[datetime] = None
+        submitted_at: Optional[datetime] = None
+        filled_at: Optional[datetime] = None
+        expired_at: Optional[datetime] = None
+        canceled_at: Optional[datetime] = None
+        failed_at: Optional[datetime] = None
+        replaced_at: Optional[datetime] = None
+        asset_id: str
+        symbol: str
+        asset_class: str
+        notional: Optional[float] = None
+        qty: Optional[float] = None
+        filled_qty: float
+        filled_avg_price: Optional[float] = None
+        order_class: str
+        order_type: str
+        type: str
+        side: str
+        time_in_force: str
+        limit_price: Optional[float] = None
+        stop_price: Optional[float] = None
+        status: str
+        extended_hours: Optional[bool] = None
+        legs: Optional[List[Dict]] = None
+
+    class BarStruct(_AccessStruct, kw_only=True, omit_defaults=True, frozen=True):
+        """msgspec mirror of BarModel"""
+        t: str
+        o: float
+        h: float
+        l: float
+        c: float
+        v: int
+        n: Optional[int] = None
+        vw: Optional[float] = None
+
+    # Response model -> msgspec Struct; decoders are built once and reused
+    STRUCT_REGISTRY = {
+        AccountModel: AccountStruct,
+        PositionModel: PositionStruct,
+        OrderModel: OrderStruct,
+        BarModel: BarStruct,
+    }
+    _STRUCT_DECODERS = {
+        model: msgspec.json.Decoder(struct, strict=False)
+        for model, struct in STRUCT_REGISTRY.items()
+    }
+else:
+    STRUCT_REGISTRY = {}
+    _STRUCT_DECODERS = {}
 
 # Enhanced validation functions using Pydantic models
 
-class _ModelAccessor:
-    """Lightweight wrapper to allow both attribute and dict-style access
-    to validated Pydantic models without changing downstream code expectations.
-
-    Example:
-        m = _ModelAccessor(AccountModel(**data))
-        m.id == m['id']  # True
-    """
-
-    def __init__(self, model: BaseModel):
-        self._model = model
-
-    def __getattr__(self, name: str):
-        return getattr(self._model, name)
-
-    def __getitem__(self, key: str):
-        return getattr(self._model, key)
-
-    def __repr__(self) -> str:
-        return f"ModelAccessor({self._model.__class__.__name__}): {self._model!r}"
-
-    def unwrap(self) -> BaseModel:
-        """Return the underlying Pydantic model instance."""
-        return self._model
-
-
-def validate_pydantic_model(model_class: BaseModel, data: Dict[str, Any]) -> _ModelAccessor:
+@lru_cache(maxsize=None)
+def _trusted_coercions(model_class: BaseModel) -> Dict[str, Any]:
+    """Map each float/int/datetime (or Optional) field of a model to its string converter, computed once per model"""
+    coercions = {}
+    for name, field in model_class.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), None)
+        if annotation in (float, int):
+            coercions[name] = annotation
+        elif annotation is datetime:
+            coercions[name] = datetime.fromisoformat
+    return coercions
+
+def validate_pydantic_model(model_class: BaseModel, data: Dict[str, Any], trusted: bool = False) -> BaseModel:
     """
     Validate data against a Pydantic model
     
     Args:
         model_class: Pydantic model class to validate against
         data: Data dictionary to validate
+        trusted: Data has a known-good shape (read back from our own cache,
+            or straight from Alpaca's JSON); numeric and timestamp strings are converted
+            and the model is built with model_construct, skipping validation
         
     Returns:
-        Validated model wrapped in _ModelAccessor for attribute and item access
+        Validated model instance (supports attribute and item access)
         
     Raises:
         SchemaValidationError: If validation fails
     """
+    if trusted:
+        coercions = _trusted_coercions(model_class)
+        try:
+            values = {
+                key: coercions[key](value) if key in coercions and type(value) is str else value
+                for key, value in data.items()
+            }
+        except ValueError as e:
+            raise SchemaValidationError(f"Trusted data for {model_class.__name__} could not be converted: {e}") from e
+        return model_class.model_construct(**values)
     try:
-        model = model_class(**data)
-        return _ModelAccessor(model)  # supports both obj.attr and obj['attr'] access styles
+        return model_class.model_validate(data)
     except ValidationError as e:
         error_msg = f"Pydantic validation failed for {model_class.__name__}: {str(e)}"
         logger.error(error_msg)
@@ -258,47 +314,71 @@ def validate_pydantic_model(model_class: BaseModel, data: Dict[str, Any]) -> _Mo
         logger.error(error_msg)
         raise SchemaValidationError(error_msg) from e
 
-def validate_field(data: Dict, field: str, expected_type: type, required: bool = True) -> Any:
+def decode_api_bytes(model_class: BaseModel, raw: Union[bytes, str]) -> Any:
     """
-    Legacy validate field function - kept for backwards compatibility
-    Use Pydantic models for new validations
-    
+    Decode and validate a raw JSON response body in one pass
+
+    Polled endpoints often return byte-identical bodies, so results are
+    memoized by body; a repeated body returns the same frozen instance.
+
+    Uses the msgspec Struct decoder for the model when msgspec is installed,
+    otherwise the Pydantic model parses and validates the JSON in a single
+    pydantic-core pass. Either way the result is an instance of
+    ``model_class``: decoded Structs are already validated, so their fields
+    are moved into the model with model_construct.
+
     Args:
-        data: API response data
-        field: Field name to validate  
-        expected_type: Expected Python type
-        required: Whether field is required
-        
+        model_class: Pydantic model class describing the response
+        raw: Response body (e.g. response.content)
+
     Returns:
-        Field value if valid
-        
+        Validated model instance
+
     Raises:
-        SchemaValidationError: If validation fails
+        SchemaValidationError: If decoding or validation fails
     """
-    if field not in data:
-        if required:
-            raise SchemaValidationError(f"Required field '{field}' missing from API response")
-        return None
-    
-    value = data[field]
-    
-    # Handle None values
-    if value is None and not required:
-        return None
-    
-    # Type validation with special handling for numeric strings
-    if expected_type in (int, float) and isinstance(value, str):
+    try:
+        return _decode_memoized(model_class, raw)
+    except TypeError:
+        # Unhashable body (e.g. bytearray)
+        return _decode_memoized.__wrapped__(model_class, raw)
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _decode_memoized(model_class: BaseModel, raw: Union[bytes, str]) -> Any:
+    decoder = _STRUCT_DECODERS.get(model_class)
+    if decoder is None:
         try:
-            return expected_type(value)
-        except ValueError:
-            raise SchemaValidationError(f"Field '{field}' value '{value}' cannot be converted to {expected_type.__name__}")
-    
-    if not isinstance(value, expected_type):
-        raise SchemaValidationError(f"Field '{field}' expected {expected_type.__name__}, got {type(value).__name__}")
-    
-    return value
+            return model_class.model_validate_json(raw)
+        except ValidationError as e:
+            error_msg = f"Pydantic validation failed for {model_class.__name__}: {str(e)}"
+            logger.error(error_msg)
+            raise SchemaValidationError(error_msg) from e
 
-def validate_account_schema(data: Dict[str, Any]) -> _ModelAccessor:
+    try:
+        struct = decoder.decode(raw)
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        error_msg = f"msgspec validation failed for {model_class.__name__}: {str(e)}"
+        logger.error(error_msg)
+        raise SchemaValidationError(error_msg) from e
+    return model_class.model_construct(**msgspec.structs.asdict(struct))
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_items(model_class: BaseModel, items: tuple) -> BaseModel:
+    return validate_pydantic_model(model_class, dict(items))
+
+def _validate_memoized(model_class: BaseModel, data: Dict[str, Any]) -> BaseModel:
+    """Validate through a cache keyed by payload content.
+
+    Account, position and order payloads are polled and often repeat
+    unchanged; models are frozen, so a cached instance can be shared.
+    Payloads with nested lists/dicts are unhashable and validate directly.
+    """
+    try:
+        return _validate_items(model_class, tuple(data.items()))
+    except TypeError:
+        return validate_pydantic_model(model_class, data)
+
+def validate_account_schema(data: Dict[str, Any]) -> BaseModel:
     """Validate account API response schema using Pydantic model.
 
     Provides a clearer error message for missing required identifier field
@@ -306,37 +386,33 @@ def validate_account_schema(data: Dict[str, Any]) -> _ModelAccessor:
     """
     if 'id' not in data:
         raise SchemaValidationError("Required field 'id' missing from API response")
-    return validate_pydantic_model(AccountModel, data)
+    return _validate_memoized(AccountModel, data)
 
-def validate_position_schema(data: Dict[str, Any]) -> _ModelAccessor:
+def validate_position_schema(data: Dict[str, Any]) -> BaseModel:
     """Validate position API response schema using Pydantic model"""
-    return validate_pydantic_model(PositionModel, data)
+    return _validate_memoized(PositionModel, data)
 
-def validate_order_schema(data: Dict[str, Any]) -> _ModelAccessor:
+def validate_order_schema(data: Dict[str, Any]) -> BaseModel:
     """Validate order API response schema using Pydantic model"""
-    return validate_pydantic_model(OrderModel, data)
+    return _validate_memoized(OrderModel, data)
 
-def validate_bar_schema(data: Dict[str, Any]) -> _ModelAccessor:
+def validate_bar_schema(data: Dict[str, Any]) -> BaseModel:
     """Validate bar (price) data schema using Pydantic model"""
     return validate_pydantic_model(BarModel, data)
 
-def validate_bars_response(data: Dict[str, Any]) -> _ModelAccessor:
-    """Validate bars API response schema using Pydantic model"""
-    # Pre-process bars: ensure lists of dicts and build BarModel instances (not wrapped)
-    if 'bars' in data:
-        validated_bars: Dict[str, List[BarModel]] = {}
-        for symbol, bars in data['bars'].items():
-            if not isinstance(bars, list):
-                raise SchemaValidationError(f"Bars for symbol '{symbol}' must be a list")
-            validated_symbol_bars: List[BarModel] = []
-            for bar in bars:
-                if not isinstance(bar, dict):
-                    raise SchemaValidationError("Each bar must be a dictionary")
-                # Create actual BarModel so nested validation in BarsResponseModel works
-                validated_symbol_bars.append(BarModel(**bar))
-            validated_bars[symbol] = validated_symbol_bars
-        data['bars'] = validated_bars
-    
+def validate_cached_bar(data: Dict[str, Any]) -> BaseModel:
+    """Wrap a bar read back from our own cache without re-validating it.
+
+    Cached bars were validated (and their numbers coerced) before they were
+    stored, so the trusted model_construct path is safe here.
+    """
+    return validate_pydantic_model(BarModel, data, trusted=True)
+
+def validate_bars_response(data: Dict[str, Any]) -> BaseModel:
+    """Validate bars API response schema using Pydantic model
+
+    The response and every nested bar are validated in one pydantic-core pass.
+    """
     return validate_pydantic_model(BarsResponseModel, data)
 
 def safe_get(data: Dict[str, Any], key: str, default: Any = None, expected_type: type = None) -> Any:
@@ -370,6 +446,30 @@ def safe_get(data: Dict[str, Any], key: str, default: Any = None, expected_type:
     
     return value
 
+def safe_get_float(data: Dict[str, Any], key: str, default: float = 0.0) -> float:
+    """Hot-path safe_get(data, key, default, float): no logging, no type dispatch"""
+    value = data.get(key)
+    if value is None:
+        return default
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+def safe_get_int(data: Dict[str, Any], key: str, default: int = 0) -> int:
+    """Hot-path safe_get(data, key, default, int): no logging, no type dispatch"""
+    value = data.get(key)
+    if value is None:
+        return default
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
 def model_to_dict(model: BaseModel, exclude_none: bool = True) -> Dict[str, Any]:
     """
     Convert Pydantic model to dictionary
@@ -381,60 +481,89 @@ def model_to_dict(model: BaseModel, exclude_none: bool = True) -> Dict[str, Any]
     Returns:
         Dictionary representation of the model
     """
-    if exclude_none:
-        return model.dict(exclude_none=True)
-    return model.dict()
+    return model.model_dump(exclude_none=exclude_none)
 
-def validate_positions_list(data: List[Dict[str, Any]]) -> List[_ModelAccessor]:
-    """Validate a list of positions using Pydantic models"""
-    if not isinstance(data, list):
-        raise SchemaValidationError("Positions response must be a list")
+def model_to_json(model: BaseModel, exclude_none: bool = True) -> str:
+    """
+    Serialize Pydantic model straight to a JSON string
     
-    validated_positions: List[_ModelAccessor] = []
-    for i, position in enumerate(data):
-        try:
-            validated_positions.append(validate_position_schema(position))
-        except SchemaValidationError as e:
-            logger.error(f"Validation failed for position {i}: {e}")
-            raise SchemaValidationError(f"Position {i} validation failed: {e}")
+    Skips the intermediate dictionary that json.dumps(model_to_dict(model))
+    would build; use it when the model is only being re-serialized.
     
-    return validated_positions
+    Args:
+        model: Pydantic model instance
+        exclude_none: Whether to exclude None values
+        
+    Returns:
+        JSON representation of the model
+    """
+    return model.model_dump_json(exclude_none=exclude_none)
 
-def validate_orders_list(data: List[Dict[str, Any]]) -> List[_ModelAccessor]:
-    """Validate a list of orders using Pydantic models"""
+def _validate_list(adapter: TypeAdapter, data: List[Dict[str, Any]], label: str) -> List[BaseModel]:
+    """Validate a whole response list in one pydantic-core pass"""
     if not isinstance(data, list):
-        raise SchemaValidationError("Orders response must be a list")
-    
-    validated_orders: List[_ModelAccessor] = []
-    for i, order in enumerate(data):
-        try:
-            validated_orders.append(validate_order_schema(order))
-        except SchemaValidationError as e:
-            logger.error(f"Validation failed for order {i}: {e}")
-            raise SchemaValidationError(f"Order {i} validation failed: {e}")
-    
-    return validated_orders
+        raise SchemaValidationError(f"{label}s response must be a list")
+    try:
+        return adapter.validate_python(data)
+    except ValidationError as e:
+        # Report the first failing item by index, as per-item validation did
+        index = e.errors()[0]['loc'][0]
+        logger.error(f"Validation failed for {label.lower()} {index}: {e}")
+        raise SchemaValidationError(f"{label} {index} validation failed: {e}") from e
+
+def validate_positions_list(data: List[Dict[str, Any]]) -> List[BaseModel]:
+    """Validate a list of positions using Pydantic models"""
+    return _validate_list(_POSITIONS_ADAPTER, data, "Position")
 
-# Schema registry mapping API endpoints to validators
-SCHEMA_VALIDATORS = {
+def validate_orders_list(data: List[Dict[str, Any]]) -> List[BaseModel]:
+    """Validate a list of orders using Pydantic models"""
+    return _validate_list(_ORDERS_ADAPTER, data, "Order")
+
+# Schema registry mapping API endpoints to validators. Registries are read-only:
+# endpoint resolution is cached, so runtime changes would not apply consistently.
+SCHEMA_VALIDATORS = MappingProxyType({
     'account': validate_account_schema,
     'position': validate_position_schema,
     'order': validate_order_schema,
     'bars': validate_bars_response,
     'positions': validate_positions_list,
     'orders': validate_orders_list,
-}
+})
 
 # Model registry for direct model access
-MODEL_REGISTRY = {
+MODEL_REGISTRY = MappingProxyType({
     'account': AccountModel,
     'position': PositionModel,
     'order': OrderModel,
     'bar': BarModel,
     'bars_response': BarsResponseModel,
-}
-
-def validate_api_response(endpoint: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[_ModelAccessor, List[_ModelAccessor]]:
+})
+
+# Endpoint fragment -> schema type, checked in order against the lowercased endpoint
+_ENDPOINT_SCHEMA_TYPES = (
+    ('account', 'account'),
+    ('position', 'position'),
+    ('order', 'order'),
+    ('bars', 'bars'),
+    ('market-data', 'bars'),
+)
+
+# Collection endpoints whose list responses are validated item by item
+_LIST_ENDPOINT_VALIDATORS = MappingProxyType({
+    'v2/positions': validate_positions_list,
+    'v2/orders': validate_orders_list,
+})
+
+@lru_cache(maxsize=256)
+def _endpoint_validator(endpoint: str):
+    """Resolve (once per distinct endpoint) the validator for its responses"""
+    endpoint = endpoint.lower()
+    for fragment, schema_type in _ENDPOINT_SCHEMA_TYPES:
+        if fragment in endpoint:
+            return SCHEMA_VALIDATORS[schema_type]
+    return None
+
+def validate_api_response(endpoint: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[BaseModel, List[BaseModel]]:
     """
     Validate API response against appropriate Pydantic schema
     
@@ -450,10 +579,10 @@ def validate_api_response(endpoint: str, data: Union[Dict[str, Any], List[Dict[s
     """
     try:
         # Handle special cases for list endpoints
-        if endpoint in ['v2/positions', '/v2/positions'] and isinstance(data, list):
-            return validate_positions_list(data)
-        elif endpoint in ['v2/orders', '/v2/orders'] and isinstance(data, list):
-            return validate_orders_list(data)
+        if isinstance(data, list):
+            list_validator = _LIST_ENDPOINT_VALIDATORS.get(endpoint.lstrip('/'))
+            if list_validator is not None:
+                return list_validator(data)
         
         # Handle single item endpoints
         if isinstance(data, list) and len(data) == 1:
@@ -464,19 +593,8 @@ def validate_api_response(endpoint: str, data: Union[Dict[str, Any], List[Dict[s
             logger.warning(f"Expected dict for endpoint {endpoint}, got {type(data).__name__}")
             return data
         
-        # Determine schema type from endpoint
-        schema_type = None
-        if 'account' in endpoint.lower():
-            schema_type = 'account'
-        elif 'position' in endpoint.lower():
-            schema_type = 'position'
-        elif 'order' in endpoint.lower():
-            schema_type = 'order'
-        elif 'bars' in endpoint.lower() or 'market-data' in endpoint.lower():
-            schema_type = 'bars'
-        
-        if schema_type and schema_type in SCHEMA_VALIDATORS:
-            validator = SCHEMA_VALIDATORS[schema_type]
+        validator = _endpoint_validator(endpoint)
+        if validator is not None:
             return validator(data)
         
         # No specific validator, log warning and return data as-is
@@ -487,23 +605,25 @@ def validate_api_response(endpoint: str, data: Union[Dict[str, Any], List[Dict[s
         logger.error(f"Validation error for endpoint {endpoint}: {str(e)}")
         raise SchemaValidationError(f"API response validation failed for {endpoint}: {str(e)}")
 
-def safe_validate(model_class: BaseModel, data: Dict[str, Any], fallback_value=None) -> Union[_ModelAccessor, Any]:
+def safe_validate(model_class: BaseModel, data: Dict[str, Any], fallback_value=None) -> Union[BaseModel, Any]:
     """
     Safely validate data against a Pydantic model with fallback
     
     Args:
         model_class: Pydantic model class
         data: Data to validate
-        fallback_value: Value to return if validation fails
+        fallback_value: Value to return if validation fails (default None)
         
     Returns:
-        Validated model instance or fallback value
+        Validated model instance, or fallback_value; the unvalidated input
+        is never returned, so callers can rely on getting a model or their
+        own sentinel
     """
     try:
         return validate_pydantic_model(model_class, data)
     except SchemaValidationError as e:
         logger.warning(f"Safe validation failed for {model_class.__name__}: {e}")
-        return fallback_value if fallback_value is not None else data
+        return fallback_value
 
 def validate_with_error_collection(data_list: List[Dict[str, Any]], model_class: BaseModel) -> tuple:
     """
@@ -516,22 +636,21 @@ def validate_with_error_collection(data_list: List[Dict[str, Any]], model_class:
     Returns:
         Tuple of (validated_items, errors)
     """
-    validated_items: List[_ModelAccessor] = []
+    validated_items: List[BaseModel] = []
     errors = []
+    validate = model_class.model_validate
+    append = validated_items.append
     
     for i, item in enumerate(data_list):
         try:
-            validated_item = validate_pydantic_model(model_class, item)
-            validated_items.append(validated_item)
-        except SchemaValidationError as e:
-            error_info = {
-                'index': i,
-                'data': item,
-                'error': str(e)
-            }
-            errors.append(error_info)
-            logger.warning(f"Item {i} validation failed: {e}")
-    
+            append(validate(item))
+        except ValidationError as e:
+            error = f"Pydantic validation failed for {model_class.__name__}: {e}"
+            errors.append({'index': i, 'data': item, 'error': error})
+    
+    if errors:
+        logger.warning(f"{len(errors)} of {len(data_list)} {model_class.__name__} items failed validation "
+                       f"(first at index {errors[0]['index']})")
     return validated_items, errors
 
 # Example usage and testing
@@ -6,11 +6,14 @@ Automated trading scheduler with safety controls
 import schedule
 import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, time as dtime
 from alpaca_trading_client import TradingMode
+from alpaca_config import get_client
 from advanced_trading_bot import AdvancedTradingBot
 from trading_strategies_config import TradingStrategy
 import threading
+import heapq
+from typing import Dict, List, Optional, Tuple
 
 # Set up logging
 logging.basicConfig(
@@ -23,6 +26,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("AutomatedTrading")
 
+# Seconds a shared watchlist bars batch is reused across strategy runs
+SHARED_BARS_TTL = 300
+
+# Strategy run times: momentum every half hour in the window, mean reversion on these hours
+MOMENTUM_WINDOW = (dtime(10, 0), dtime(15, 0))
+MEAN_REVERSION_HOURS = (11, 13, 15)
+
+# Upper bound on one scheduler sleep, so clock changes are noticed within an hour
+MAX_SCHEDULER_SLEEP = 3600
+
 class TradingScheduler:
     """
     Automated trading scheduler with safety controls
@@ -36,24 +49,49 @@ class TradingScheduler:
         self.trading_enabled = True
         self.last_portfolio_value = None
         
+        # One client (and connection pool) shared by both trading bots
+        self.client = get_client(mode)
+        
         # Trading bots
         self.momentum_bot = AdvancedTradingBot(
             mode=mode,
             strategy=TradingStrategy.MOMENTUM,
-            risk_level="moderate"
+            risk_level="moderate",
+            client=self.client
         )
         
         self.mean_reversion_bot = AdvancedTradingBot(
             mode=mode,
             strategy=TradingStrategy.MEAN_REVERSION,
-            risk_level="conservative"
+            risk_level="conservative",
+            client=self.client
         )
+        
+        # (timestamp, bars by symbol) for the union of both bots' watchlists
+        self._shared_bars: Optional[Tuple[float, Dict[str, List[Dict]]]] = None
+    
+    def get_shared_bars(self) -> Optional[Dict[str, List[Dict]]]:
+        """Daily bars for both bots' watchlists, fetched in one batch
+        
+        Runs that coincide (11:00, 13:00, 15:00) reuse the same batch instead
+        of each bot requesting its own. Returns None if the batch fails so
+        each bot falls back to fetching for itself.
+        """
+        now = time.time()
+        if self._shared_bars is not None and now - self._shared_bars[0] < SHARED_BARS_TTL:
+            return self._shared_bars[1]
+        symbols = list(dict.fromkeys(self.momentum_bot.watchlist + self.mean_reversion_bot.watchlist))
+        bars = self.momentum_bot.fetch_watchlist_bars(symbols)
+        if bars is not None:
+            self._shared_bars = (now, bars)
+        return bars
     
     def check_trading_conditions(self) -> bool:
         """Check if trading should continue based on safety rules"""
         
-        # Check if market is open
-        if not self.momentum_bot.client.is_market_open():
+        # Check if market is open (cached by the bot, so the scan that follows
+        # reuses this answer instead of asking again)
+        if not self.momentum_bot.is_market_open_cached():
             logger.info("Market is closed - skipping trading")
             return False
         
@@ -64,7 +102,7 @@ class TradingScheduler:
         
         # Check daily loss limit
         try:
-            account = self.momentum_bot.client.get_account()
+            account = self.momentum_bot.get_account_cached()
             current_portfolio_value = float(account['portfolio_value'])
             
             if self.last_portfolio_value is None:
@@ -96,7 +134,7 @@ class TradingScheduler:
             return
         
         try:
-            trades = self.momentum_bot.scan_and_trade()
+            trades = self.momentum_bot.scan_and_trade(prefetched_bars=self.get_shared_bars())
             
             if trades:
                 self.daily_trades_executed += len(trades)
@@ -121,7 +159,7 @@ class TradingScheduler:
             return
         
         try:
-            trades = self.mean_reversion_bot.scan_and_trade()
+            trades = self.mean_reversion_bot.scan_and_trade(prefetched_bars=self.get_shared_bars())
             
             if trades:
                 self.daily_trades_executed += len(trades)
@@ -138,12 +176,23 @@ class TradingScheduler:
         except Exception as e:
             logger.error(f"Error in mean reversion strategy: {e}")
     
+    def run_scheduled_momentum(self):
+        """Half-hourly job: run momentum inside its trading window only"""
+        now = datetime.now().time().replace(second=0, microsecond=0)
+        if MOMENTUM_WINDOW[0] <= now <= MOMENTUM_WINDOW[1]:
+            self.run_momentum_strategy()
+    
+    def run_scheduled_mean_reversion(self):
+        """Hourly job: run mean reversion at its scheduled hours only"""
+        if datetime.now().hour in MEAN_REVERSION_HOURS:
+            self.run_mean_reversion_strategy()
+    
     def daily_reset(self):
         """Reset daily counters and checks"""
         logger.info("Daily reset - resetting counters")
         
         try:
-            account = self.momentum_bot.client.get_account()
+            account = self.client.get_account()
             self.last_portfolio_value = float(account['portfolio_value'])
             self.daily_trades_executed = 0
             self.trading_enabled = True
@@ -176,7 +225,7 @@ class TradingScheduler:
         
         # Optionally cancel all open orders
         try:
-            cancelled_orders = self.momentum_bot.client.cancel_all_orders()
+            cancelled_orders = self.client.cancel_all_orders()
             logger.info(f"Cancelled {len(cancelled_orders)} open orders")
         except Exception as e:
             logger.error(f"Error cancelling orders: {e}")
@@ -187,22 +236,11 @@ def setup_trading_schedule(scheduler: TradingScheduler):
     
     # Market opens at 9:30 AM ET, avoid first 30 minutes
     # Run momentum strategy every 30 minutes during market hours
-    schedule.every().day.at("10:00").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("10:30").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("11:00").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("11:30").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("12:00").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("12:30").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("13:00").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("13:30").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("14:00").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("14:30").do(scheduler.run_momentum_strategy)
-    schedule.every().day.at("15:00").do(scheduler.run_momentum_strategy)
+    schedule.every().hour.at(":00").do(scheduler.run_scheduled_momentum)
+    schedule.every().hour.at(":30").do(scheduler.run_scheduled_momentum)
     
     # Run mean reversion less frequently (looking for oversold conditions)
-    schedule.every().day.at("11:00").do(scheduler.run_mean_reversion_strategy)
-    schedule.every().day.at("13:00").do(scheduler.run_mean_reversion_strategy)
-    schedule.every().day.at("15:00").do(scheduler.run_mean_reversion_strategy)
+    schedule.every().hour.at(":00").do(scheduler.run_scheduled_mean_reversion)
     
     # Daily reset before market open
     schedule.every().day.at("09:00").do(scheduler.daily_reset)
@@ -224,11 +262,12 @@ def run_scheduler():
     logger.info("  - Daily reset: 9:00 AM")
     logger.info("  - Daily report: 4:30 PM")
     
-    # Run scheduler
+    # Run scheduler, sleeping until the next job is due instead of polling
     while True:
         try:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            idle = schedule.idle_seconds()
+            time.sleep(60 if idle is None else min(max(idle, 0), MAX_SCHEDULER_SLEEP))
             
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user")
@@ -245,7 +284,6 @@ class ContinuousTrader:
     
     def __init__(self, mode: TradingMode = TradingMode.PAPER):
         self.mode = mode
-        self.last_scan_time = {}
         self.min_scan_interval = 300  # 5 minutes between scans
         self.trading_enabled = True
         
@@ -254,13 +292,16 @@ class ContinuousTrader:
             strategy=TradingStrategy.MOMENTUM,
             risk_level="moderate"
         )
-    
-    def should_scan(self, strategy: str) -> bool:
-        """Determine if enough time has passed to scan again"""
-        current_time = time.time()
-        last_scan = self.last_scan_time.get(strategy, 0)
         
-        return current_time - last_scan >= self.min_scan_interval
+        # Strategy name -> bot, and a min-heap of (monotonic due time, strategy)
+        # so the loop always sleeps until the earliest scan that is due
+        self.strategy_bots: Dict[str, AdvancedTradingBot] = {"momentum": self.momentum_bot}
+        self._scan_queue: List[Tuple[float, str]] = [(0.0, name) for name in self.strategy_bots]
+        heapq.heapify(self._scan_queue)
+    
+    def seconds_until_next_scan(self) -> float:
+        """Seconds until the earliest strategy scan is due (<= 0 when due)"""
+        return self._scan_queue[0][0] - time.monotonic()
     
     def continuous_trading_loop(self):
         """Main continuous trading loop with intelligent timing"""
@@ -269,22 +310,26 @@ class ContinuousTrader:
         while self.trading_enabled:
             try:
                 # Check if market is open
-                if not self.momentum_bot.client.is_market_open():
+                if not self.momentum_bot.is_market_open_cached():
                     logger.info("Market closed - waiting...")
                     time.sleep(300)  # Check every 5 minutes when market is closed
                     continue
                 
-                # Run momentum strategy
-                if self.should_scan("momentum"):
-                    logger.info("Running momentum scan...")
-                    trades = self.momentum_bot.scan_and_trade()
-                    self.last_scan_time["momentum"] = time.time()
-                    
-                    if trades:
-                        logger.info(f"Executed {len(trades)} momentum trades")
+                # Sleep until the next scan is due rather than waking every minute
+                wait = self.seconds_until_next_scan()
+                if wait > 0:
+                    time.sleep(wait)
+                    continue
+                
+                # Reschedule before running, so a failed scan is retried a full interval later
+                strategy = self._scan_queue[0][1]
+                heapq.heapreplace(self._scan_queue, (time.monotonic() + self.min_scan_interval, strategy))
+                
+                logger.info(f"Running {strategy} scan...")
+                trades = self.strategy_bots[strategy].scan_and_trade()
                 
-                # Sleep before next iteration
-                time.sleep(60)  # Check every minute during market hours
+                if trades:
+                    logger.info(f"Executed {len(trades)} {strategy} trades")
                 
             except KeyboardInterrupt:
                 logger.info("Continuous trading stopped by user")
@@ -0,0 +1,88 @@
+"""
+Per-day on-disk cache of completed daily bars so re-runs on the same day only
+request the still-forming bar for today's session.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+def _cache_file() -> Path:
+    data_dir = Path("data")
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir / "bar_cache.sqlite3"
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(_cache_file()))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS bars ("
+        "symbol TEXT NOT NULL, date TEXT NOT NULL, payload BLOB NOT NULL, "
+        "PRIMARY KEY (symbol, date))"
+    )
+    return conn
+
+
+def is_completed_bar(bar: Dict, day: Optional[date] = None) -> bool:
+    """Return True if ``bar`` belongs to a session before ``day`` (default today)."""
+    return str(bar.get("t", ""))[:10] < (day or date.today()).isoformat()
+
+
+def load_cached_bars(symbols: Iterable[str], day: Optional[date] = None) -> Dict[str, List[Dict]]:
+    """Load bars cached for ``day`` (default today) for the given symbols.
+
+    Symbols without a cached entry are simply absent from the result, and
+    an unreadable cache yields an empty dict so callers fetch everything.
+    """
+    symbols = list(symbols)
+    if not symbols:
+        return {}
+    day_key = (day or date.today()).isoformat()
+    placeholders = ",".join("?" * len(symbols))
+    try:
+        conn = _connect()
+        try:
+            rows = conn.execute(
+                f"SELECT symbol, payload FROM bars WHERE date = ? AND symbol IN ({placeholders})",
+                [day_key, *symbols],
+            ).fetchall()
+        finally:
+            conn.close()
+        return {symbol: json.loads(payload) for symbol, payload in rows}
+    except Exception:
+        return {}
+
+
+def store_bars(bars_by_symbol: Dict[str, List[Dict]], day: Optional[date] = None) -> None:
+    """Cache completed bars for ``day`` (default today) and drop entries from earlier days.
+
+    Today's bar is still forming while the market is open, so it is never
+    stored; symbols with no completed bars are skipped.
+    """
+    day = day or date.today()
+    day_key = day.isoformat()
+    completed = {
+        symbol: [bar for bar in bars if is_completed_bar(bar, day)]
+        for symbol, bars in bars_by_symbol.items()
+    }
+    completed = {symbol: bars for symbol, bars in completed.items() if bars}
+    if not completed:
+        return
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM bars WHERE date < ?", (day_key,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO bars (symbol, date, payload) VALUES (?, ?, ?)",
+                    [(symbol, day_key, json.dumps(bars)) for symbol, bars in completed.items()],
+                )
+        finally:
+            conn.close()
+    except Exception:
+        pass
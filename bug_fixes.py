@@ -3,6 +3,10 @@
 Bug fixes for the enhanced trading system based on user results
 """
 
+from typing import Dict
+
+from alpaca_trading_client import AlpacaAPIError
+
 # Fix 1: Handle 404 position errors gracefully
 def fixed_get_position_check(client, symbol):
     """
@@ -11,14 +15,16 @@ def fixed_get_position_check(client, symbol):
     try:
         position = client.get_position(symbol)
         return position
-    except Exception as e:
-        if "404" in str(e) or "position does not exist" in str(e):
+    except AlpacaAPIError as e:
+        if e.status_code == 404:
             # This is expected when no position exists
             return None
-        else:
-            # Log other unexpected errors
-            print(f"Unexpected error checking position for {symbol}: {e}")
-            return None
+        # Log other unexpected errors
+        print(f"Unexpected error checking position for {symbol}: {e}")
+        return None
+    except Exception as e:
+        print(f"Unexpected error checking position for {symbol}: {e}")
+        return None
 
 # Fix 2: Enhanced buy decision with proper error handling
 def fixed_enhanced_buy_decision(self, symbol: str, analysis: Dict = None) -> Dict:
@@ -78,10 +84,12 @@ def setup_better_logging():
     
     class NoPositionErrorFilter(logging.Filter):
         def filter(self, record):
+            # Format the message once; each getMessage() call re-applies the args
+            message = record.getMessage()
             # Filter out expected 404 position errors
-            if "404" in record.getMessage() and "position does not exist" in record.getMessage():
+            if "position does not exist" in message and "404" in message:
                 return False
-            if "potential wash trade detected" in record.getMessage():
+            if "potential wash trade detected" in message:
                 return False
             return True
     
@@ -90,27 +98,29 @@ def setup_better_logging():
     logger.addFilter(NoPositionErrorFilter())
 
 # Fix 5: Market data validation
+# Safe defaults for missing market data fields, resolved once from the original
+# name rules ('price' fields fall back to current_price, 'ratio' to 1.0,
+# 'change' to 0.0, anything else to 'Unknown')
+_CURRENT_PRICE = object()
+MARKET_DATA_DEFAULTS = {
+    'current_price': _CURRENT_PRICE,
+    'volume_ratio': 1.0,
+    'sma_5': 'Unknown',
+    'sma_20': 'Unknown',
+    'price_change_1d': _CURRENT_PRICE,
+    'price_change_5d': _CURRENT_PRICE,
+    'trend_signal': 'Unknown',
+}
+
 def validate_market_data(data: Dict) -> Dict:
     """
     Validate and clean market data to prevent issues
     """
-    required_fields = [
-        'current_price', 'volume_ratio', 'sma_5', 'sma_20', 
-        'price_change_1d', 'price_change_5d', 'trend_signal'
-    ]
-    
-    for field in required_fields:
+    for field, default in MARKET_DATA_DEFAULTS.items():
         if field not in data:
             print(f"Warning: Missing field {field} in market data")
             # Provide safe defaults
-            if 'price' in field:
-                data[field] = data.get('current_price', 0)
-            elif 'ratio' in field:
-                data[field] = 1.0
-            elif 'change' in field:
-                data[field] = 0.0
-            else:
-                data[field] = 'Unknown'
+            data[field] = data.get('current_price', 0) if default is _CURRENT_PRICE else default
     
     return data
 
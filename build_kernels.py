@@ -0,0 +1,36 @@
+# build_kernels.py
+"""
+Ahead-of-time compile the bot's numba kernels into the tradebot_kernels extension
+
+The daily runner is short-lived, so JIT-compiling on every start is a noticeable
+share of its runtime. Run this once per environment (and again after changing a
+kernel); advanced_trading_bot imports the compiled module when it is present and
+falls back to JIT or array math otherwise.
+
+Usage:
+    python build_kernels.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from advanced_trading_bot import _trend_strength_kernel
+
+
+def build(output_dir: str = None) -> None:
+    """Compile the exported kernels next to this file (or into output_dir)"""
+    cc = CC('tradebot_kernels')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.verbose = False
+
+    # Export the plain Python function; the njit dispatcher keeps it as py_func
+    kernel = getattr(_trend_strength_kernel, 'py_func', _trend_strength_kernel)
+    cc.export('trend_strength', 'f8(f8[:])')(kernel)
+
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
+    print("✓ Built tradebot_kernels")
@@ -0,0 +1,49 @@
+"""
+Rolling indicator state persisted across runs so daily SMAs update incrementally.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict
+
+
+def _state_file() -> Path:
+    data_dir = Path("data")
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir / "indicator_state.json"
+
+
+def load_indicator_state() -> Dict[str, Dict]:
+    """Load persisted rolling SMA windows keyed by symbol.
+
+    Returns a mapping of ``symbol -> {"t": last_bar_timestamp,
+    "windows": {period: [closes...]}}``. Missing or unreadable state
+    yields an empty dict so callers simply rebuild from bars.
+    """
+    path = _state_file()
+    if not path.exists():
+        return {}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            state = json.load(f)
+    except Exception:
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_indicator_state(state: Dict[str, Dict]) -> None:
+    """Persist rolling SMA windows keyed by symbol.
+
+    Entries are merged into the state already on disk, so bots sharing the
+    file with different watchlists do not drop each other's symbols.
+    """
+    merged = load_indicator_state()
+    merged.update(state)
+    path = _state_file()
+    try:
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(merged, f)
+    except Exception:
+        pass
@@ -3,8 +3,11 @@
 Centralized logging configuration for specialized trading logs
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import re
 from datetime import datetime
 
@@ -91,7 +94,13 @@ class TradingLoggers:
             'trading_bot':          'trading_bot.log'
         }
         
-        # Create loggers with file handlers
+        # Loggers only enqueue records; a single background listener owns the
+        # file handlers so disk writes never block the trading thread(s)
+        self._stop_listener()
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        file_handlers = []
+        
         for logger_name, filename in logger_configs.items():
             logger = logging.getLogger(logger_name)
             logger.setLevel(logging.INFO)
@@ -99,17 +108,34 @@ class TradingLoggers:
             # Clear any existing handlers to avoid duplicates
             logger.handlers.clear()
             
-            # Create file handler
+            # Create file handler, routed by logger name from the shared queue
             handler = logging.FileHandler(
                 os.path.join(self.log_dir, filename),
                 mode='a',  # Append mode
                 encoding='utf-8'
             )
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
+            handler.addFilter(logging.Filter(logger_name))
+            file_handlers.append(handler)
+            logger.addHandler(queue_handler)
             
             # Prevent propagation to avoid duplicate logs in main logger
             logger.propagate = False
+        
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *file_handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._stop_listener)
+    
+    def _stop_listener(self):
+        """Flush queued records to disk and stop the background listener"""
+        listener = getattr(self, '_listener', None)
+        if listener is not None:
+            self._listener = None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
     
     def get_logger(self, logger_name):
         """Get a specific logger by name"""
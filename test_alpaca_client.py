@@ -23,7 +23,9 @@ from alpaca_trading_client import (
     OrderSide, 
     OrderType, 
     TimeInForce,
-    RateLimitTracker
+    RateLimitTracker,
+    STOP_LOSS_TEMPLATE,
+    HTTP_RETRIES
 )
 
 class TestAlpacaCredentials:
@@ -48,6 +50,15 @@ class TestAlpacaCredentials:
         
         assert paper_creds.mode.value == "paper"
         assert live_creds.mode.value == "live"
+    
+    def test_credentials_are_frozen_and_hashable(self):
+        """Test credentials cannot be mutated and can key a dict"""
+        creds = AlpacaCredentials("key", "secret", TradingMode.PAPER)
+        
+        with pytest.raises(AttributeError):
+            creds.secret_key = "other"
+        
+        assert {creds: "session"}[AlpacaCredentials("key", "secret", TradingMode.PAPER)] == "session"
 
 
 class TestRateLimitTracker:
@@ -170,6 +181,43 @@ class TestAlpacaTradingClientAuthentication:
         with pytest.raises(ConnectionError, match="Invalid Alpaca credentials"):
             AlpacaTradingClient(self.paper_creds)
     
+    @patch('alpaca_trading_client.requests.Session')
+    def test_lazy_validation_defers_account_check(self, mock_session_class):
+        """Test lazy clients validate on their first request instead of in __init__"""
+        mock_session = Mock()
+        account_response = Mock(ok=True)
+        account_response.json.return_value = {'id': 'test_account_id', 'status': 'ACTIVE'}
+        positions_response = Mock(ok=True)
+        positions_response.json.return_value = []
+        mock_session.get.side_effect = [account_response, positions_response]
+        mock_session_class.return_value = mock_session
+        
+        client = AlpacaTradingClient(self.paper_creds, lazy_validation=True)
+        assert mock_session.get.call_count == 0
+        
+        assert client.get_positions() == []
+        assert mock_session.get.call_count == 2
+        
+        # The validation fetch is reused as the first account read
+        assert client.get_account()['id'] == 'test_account_id'
+        assert mock_session.get.call_count == 2
+    
+    @patch('alpaca_trading_client.requests.Session')
+    def test_lazy_validation_failure_raises_on_first_request(self, mock_session_class):
+        """Test lazy clients surface invalid credentials on first use"""
+        mock_session = Mock()
+        mock_response = Mock(ok=False, status_code=401)
+        mock_response.json.return_value = {"message": "Invalid credentials"}
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        client = AlpacaTradingClient(self.paper_creds, lazy_validation=True)
+        
+        with pytest.raises(ConnectionError, match="Invalid Alpaca credentials"):
+            client.get_positions()
+        with pytest.raises(ConnectionError, match="Invalid Alpaca credentials"):
+            client.validate_now()
+    
     @patch('alpaca_trading_client.requests.Session')
     def test_mode_switching(self, mock_session_class):
         """Test switching between paper and live trading modes"""
@@ -196,6 +244,25 @@ class TestAlpacaTradingClientAuthentication:
         }
         mock_session.headers.update.assert_called_with(expected_headers)
     
+    @patch('alpaca_trading_client.requests.Session')
+    def test_switching_back_skips_revalidation(self, mock_session_class):
+        """Test switching to previously validated credentials makes no account request"""
+        mock_session = Mock()
+        mock_response = Mock(ok=True)
+        mock_response.json.return_value = {'id': 'test_id', 'status': 'ACTIVE'}
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        client = AlpacaTradingClient(self.paper_creds)
+        client.switch_mode(self.live_creds)
+        assert mock_session.get.call_count == 2
+        
+        client.switch_mode(self.paper_creds)
+        client.switch_mode(self.live_creds)
+        assert mock_session.get.call_count == 2
+        assert client.credentials.mode == TradingMode.LIVE
+        assert "api.alpaca.markets" in client._bases["trading"]
+    
     def test_base_url_selection(self):
         """Test that correct base URLs are selected for each mode"""
         with patch('alpaca_trading_client.requests.Session'):
@@ -328,6 +395,92 @@ class TestAlpacaTradingClientRetryLogic:
         for expected, actual in zip(expected_delays, actual_delays):
             assert abs(actual - expected) < 0.01
     
+    @patch('time.sleep')
+    def test_429_retries_after_server_delay(self, mock_sleep):
+        """Test 429s are retried (even for POST) after the Retry-After delay"""
+        throttled = Mock(ok=False, status_code=429, headers={'Retry-After': '2'})
+        throttled.json.return_value = {"message": "too many requests"}
+        accepted = Mock(ok=True)
+        accepted.json.return_value = {"id": "order_1"}
+        self.mock_session.post.side_effect = [throttled, accepted]
+        
+        result = self.client._make_request("v2/orders", method="POST", data={"symbol": "AAPL"})
+        
+        assert result == {"id": "order_1"}
+        mock_sleep.assert_called_once_with(2.0)
+        self.client.rate_tracker.penalize.assert_called_once_with(2.0)
+    
+    def test_post_server_error_not_retried(self):
+        """Test order submissions are not resent after a 5xx response"""
+        mock_response = Mock(ok=False, status_code=503)
+        mock_response.json.return_value = {"message": "Service Unavailable"}
+        self.mock_session.post.return_value = mock_response
+        
+        with pytest.raises(RuntimeError, match="Alpaca API error \\(503\\)"):
+            self.client._make_request("v2/orders", method="POST", data={"symbol": "AAPL"})
+        
+        assert self.mock_session.post.call_count == 1
+    
+    @patch('time.sleep')
+    def test_close_position_not_resent_after_server_error(self, mock_sleep):
+        """Test position closes are not resent after a 5xx or network failure, but are after a 429"""
+        failed = Mock(ok=False, status_code=502)
+        failed.json.return_value = {"message": "Bad Gateway"}
+        self.mock_session.delete.return_value = failed
+        
+        with pytest.raises(RuntimeError, match="Alpaca API error \\(502\\)"):
+            self.client.close_position("AAPL", qty="5")
+        assert self.mock_session.delete.call_count == 1
+        
+        self.mock_session.delete.reset_mock()
+        self.mock_session.delete.return_value = None
+        self.mock_session.delete.side_effect = requests.exceptions.ReadTimeout("read timed out")
+        with pytest.raises(ConnectionError):
+            self.client.close_all_positions()
+        assert self.mock_session.delete.call_count == 1
+        
+        throttled = Mock(ok=False, status_code=429, headers={'Retry-After': '1'})
+        closed = Mock(ok=True)
+        closed.json.return_value = {"id": "order_1"}
+        self.mock_session.delete.reset_mock()
+        self.mock_session.delete.side_effect = [throttled, closed]
+        assert self.client.close_position("AAPL") == {"id": "order_1"}
+        assert self.mock_session.delete.call_count == 2
+    
+    @patch('time.sleep')
+    def test_dropped_keepalive_connection_retried_for_idempotent_requests(self, mock_sleep):
+        """Test a dropped pooled connection is resent for a GET but not for a position close"""
+        from http.client import RemoteDisconnected
+        from urllib3.exceptions import ProtocolError
+        
+        def dropped():
+            return requests.exceptions.ConnectionError(
+                ProtocolError("Connection aborted.", RemoteDisconnected("Remote end closed connection")))
+        
+        success_response = Mock(ok=True)
+        success_response.json.return_value = {"status": "success"}
+        self.mock_session.get.side_effect = [dropped(), success_response]
+        assert self.client._make_request("test/endpoint") == {"status": "success"}
+        assert self.mock_session.get.call_count == 2
+        
+        self.mock_session.delete.side_effect = dropped()
+        with pytest.raises(ConnectionError):
+            self.client.close_position("AAPL", qty="5")
+        assert self.mock_session.delete.call_count == 1
+    
+    @patch('time.sleep')
+    def test_transport_retried_errors_not_retried_again(self, mock_sleep):
+        """Test connection failures the transport already retried are not multiplied by the loop"""
+        from urllib3.exceptions import MaxRetryError
+        exhausted = requests.exceptions.ConnectionError(MaxRetryError(None, "/test/endpoint"))
+        self.mock_session.get.side_effect = exhausted
+        
+        with pytest.raises(ConnectionError, match="Request failed after 1 attempts"):
+            self.client._make_request("test/endpoint")
+        
+        assert self.mock_session.get.call_count == 1
+        mock_sleep.assert_not_called()
+    
     def test_non_retryable_error_no_retry(self):
         """Test that non-retryable errors don't trigger retry logic"""
         # Mock 404 error (not retryable)
@@ -361,6 +514,18 @@ class TestAlpacaTradingClientRetryLogic:
         
         # Should sleep 2 times (between retries)
         assert mock_sleep.call_count == 2
+    
+    def test_transport_retries_only_connection_failures(self):
+        """Test the session transport never resends a request that may have reached the server"""
+        from urllib3.exceptions import NewConnectionError, ReadTimeoutError
+        
+        with pytest.raises(ReadTimeoutError):
+            HTTP_RETRIES.increment("DELETE", "/v2/positions/AAPL",
+                                   error=ReadTimeoutError(None, "/v2/positions/AAPL", "read timed out"))
+        assert not HTTP_RETRIES.is_retry("DELETE", 503, has_retry_after=True)
+        
+        retried = HTTP_RETRIES.increment("POST", "/v2/orders", error=NewConnectionError(None, "refused"))
+        assert retried.connect == HTTP_RETRIES.connect - 1
 
 
 class TestAlpacaTradingClientRateLimiting:
@@ -525,6 +690,50 @@ class TestAlpacaTradingClientAPIFunctions:
         assert request_data['side'] == 'buy'
         assert request_data['type'] == 'market'
     
+    def test_place_order_with_template(self):
+        """Test place_order merges a pre-serialized template"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {'id': 'order_456'}
+        self.mock_session.post.return_value = mock_response
+        
+        self.client.place_order(
+            symbol="AAPL",
+            qty="10",
+            template=STOP_LOSS_TEMPLATE,
+            stop_price="95.00"
+        )
+        
+        request_data = self.mock_session.post.call_args[1]['json']
+        assert request_data == {
+            'side': 'sell',
+            'type': 'stop',
+            'time_in_force': 'gtc',
+            'symbol': 'AAPL',
+            'qty': '10',
+            'stop_price': '95.00'
+        }
+        assert STOP_LOSS_TEMPLATE == {'side': 'sell', 'type': 'stop', 'time_in_force': 'gtc'}
+    
+    def test_place_order_accepts_string_fields(self):
+        """Test place_order takes plain API strings and rejects unknown ones"""
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {'id': 'order_789'}
+        self.mock_session.post.return_value = mock_response
+        
+        self.client.place_order(symbol="AAPL", qty="1", side="sell", order_type="limit",
+                                time_in_force="gtc", limit_price="10.00")
+        
+        request_data = self.mock_session.post.call_args[1]['json']
+        assert request_data == {
+            'symbol': 'AAPL', 'side': 'sell', 'type': 'limit',
+            'time_in_force': 'gtc', 'qty': '1', 'limit_price': '10.00'
+        }
+        
+        with pytest.raises(ValueError, match="Invalid side"):
+            self.client.place_order(symbol="AAPL", qty="1", side="short")
+    
     def test_place_order_validation_error(self):
         """Test place_order raises error when neither qty nor notional provided"""
         with pytest.raises(ValueError, match="Either qty or notional must be specified"):
@@ -567,6 +776,205 @@ class TestAlpacaTradingClientAPIFunctions:
         assert params['start'] == '2023-01-01'
         assert params['end'] == '2023-01-31'
         assert params['limit'] == 100
+    
+    def test_get_bars_multi_follows_pages_and_trims(self):
+        """Test batched bars merge paginated responses and keep the last N per symbol"""
+        page_1 = Mock(ok=True)
+        page_1.json.return_value = {
+            'bars': {'AAPL': [{'c': 1.0}, {'c': 2.0}], 'MSFT': [{'c': 10.0}]},
+            'next_page_token': 'abc'
+        }
+        page_2 = Mock(ok=True)
+        page_2.json.return_value = {
+            'bars': {'MSFT': [{'c': 11.0}, {'c': 12.0}]},
+            'next_page_token': None
+        }
+        self.mock_session.get.side_effect = [page_1, page_2]
+        
+        result = self.client.get_bars_multi(["AAPL", "MSFT", "NVDA"], timeframe="1Day", limit=2)
+        
+        assert result == {
+            'AAPL': [{'c': 1.0}, {'c': 2.0}],
+            'MSFT': [{'c': 11.0}, {'c': 12.0}],
+            'NVDA': []
+        }
+        first_params = self.mock_session.get.call_args_list[0][1]['params']
+        assert first_params['symbols'] == 'AAPL,MSFT,NVDA'
+        assert self.mock_session.get.call_args_list[1][1]['params']['page_token'] == 'abc'
+    
+    def test_make_request_decodes_raw_body(self):
+        """Test responses carrying a raw JSON body decode to plain Python objects"""
+        mock_response = Mock(ok=True)
+        mock_response.content = b'{"id": "acct_1", "cash": "1000.50", "flags": [1, 2]}'
+        mock_response.json.side_effect = lambda: json.loads(mock_response.content)
+        self.mock_session.get.return_value = mock_response
+        
+        result = self.client.get_account()
+        
+        assert result == {"id": "acct_1", "cash": "1000.50", "flags": [1, 2]}
+    
+    def test_get_account_is_cached_until_order_placed(self):
+        """Test account reads within the TTL share one request and orders invalidate it"""
+        account_response = Mock(ok=True)
+        account_response.json.return_value = {'id': 'acct_1', 'cash': '1000'}
+        self.mock_session.get.return_value = account_response
+        order_response = Mock(ok=True)
+        order_response.json.return_value = {'id': 'order_1'}
+        self.mock_session.post.return_value = order_response
+        
+        self.client.get_account()
+        self.client.get_account()
+        assert self.mock_session.get.call_count == 1
+        
+        self.client.buy_market("AAPL", "1")
+        self.client.get_account()
+        assert self.mock_session.get.call_count == 2
+
+    def test_account_read_during_order_not_cached(self):
+        """Test an account read while an order is in flight does not outlive the order"""
+        before = Mock(ok=True)
+        before.json.return_value = {'id': 'acct_1', 'cash': '1000'}
+        after = Mock(ok=True)
+        after.json.return_value = {'id': 'acct_1', 'cash': '900'}
+        self.mock_session.get.side_effect = [before, after]
+
+        def submit_order(*args, **kwargs):
+            # Another thread reads the account while the POST is in flight
+            assert self.client.get_account()['cash'] == '1000'
+            response = Mock(ok=True)
+            response.json.return_value = {'id': 'order_1'}
+            return response
+        self.mock_session.post.side_effect = submit_order
+
+        self.client.buy_market("AAPL", "1")
+
+        assert self.client.get_account()['cash'] == '900'
+        assert self.mock_session.get.call_count == 2
+
+    def test_close_position_sends_qty_as_query(self):
+        """Test partial closes pass qty as a query parameter and full closes send nothing"""
+        mock_response = Mock(ok=True)
+        mock_response.json.return_value = {'id': 'order_1'}
+        self.mock_session.delete.return_value = mock_response
+        
+        self.client.close_position("AAPL", qty="5")
+        self.client.close_position("AAPL")
+        
+        partial, full = self.mock_session.delete.call_args_list
+        assert partial[1]['params'] == {'qty': '5'}
+        assert full[1]['params'] is None
+    
+    def test_get_bars_stream_yields_bars_page_by_page(self):
+        """Test get_bars_stream follows page tokens and tags each bar with its symbol"""
+        page_1 = Mock(ok=True)
+        page_1.json.return_value = {'bars': {'AAPL': [{'c': 1.0}]}, 'next_page_token': 'abc'}
+        page_2 = Mock(ok=True)
+        page_2.json.return_value = {'bars': {'MSFT': [{'c': 2.0}]}, 'next_page_token': None}
+        self.mock_session.get.side_effect = [page_1, page_2]
+        
+        stream = self.client.get_bars_stream(["AAPL", "MSFT"], page_size=1)
+        
+        assert next(stream) == {'c': 1.0, 'S': 'AAPL'}
+        assert self.mock_session.get.call_count == 1
+        assert list(stream) == [{'c': 2.0, 'S': 'MSFT'}]
+        assert self.mock_session.get.call_args_list[1][1]['params']['page_token'] == 'abc'
+    
+    def test_is_market_open_uses_cached_schedule(self):
+        """Test is_market_open answers from today's calendar and asks the clock near the open"""
+        import alpaca_trading_client
+        from datetime import datetime as real_datetime
+        tz = alpaca_trading_client.MARKET_TIMEZONE
+        calendar = Mock(ok=True)
+        calendar.json.return_value = [{'date': '2026-03-02', 'open': '09:30', 'close': '16:00'}]
+        clock = Mock(ok=True)
+        clock.json.return_value = {'is_open': True}
+        self.mock_session.get.side_effect = [calendar, clock]
+        
+        moments = [real_datetime(2026, 3, 2, 12, 0, tzinfo=tz),
+                   real_datetime(2026, 3, 2, 17, 0, tzinfo=tz),
+                   real_datetime(2026, 3, 2, 9, 30, 20, tzinfo=tz)]
+        with patch('alpaca_trading_client.datetime') as mock_datetime:
+            mock_datetime.combine = real_datetime.combine
+            mock_datetime.strptime = real_datetime.strptime
+            mock_datetime.now.side_effect = lambda tz=None: moments.pop(0)
+            
+            assert self.client.is_market_open() is True
+            assert self.client.is_market_open() is False
+            assert self.mock_session.get.call_count == 1
+            
+            # Within a minute of the open the clock endpoint decides
+            assert self.client.is_market_open() is True
+            assert self.mock_session.get.call_count == 2
+    
+    def test_get_latest_quote_chunks_symbol_lists(self):
+        """Test a symbol list is split per request limit and merged under 'quotes'"""
+        def quote_response(url, params=None, timeout=None):
+            response = Mock(ok=True)
+            response.json.return_value = {'quotes': {s: {'bp': 1.0} for s in params['symbols'].split(',')}}
+            return response
+        self.mock_session.get.side_effect = quote_response
+        symbols = [f"S{i}" for i in range(250)]
+        
+        result = self.client.get_latest_quote(symbols)
+        
+        assert set(result) == {'quotes'}
+        assert set(result['quotes']) == set(symbols)
+        chunk_sizes = sorted(len(call[1]['params']['symbols'].split(','))
+                             for call in self.mock_session.get.call_args_list)
+        assert chunk_sizes == [50, 200]
+    
+    def test_get_bars_reuses_body_on_not_modified(self):
+        """Test get_bars sends If-None-Match and returns the stored body on 304"""
+        fresh = Mock(ok=True, status_code=200, headers={'ETag': '"v1"'})
+        fresh.json.return_value = {'bars': {'AAPL': [{'c': 1.0}]}}
+        not_modified = Mock(ok=True, status_code=304, headers={})
+        self.mock_session.get.side_effect = [fresh, not_modified]
+        
+        first = self.client.get_bars("AAPL", timeframe="1Day", limit=1)
+        second = self.client.get_bars("AAPL", timeframe="1Day", limit=1)
+        
+        assert second == first == {'bars': {'AAPL': [{'c': 1.0}]}}
+        assert 'headers' not in self.mock_session.get.call_args_list[0][1]
+        assert self.mock_session.get.call_args_list[1][1]['headers'] == {'If-None-Match': '"v1"'}
+        not_modified.json.assert_not_called()
+    
+    def test_async_client_gathers_requests(self):
+        """Test the async wrapper runs client methods as awaitable coroutines"""
+        import asyncio
+        from alpaca_async_client import AsyncAlpacaTradingClient
+        
+        def quote_response(url, params=None, timeout=None):
+            response = Mock(ok=True)
+            response.json.return_value = {'quotes': {params['symbols']: {'bp': 1.0}}}
+            return response
+        self.mock_session.get.side_effect = quote_response
+        
+        aclient = AsyncAlpacaTradingClient(self.client, max_in_flight=2)
+        
+        async def fetch_all():
+            return await asyncio.gather(*(aclient.get_latest_quote(s) for s in ("AAPL", "MSFT", "SPY")))
+        
+        results = asyncio.run(fetch_all())
+        
+        assert [list(r['quotes']) for r in results] == [['AAPL'], ['MSFT'], ['SPY']]
+        assert self.mock_session.get.call_count == 3
+        assert aclient.credentials is self.client.credentials
+    
+    @patch('alpaca_trading_client.time.sleep')
+    def test_wait_for_order_polls_until_final_status(self, mock_sleep):
+        """Test wait_for_order stops polling once the order is filled"""
+        pending = Mock(ok=True)
+        pending.json.return_value = {'id': 'order_123', 'status': 'accepted'}
+        filled = Mock(ok=True)
+        filled.json.return_value = {'id': 'order_123', 'status': 'filled'}
+        self.mock_session.get.side_effect = [pending, pending, filled]
+        
+        result = self.client.wait_for_order('order_123')
+        
+        assert result['status'] == 'filled'
+        assert self.mock_session.get.call_count == 3
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert delays == [0.25, 0.5]
 
 
 class TestAlpacaTradingClientErrorHandling:
@@ -598,7 +1006,8 @@ class TestAlpacaTradingClientErrorHandling:
         # Should return text response when JSON parsing fails
         assert result == {"status": "success", "data": "Non-JSON response text"}
     
-    def test_timeout_handling(self):
+    @patch('time.sleep')
+    def test_timeout_handling(self, mock_sleep):
         """Test handling of request timeouts"""
         timeout_error = requests.exceptions.Timeout("Request timed out")
         self.mock_session.get.side_effect = timeout_error
@@ -606,13 +1015,17 @@ class TestAlpacaTradingClientErrorHandling:
         with pytest.raises(ConnectionError, match="Request failed after"):
             self.client._make_request("test/endpoint")
     
-    def test_connection_error_handling(self):
+    @patch('time.sleep')
+    def test_connection_error_handling(self, mock_sleep):
         """Test handling of connection errors"""
         connection_error = requests.exceptions.ConnectionError("DNS lookup failed")
         self.mock_session.get.side_effect = connection_error
         
-        with pytest.raises(ConnectionError, match="Request failed after"):
+        with pytest.raises(ConnectionError, match="Request failed after") as exc_info:
             self.client._make_request("test/endpoint")
+        
+        # The transport error is kept as the cause for debugging
+        assert exc_info.value.__cause__ is connection_error
     
     def test_unsupported_http_method(self):
         """Test error for unsupported HTTP methods"""
@@ -3,7 +3,9 @@
 Unit tests for critical trading system components (using built-in unittest only)
 """
 
+import json
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
@@ -14,9 +16,12 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 try:
     from api_schemas import (
         validate_account_schema, validate_position_schema, 
-        SchemaValidationError, safe_get
+        SchemaValidationError, validate_order_schema, safe_get, safe_get_float, safe_get_int, decode_api_bytes, AccountModel,
+        validate_bar_schema, validate_cached_bar, validate_bars_response,
+        validate_api_response, PositionModel, OrderModel, BarsResponseModel, validate_with_error_collection, model_to_dict, model_to_json,
+        MSGSPEC_AVAILABLE
     )
-    from alpaca_config import validate_credentials, get_effective_mode
+    from alpaca_config import validate_credentials, get_effective_mode, get_batch_quotes, is_market_open_now
     from constants import RiskManagement, VolumeAnalysis, TechnicalAnalysis
     
     API_SCHEMAS_AVAILABLE = True
@@ -28,6 +33,13 @@ except ImportError as e:
     ALPACA_CONFIG_AVAILABLE = False
     CONSTANTS_AVAILABLE = False
 
+try:
+    from advanced_trading_bot import AdvancedTradingBot
+    TRADING_BOT_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Trading bot not available for testing: {e}")
+    TRADING_BOT_AVAILABLE = False
+
 
 class TestApiSchemas(unittest.TestCase):
     """Test API schema validation"""
@@ -50,6 +62,31 @@ class TestApiSchemas(unittest.TestCase):
         self.assertEqual(result['account_number'], 'ABCD1234')
         self.assertEqual(result['status'], 'ACTIVE')
     
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_validate_schema_memoizes_identical_payloads(self):
+        """Test repeated identical payloads reuse the validated model"""
+        position = {'asset_id': 'abc123', 'symbol': 'AAPL', 'asset_class': 'us_equity', 'qty': '100'}
+        first = validate_position_schema(position)
+        self.assertIs(validate_position_schema(dict(position)), first)
+        self.assertIsNot(validate_position_schema({**position, 'qty': '101'}), first)
+
+        # Unhashable nested values fall back to direct validation
+        nested = validate_position_schema({**position, 'extra': ['x']})
+        self.assertEqual(nested.symbol, 'AAPL')
+    
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_validate_order_schema_parses_timestamps(self):
+        """Test order timestamps are parsed to timezone-aware datetimes"""
+        order = validate_order_schema({
+            'id': 'order-1', 'client_order_id': 'client-1', 'asset_id': 'abc123',
+            'symbol': 'AAPL', 'asset_class': 'us_equity', 'filled_qty': '0',
+            'order_class': 'simple', 'order_type': 'market', 'type': 'market',
+            'side': 'buy', 'time_in_force': 'day', 'status': 'new',
+            'created_at': '2024-01-15T10:30:00.123456789Z',
+        })
+        self.assertEqual(order.created_at, datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc))
+        self.assertIsNone(order.filled_at)
+    
     @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
     def test_validate_account_schema_missing_required_field(self):
         """Test account schema validation with missing required field"""
@@ -64,6 +101,111 @@ class TestApiSchemas(unittest.TestCase):
         
         self.assertIn("Required field 'id' missing", str(context.exception))
     
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_decode_api_bytes_coerces_numeric_strings(self):
+        """Test raw response bytes decode straight to a validated account"""
+        raw = (b'{"id": "12345", "account_number": "ABCD1234", "status": "ACTIVE", '
+               b'"buying_power": "50000.00", "cash": "25000.00", "portfolio_value": "75000.00"}')
+        result = decode_api_bytes(AccountModel, raw)
+        self.assertEqual(result['id'], '12345')
+        self.assertEqual(result.buying_power, 50000.0)
+
+        with self.assertRaises(SchemaValidationError):
+            decode_api_bytes(AccountModel, b'{"id": "12345"}')
+        with self.assertRaises(SchemaValidationError):
+            decode_api_bytes(AccountModel, b'not json')
+
+        bars = decode_api_bytes(BarsResponseModel, b'{"bars": {"AAPL": [{"t": "2024-01-15T10:30:00Z", '
+                                                   b'"o": "150.25", "h": "152.80", "l": "149.90", "c": "151.50", "v": "1000"}]}}')
+        self.assertEqual(bars.bars['AAPL'][0].c, 151.5)
+    
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE and MSGSPEC_AVAILABLE, "msgspec not installed")
+    def test_decode_api_bytes_msgspec_returns_model(self):
+        """Test the msgspec decode path returns the same model as Pydantic validation"""
+        raw = (b'{"id": "12345", "account_number": "ABCD1234", "status": "ACTIVE", '
+               b'"buying_power": "50000.00", "cash": "25000.00", "portfolio_value": "75000.00", "extra": 1}')
+        result = decode_api_bytes(AccountModel, raw)
+        expected = AccountModel.model_validate_json(raw)
+        self.assertIsInstance(result, AccountModel)
+        self.assertEqual(model_to_dict(result), model_to_dict(expected))
+        self.assertEqual(json.loads(model_to_json(result)), json.loads(model_to_json(expected)))
+        
+        order = decode_api_bytes(OrderModel, json.dumps({
+            'id': 'order-1', 'client_order_id': 'client-1', 'asset_id': 'abc123',
+            'symbol': 'AAPL', 'asset_class': 'us_equity', 'filled_qty': '0',
+            'order_class': 'simple', 'order_type': 'market', 'type': 'market',
+            'side': 'buy', 'time_in_force': 'day', 'status': 'new',
+            'created_at': '2024-01-15T10:30:00Z',
+        }).encode())
+        self.assertIsInstance(order, OrderModel)
+        self.assertEqual(order.created_at, datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc))
+    
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_validate_cached_bar_matches_full_validation(self):
+        """Test trusted cached bars expose the same values as validated ones"""
+        bar = validate_bar_schema({'t': '2024-01-15T10:30:00Z', 'o': '150.25', 'h': '152.80',
+                                   'l': '149.90', 'c': '151.50', 'v': '1000000'})
+        cached = validate_cached_bar(bar.unwrap().model_dump())
+        self.assertEqual(cached.unwrap(), bar.unwrap())
+        self.assertEqual(cached['c'], 151.5)
+        self.assertEqual(cached.v, 1000000)
+
+        raw = validate_cached_bar({'t': '2024-01-15T10:30:00Z', 'o': '150.25', 'h': '152.80',
+                                   'l': '149.90', 'c': '151.50', 'v': '1000000'})
+        self.assertEqual(raw.unwrap(), bar.unwrap())
+    
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_validate_bars_response_validates_nested_bars(self):
+        """Test bars responses validate every bar and reject malformed ones"""
+        bar = {'t': '2024-01-15T10:30:00Z', 'o': '150.25', 'h': '152.80',
+               'l': '149.90', 'c': '151.50', 'v': '1000000'}
+        result = validate_bars_response({'bars': {'AAPL': [bar, bar]}, 'next_page_token': None})
+        self.assertEqual(len(result['bars']['AAPL']), 2)
+        self.assertEqual(result.bars['AAPL'][0].c, 151.5)
+
+        with self.assertRaises(SchemaValidationError):
+            validate_bars_response({'bars': {'AAPL': [{'t': '2024-01-15T10:30:00Z'}]}})
+        with self.assertRaises(SchemaValidationError):
+            validate_bars_response({'bars': {'AAPL': 'not-a-list'}})
+    
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_validate_api_response_dispatches_by_endpoint(self):
+        """Test endpoints resolve to the matching schema, including list endpoints"""
+        position = {'asset_id': 'abc123', 'symbol': 'AAPL', 'asset_class': 'us_equity', 'qty': '100'}
+        self.assertIsInstance(validate_api_response('/v2/positions/AAPL', position), PositionModel)
+
+        positions = validate_api_response('/v2/positions', [position, position])
+        self.assertEqual([p.symbol for p in positions], ['AAPL', 'AAPL'])
+
+        with self.assertRaises(SchemaValidationError) as context:
+            validate_api_response('/v2/positions', [position, {'symbol': 'MSFT'}])
+        self.assertIn("Position 1 validation failed", str(context.exception))
+
+        unknown = {'foo': 'bar'}
+        self.assertIs(validate_api_response('v2/clock', unknown), unknown)
+    
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_model_to_dict_and_json_exclude_none(self):
+        """Test model serialization helpers drop unset optional fields"""
+        position = validate_position_schema({'asset_id': 'abc123', 'symbol': 'AAPL',
+                                             'asset_class': 'us_equity', 'qty': '100'})
+        as_dict = model_to_dict(position)
+        self.assertEqual(as_dict['qty'], 100.0)
+        self.assertNotIn('market_value', as_dict)
+        self.assertIn('market_value', model_to_dict(position, exclude_none=False))
+        self.assertEqual(json.loads(model_to_json(position)), as_dict)
+    
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_validate_with_error_collection_keeps_going(self):
+        """Test invalid items are reported by index without stopping the batch"""
+        position = {'asset_id': 'abc123', 'symbol': 'AAPL', 'asset_class': 'us_equity', 'qty': '100'}
+        items = [position, {'symbol': 'MSFT'}, 'not-a-dict', {**position, 'symbol': 'TSLA'}]
+        validated, errors = validate_with_error_collection(items, PositionModel)
+        self.assertEqual([p.symbol for p in validated], ['AAPL', 'TSLA'])
+        self.assertEqual([e['index'] for e in errors], [1, 2])
+        self.assertIs(errors[1]['data'], items[2])
+        self.assertIn("PositionModel", errors[0]['error'])
+    
     @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
     def test_safe_get_with_valid_key(self):
         """Test safe_get function with valid key"""
@@ -71,6 +213,15 @@ class TestApiSchemas(unittest.TestCase):
         result = safe_get(data, 'price', 0.0, float)
         self.assertEqual(result, 123.45)
     
+    @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
+    def test_safe_get_float_and_int_match_safe_get(self):
+        """Test the typed fast paths agree with safe_get"""
+        data = {'price': '123.45', 'volume': '1000', 'bad': 'n/a', 'none': None, 'native': 7.5}
+        for key in ('price', 'bad', 'none', 'missing', 'native'):
+            self.assertEqual(safe_get_float(data, key), safe_get(data, key, 0.0, float))
+        for key in ('volume', 'bad', 'none', 'missing'):
+            self.assertEqual(safe_get_int(data, key, -1), safe_get(data, key, -1, int))
+    
     @unittest.skipUnless(API_SCHEMAS_AVAILABLE, "API schemas module not available")
     def test_safe_get_with_missing_key(self):
         """Test safe_get function with missing key returns default"""
@@ -129,6 +280,35 @@ class TestCredentialValidation(unittest.TestCase):
         self.assertEqual(str(mode.value), "live")
 
 
+    @unittest.skipUnless(ALPACA_CONFIG_AVAILABLE, "Alpaca config module not available")
+    def test_get_batch_quotes_chunks_symbols(self):
+        """Test batch quotes go through the client's chunked get_latest_quote"""
+        symbols = [f"S{i}" for i in range(450)]
+        client = Mock()
+        client.get_latest_quote.side_effect = lambda requested: {
+            'quotes': {symbol: {'bp': 1.0} for symbol in requested}
+        }
+        
+        quotes = get_batch_quotes(iter(symbols), client)
+        
+        client.get_latest_quote.assert_called_once_with(symbols)
+        self.assertEqual(set(quotes), set(symbols))
+
+    @unittest.skipUnless(ALPACA_CONFIG_AVAILABLE, "Alpaca config module not available")
+    def test_is_market_open_now_defers_to_client_in_hours(self):
+        """Test off-hours checks answer locally and in-hours checks use the client's calendar"""
+        client = Mock()
+        client.is_market_open.return_value = False
+        
+        with patch('alpaca_config.is_market_open_local', return_value=False):
+            self.assertFalse(is_market_open_now(client))
+        client.is_market_open.assert_not_called()
+        
+        with patch('alpaca_config.is_market_open_local', return_value=True):
+            self.assertFalse(is_market_open_now(client))
+        client.is_market_open.assert_called_once_with()
+
+
 class TestTechnicalIndicatorMath(unittest.TestCase):
     """Test mathematical correctness of technical indicators"""
     
@@ -165,6 +345,129 @@ class TestTechnicalIndicatorMath(unittest.TestCase):
         self.assertEqual(calculated_ratio, 1.5)
 
 
+@unittest.skipUnless(TRADING_BOT_AVAILABLE, "Trading bot module not available")
+class TestAdvancedBotIndicators(unittest.TestCase):
+    """Test vectorized indicator helpers on AdvancedTradingBot"""
+    
+    def setUp(self):
+        self.prices = [100, 102, 101, 103, 105, 104, 106, 108, 107, 109, 111, 110, 112, 114, 113, 112]
+        self.bot = Mock()
+        self.bot.calculate_rsi = AdvancedTradingBot.calculate_rsi.__get__(self.bot)
+    
+    def test_rsi_matches_reference_calculation(self):
+        """Test RSI against the simple-average reference formula"""
+        deltas = [self.prices[i] - self.prices[i-1] for i in range(1, len(self.prices))]
+        avg_gain = sum(d for d in deltas[-14:] if d > 0) / 14
+        avg_loss = sum(-d for d in deltas[-14:] if d < 0) / 14
+        expected = 100 - (100 / (1 + avg_gain / avg_loss))
+        
+        self.assertAlmostEqual(self.bot.calculate_rsi(self.prices, 14), expected, places=6)
+    
+    def test_rsi_accepts_ndarray_and_edge_cases(self):
+        """Test RSI with ndarray input, no losses, and insufficient data"""
+        import numpy as np
+        self.assertAlmostEqual(
+            self.bot.calculate_rsi(np.asarray(self.prices, dtype=np.float64)),
+            self.bot.calculate_rsi(self.prices)
+        )
+        self.assertEqual(self.bot.calculate_rsi(list(range(20))), 100)
+        self.assertEqual(self.bot.calculate_rsi(self.prices[:5]), 50)
+    
+    def test_rolling_smas_match_full_recompute(self):
+        """Test incremental SMAs stay equal to a full re-sum as bars roll forward"""
+        import numpy as np
+        self.bot._sma_state = {}
+        self.bot._rolling_smas = AdvancedTradingBot._rolling_smas.__get__(self.bot)
+        history = [100 + (i * 7) % 13 for i in range(80)]
+        
+        for end in range(10, 80):
+            # Each bar is first scanned mid-session with a partial close, then
+            # settles to its final close by the time the next bar is scanned
+            final = history[max(0, end - 50):end]
+            partial = final[:-1] + [final[-1] - 0.75]
+            for window in (partial, final[:-1] + [final[-1] - 0.25]):
+                smas = self.bot._rolling_smas("TEST", np.asarray(window, dtype=np.float64), [end - 2, end - 1])
+                for period, value in smas.items():
+                    expected = sum(window[-period:]) / period if len(window) >= period else window[-1]
+                    self.assertAlmostEqual(value, expected, places=9)
+
+    def test_indicator_state_save_merges_symbols(self):
+        """Test bots sharing the state file keep each other's symbols"""
+        import tempfile
+        from pathlib import Path
+        from indicator_state import load_indicator_state, save_indicator_state
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch('indicator_state._state_file', return_value=Path(tmp) / "indicator_state.json"):
+                save_indicator_state({"AAA": {'t': 1, 'windows': {}}})
+                save_indicator_state({"BBB": {'t': 2, 'windows': {}}})
+                save_indicator_state({"AAA": {'t': 3, 'windows': {}}})
+                state = load_indicator_state()
+
+        self.assertEqual(state, {"AAA": {'t': 3, 'windows': {}}, "BBB": {'t': 2, 'windows': {}}})
+
+    def test_watchlist_batch_matches_per_symbol(self):
+        """Test the batched watchlist pass agrees with per-symbol market data"""
+        def make_bars(count, step):
+            return [
+                {'c': 100 + ((i * step) % 17) - i * 0.1, 'v': 1000 + (i * 37) % 500,
+                 'h': 102 + ((i * step) % 17), 'l': 98 + ((i * step) % 17) - i * 0.2, 't': i}
+                for i in range(count)
+            ]
+
+        bars = {"AAA": make_bars(50, 3), "BBB": make_bars(50, 5), "CCC": make_bars(12, 7), "DDD": []}
+        batch_bot = AdvancedTradingBot.__new__(AdvancedTradingBot)
+        batch_bot._sma_state = {}
+        single_bot = AdvancedTradingBot.__new__(AdvancedTradingBot)
+        single_bot._sma_state = {}
+
+        batch = batch_bot.get_watchlist_market_data(bars)
+        for symbol, bars_data in bars.items():
+            expected = single_bot.get_enhanced_market_data(symbol, bars_data)
+            self.assertEqual(set(batch[symbol]), set(expected))
+            for key, value in expected.items():
+                if isinstance(value, str):
+                    self.assertEqual(batch[symbol][key], value)
+                else:
+                    # The batch stacks bars in single precision
+                    self.assertLessEqual(abs(batch[symbol][key] - value), 1e-4 * max(1.0, abs(value)),
+                                         msg=f"{symbol} {key}")
+
+    def test_same_day_scan_refetches_todays_bar(self):
+        """Test cached bars are reused but today's forming bar is fetched on every scan"""
+        import tempfile
+        from datetime import date, timedelta
+        from pathlib import Path
+
+        today = date.today()
+        history = [
+            {'t': f"{(today - timedelta(days=3 - i)).isoformat()}T04:00:00Z", 'c': 100.0 + i, 'v': 1000, 'h': 105.0, 'l': 95.0}
+            for i in range(3)
+        ]
+        todays_close = [110.0]
+
+        def get_bars_multi(symbols, timeframe="1Day", start=None, end=None, limit=1000):
+            todays_bar = {'t': f"{today.isoformat()}T04:00:00Z", 'c': todays_close[0], 'v': 500, 'h': 111.0, 'l': 99.0}
+            if start == today.isoformat():
+                return {symbol: [dict(todays_bar)] for symbol in symbols}
+            return {symbol: [dict(bar) for bar in history] + [todays_bar] for symbol in symbols}
+
+        bot = AdvancedTradingBot.__new__(AdvancedTradingBot)
+        bot.client = Mock()
+        bot.client.get_bars_multi.side_effect = get_bars_multi
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch('bar_cache._cache_file', return_value=Path(tmp) / "bar_cache.sqlite3"):
+                first = bot.fetch_watchlist_bars(["AAA"])
+                todays_close[0] = 112.5
+                second = bot.fetch_watchlist_bars(["AAA"])
+
+        self.assertEqual(first["AAA"][-1]['c'], 110.0)
+        self.assertEqual(second["AAA"][-1]['c'], 112.5)
+        self.assertEqual([bar['c'] for bar in second["AAA"][:-1]], [bar['c'] for bar in history])
+        self.assertEqual(bot.client.get_bars_multi.call_args.kwargs['start'], today.isoformat())
+
+
 class TestPositionSizingLogic(unittest.TestCase):
     """Test position sizing calculations"""
     